@@ -2,8 +2,10 @@
 토론 API 라우터
 3자 토론 시스템 (User → James → Linda)
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
 from app.models.schemas import (
+    DebaterRole,
     DebateStartRequest,
     DebateStartResponse,
     DebateMessageRequest,
@@ -14,13 +16,75 @@ from app.models.schemas import (
     DebateReportResponse,
     ErrorResponse,
 )
-from app.core.dependencies import get_debate_engine
+from app.core.config import settings
+from app.core.dependencies import get_audio_artifact_store, get_debate_engine, get_voice_service
+from app.core.disconnect import (
+    CLIENT_CLOSED_REQUEST,
+    ClientDisconnected,
+    cancel_on_disconnect,
+    record_disconnect,
+)
+from app.core.sse import SSE_HEADERS, format_sse
+from app.services.audio_artifacts import AudioArtifactStore
 from app.services.debate_engine import DebateEngine
 from app.services.report_store import save_debate_report
+from app.services.speech_pipeline import stream_debate_speech
+from app.services.suggestion_service import SuggestionService, get_suggestion_service
+from app.services.voice_service import VoiceService
 from datetime import datetime
+from typing import Dict, Optional
+import asyncio
+import logging
 import uuid
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+
+def _prefetch_suggestions(
+    request: DebateMessageRequest,
+    debate_engine: DebateEngine,
+    suggestion_service: SuggestionService,
+    james_response: str,
+    linda_response: str,
+):
+    """토론 턴 직후 다음 추천(question/argument)을 백그라운드로 미리 생성"""
+    enabled = request.prefetch_suggestions
+    if enabled is None:
+        enabled = settings.SUGGESTION_PREFETCH_ENABLED
+    if not enabled:
+        return
+    
+    session = debate_engine.get_session(request.session_id)
+    if session is None:
+        return
+    suggestion_service.prefetch(
+        request.session_id,
+        ("question", "argument"),
+        topic=session.topic,
+        user_position=session.user_position,
+        james_last=james_response,
+        linda_last=linda_response,
+        lecture_context=request.lecture_context or session.lecture_context,
+    )
+
+
+def _audio_presynthesizer(enabled: Optional[bool], artifact_store: AudioArtifactStore):
+    """
+    응답 음성 사전 합성 콜백 생성 (debater, text) → audio_url 기록
+
+    비활성화면 (None, {})을 반환합니다.
+    """
+    if enabled is None:
+        enabled = settings.AUDIO_PRESYNTHESIS_ENABLED
+    audio_urls: Dict[str, Optional[str]] = {}
+    if not enabled:
+        return None, audio_urls
+    
+    def presynthesize(debater: str, text: str):
+        audio_urls[debater] = artifact_store.create(text, DebaterRole(debater))
+    
+    return presynthesize, audio_urls
 
 
 @router.post(
@@ -87,13 +151,19 @@ async def start_debate(
 )
 async def send_message(
     request: DebateMessageRequest,
+    http_request: Request,
     debate_engine: DebateEngine = Depends(get_debate_engine),
+    suggestion_service: SuggestionService = Depends(get_suggestion_service),
+    artifact_store: AudioArtifactStore = Depends(get_audio_artifact_store),
 ):
     """
     3자 토론 메시지를 전송하고 AI 응답을 받습니다.
     
     **토론 흐름**: User → James 응답 → Linda 응답 (순차적)
     
+    `parallel=true`(또는 서버 설정 DEBATE_PARALLEL_MODE)이면 James와 Linda 응답을
+    동시에 생성합니다. 이 경우 Linda는 James 응답을 참고하지 않습니다.
+    
     **토큰 계산 로직**:
     - 기본 발언: +10 토큰
     - 50자 이상 논리적 발언: +20 토큰
@@ -102,22 +172,48 @@ async def send_message(
     - **session_id**: 토론 세션 ID
     - **user_message**: 사용자 메시지
     - **lecture_context**: 강의 컨텍스트 (선택)
+    - **parallel**: James/Linda 동시 생성 여부 (선택)
+    - **prefetch_suggestions**: 응답 직후 다음 추천 미리 생성 여부 (선택)
+    - **latency_budget_ms**: 응답 지연 시간 예산 (선택, 모바일 등 fast mode)
+    - **synthesize_audio**: 응답 음성 사전 합성 여부 (선택). 각 응답이 생성되는 즉시 백그라운드 TTS를
+      시작하고 `james_audio_url`/`linda_audio_url`을 반환합니다 (합성 중에도 받은 부분부터 스트리밍).
+    
+    응답이 완료되기 전에 클라이언트 연결이 끊기면 진행 중인 LLM 호출을 취소하고
+    해당 턴은 저장하지 않습니다 (사용자 발언과 토큰 모두 미반영).
     """
+    presynthesize, audio_urls = _audio_presynthesizer(request.synthesize_audio, artifact_store)
     try:
         # 3자 토론 처리: User → James → Linda
-        james_response, linda_response, tokens_earned = await debate_engine.process_message(
-            session_id=request.session_id,
-            user_message=request.user_message,
-            lecture_context=request.lecture_context or "",
+        james_response, linda_response, tokens_earned = await cancel_on_disconnect(
+            http_request,
+            debate_engine.process_message(
+                session_id=request.session_id,
+                user_message=request.user_message,
+                lecture_context=request.lecture_context or "",
+                parallel=request.parallel,
+                latency_budget_ms=request.latency_budget_ms,
+                on_reply=presynthesize,
+            ),
+            "debate_message",
         )
         
+        _prefetch_suggestions(request, debate_engine, suggestion_service, james_response, linda_response)
+        
         return DebateMessageResponse(
             session_id=request.session_id,
             james_response=james_response,
             linda_response=linda_response,
             tokens_earned=tokens_earned,
+            prompt_tokens=debate_engine.get_prompt_tokens(request.session_id),
+            james_audio_url=audio_urls.get("james"),
+            linda_audio_url=audio_urls.get("linda"),
             timestamp=datetime.utcnow(),
         )
+    except ClientDisconnected:
+        # 버려진 턴의 음성 사전 합성도 취소
+        for audio_url in audio_urls.values():
+            artifact_store.discard(audio_url)
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -125,6 +221,166 @@ async def send_message(
         )
 
 
+@router.post(
+    "/message/stream",
+    responses={
+        200: {"content": {"text/event-stream": {}}, "description": "SSE 이벤트 스트림"},
+        500: {"model": ErrorResponse, "description": "서버 에러"},
+    },
+    summary="3자 토론 메시지 스트리밍",
+    description="James와 Linda의 응답을 토큰 단위로 Server-Sent Events 스트림으로 전송합니다.",
+)
+async def send_message_stream(
+    request: DebateMessageRequest,
+    debate_engine: DebateEngine = Depends(get_debate_engine),
+    suggestion_service: SuggestionService = Depends(get_suggestion_service),
+    artifact_store: AudioArtifactStore = Depends(get_audio_artifact_store),
+):
+    """
+    3자 토론 메시지를 전송하고 AI 응답을 SSE로 스트리밍합니다.
+    
+    **이벤트 순서**: `james_delta`* → `james_done` → `linda_delta`* → `linda_done` → `tokens_earned`
+    
+    - `james_delta` / `linda_delta`: `{"delta": "..."}` 토큰 조각
+    - `james_done` / `linda_done`: `{"message": "...", "prompt_tokens": n}` 전체 응답과 추정 프롬프트 토큰 수 (LLM 미사용 시 0).
+      `synthesize_audio` 요청 시 백그라운드 합성이 시작된 음성의 `audio_url` 포함
+    - `tokens_earned`: `{"session_id", "tokens_earned", "total_tokens_earned"}`
+    - `error`: `{"detail": "..."}` 처리 중 오류
+    
+    히스토리와 토론자 메모리는 모든 응답이 완료된 뒤 저장됩니다.
+    스트리밍 모드는 항상 순차 생성(Linda가 James 응답 참고)으로 동작합니다.
+    
+    `tokens_earned` 전에 클라이언트 연결이 끊기면 진행 중인 LLM 스트림을 취소하고
+    해당 턴은 저장하지 않습니다 (이미 전송된 `james_done`도 히스토리에 남지 않음).
+    """
+    presynthesize, audio_urls = _audio_presynthesizer(request.synthesize_audio, artifact_store)
+    
+    async def event_stream():
+        replies = {}
+        events = debate_engine.stream_message(
+            session_id=request.session_id,
+            user_message=request.user_message,
+            lecture_context=request.lecture_context or "",
+            latency_budget_ms=request.latency_budget_ms,
+        )
+        try:
+            async for event, data in events:
+                if event in ("james_done", "linda_done"):
+                    replies[event] = data["message"]
+                    if presynthesize:
+                        debater = event.split("_")[0]
+                        presynthesize(debater, data["message"])
+                        data = {**data, "audio_url": audio_urls.get(debater)}
+                if event == "tokens_earned":
+                    replies[event] = data["tokens_earned"]
+                    data = {"session_id": request.session_id, **data}
+                    _prefetch_suggestions(
+                        request,
+                        debate_engine,
+                        suggestion_service,
+                        replies.get("james_done", ""),
+                        replies.get("linda_done", ""),
+                    )
+                yield format_sse(event, data)
+        except Exception as e:
+            logger.error(f"토론 스트리밍 실패: {e}")
+            yield format_sse("error", {"detail": str(e)})
+        except (asyncio.CancelledError, GeneratorExit):
+            # 클라이언트 연결 끊김 (Starlette가 스트림을 취소하거나 전송 실패 후 종료)
+            if "tokens_earned" not in replies:
+                record_disconnect("debate_message_stream")
+                # 턴이 저장되지 않으므로 시작한 음성 사전 합성도 취소
+                for audio_url in audio_urls.values():
+                    artifact_store.discard(audio_url)
+            raise
+        finally:
+            # 엔진 스트림을 즉시 닫아 LLM 스트림과 세션 잠금을 반환
+            await events.aclose()
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
+@router.post(
+    "/message/speech",
+    responses={
+        200: {"content": {"text/event-stream": {}}, "description": "SSE 이벤트 스트림 (텍스트 + 오디오)"},
+        400: {"model": ErrorResponse, "description": "음성 서비스 미설정"},
+        500: {"model": ErrorResponse, "description": "서버 에러"},
+    },
+    summary="3자 토론 메시지 음성 스트리밍",
+    description="James와 Linda의 응답을 생성하는 동안 완성된 문장부터 음성으로 합성해 텍스트와 함께 SSE로 전송합니다.",
+)
+async def send_message_speech(
+    request: DebateMessageRequest,
+    debate_engine: DebateEngine = Depends(get_debate_engine),
+    voice_service: VoiceService = Depends(get_voice_service),
+    suggestion_service: SuggestionService = Depends(get_suggestion_service),
+):
+    """
+    3자 토론 메시지를 전송하고 응답 텍스트와 음성을 함께 SSE로 스트리밍합니다.
+    
+    `/message/stream`의 이벤트에 더해, 토론자 응답에서 문장이 완성될 때마다
+    바로 TTS를 요청하고 합성이 끝난 순서(토론자별 문장 순서)대로 오디오를 보냅니다.
+    
+    - `james_audio` / `linda_audio`: `{"seq", "text", "audio"}` 문장 하나의 MP3 (base64), seq 순서대로 재생
+    - `james_audio_error` / `linda_audio_error`: `{"seq", "text", "detail"}` 해당 문장 합성 실패
+    - `tokens_earned`: 모든 오디오 전송 후 마지막 이벤트
+    
+    턴은 Linda 응답이 완료되면 저장되며, 그 전에 연결이 끊기면 턴 전체를 버립니다.
+    """
+    if not voice_service.configured:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="음성 서비스가 설정되지 않았습니다.",
+        )
+    
+    async def event_stream():
+        replies = {}
+        events = stream_debate_speech(
+            debate_engine.stream_message(
+                session_id=request.session_id,
+                user_message=request.user_message,
+                lecture_context=request.lecture_context or "",
+                latency_budget_ms=request.latency_budget_ms,
+            ),
+            voice_service,
+        )
+        try:
+            async for event, data in events:
+                if event in ("james_done", "linda_done"):
+                    replies[event] = data["message"]
+                if event == "tokens_earned":
+                    replies[event] = data["tokens_earned"]
+                    data = {"session_id": request.session_id, **data}
+                    _prefetch_suggestions(
+                        request,
+                        debate_engine,
+                        suggestion_service,
+                        replies.get("james_done", ""),
+                        replies.get("linda_done", ""),
+                    )
+                yield format_sse(event, data)
+        except Exception as e:
+            logger.error(f"토론 음성 스트리밍 실패: {e}")
+            yield format_sse("error", {"detail": str(e)})
+        except (asyncio.CancelledError, GeneratorExit):
+            if "tokens_earned" not in replies:
+                record_disconnect("debate_message_speech")
+            raise
+        finally:
+            await events.aclose()
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
 @router.post(
     "/message/single",
     response_model=SingleDebateMessageResponse,
@@ -138,6 +394,7 @@ async def send_message(
 async def send_single_message(
     request: SingleDebateMessageRequest,
     debate_engine: DebateEngine = Depends(get_debate_engine),
+    artifact_store: AudioArtifactStore = Depends(get_audio_artifact_store),
 ):
     """
     단일 토론자에게 메시지를 전송하고 응답을 받습니다.
@@ -145,6 +402,7 @@ async def send_single_message(
     - **session_id**: 토론 세션 ID
     - **message**: 사용자 메시지
     - **target_debater**: 응답할 AI 토론자 (james/linda)
+    - **synthesize_audio**: 응답 음성 사전 합성 후 `audio_url` 반환 여부 (선택)
     """
     try:
         response = await debate_engine.generate_response(
@@ -153,11 +411,15 @@ async def send_single_message(
             debater=request.target_debater,
         )
         
+        presynthesize, audio_urls = _audio_presynthesizer(request.synthesize_audio, artifact_store)
+        if presynthesize:
+            presynthesize(request.target_debater.value, response)
+        
         return SingleDebateMessageResponse(
             session_id=request.session_id,
             debater=request.target_debater,
             message=response,
-            audio_url=None,  # TTS 연동 시 URL 제공
+            audio_url=audio_urls.get(request.target_debater.value),
             timestamp=datetime.utcnow(),
         )
     except Exception as e:
@@ -189,9 +451,9 @@ async def get_session(
     return {
         "session_id": session_id,
         "status": "active",
-        "topic": session.get("topic", ""),
-        "total_tokens_earned": session.get("total_tokens_earned", 0),
-        "message_count": len(session.get("history", [])),
+        "topic": session.topic,
+        "total_tokens_earned": session.total_tokens_earned,
+        "message_count": len(session.turns),
     }
 
 
@@ -3,15 +3,21 @@
 토론 중 추천 버튼 생성 엔드포인트
 """
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+import logging
 
 from app.models.schemas import (
     SuggestionGenerateRequest,
     SuggestionGenerateResponse,
+    SuggestionBatchRequest,
+    SuggestionBatchResponse,
     ErrorResponse,
 )
+from app.core.sse import SSE_HEADERS, format_sse
 from app.services.suggestion_service import SuggestionService, get_suggestion_service
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
 @router.post(
@@ -40,6 +46,8 @@ async def generate_suggestions(
     - 토론 시작 시: topic 추천
     - AI 응답 후: question/argument 추천
     - 30초 무응답 시: 새로운 추천 요청
+    
+    같은 맥락의 추천은 서버에서 캐시합니다. `bypass_cache=true`이면 새로 생성합니다.
     """
     try:
         context = request.context
@@ -51,6 +59,8 @@ async def generate_suggestions(
             james_last=context.james_last or "",
             linda_last=context.linda_last or "",
             lecture_context=context.lecture_context or "",
+            bypass_cache=request.bypass_cache,
+            session_id=request.session_id,
         )
         
         return SuggestionGenerateResponse(suggestions=suggestions)
@@ -62,6 +72,98 @@ async def generate_suggestions(
         )
 
 
+@router.post(
+    "/generate/stream",
+    responses={
+        200: {"content": {"text/event-stream": {}}, "description": "SSE 이벤트 스트림"},
+        500: {"model": ErrorResponse, "description": "서버 에러"},
+    },
+    summary="추천 스트리밍 생성",
+    description="추천 항목을 생성되는 즉시 하나씩 Server-Sent Events 스트림으로 전송합니다.",
+)
+async def generate_suggestions_stream(
+    request: SuggestionGenerateRequest,
+    suggestion_service: SuggestionService = Depends(get_suggestion_service),
+):
+    """
+    토론 추천을 SSE로 스트리밍합니다.
+    
+    **이벤트 순서**: `suggestion`* → `done`
+    
+    - `suggestion`: 추천 항목 하나 (`Suggestion` 형식)
+    - `done`: `{"count": n}` 전송한 추천 수
+    - `error`: `{"detail": "..."}` 처리 중 오류
+    """
+    async def event_stream():
+        count = 0
+        try:
+            context = request.context
+            async for suggestion in suggestion_service.stream_suggestions(
+                suggestion_type=request.suggestion_type.value,
+                topic=context.topic or "",
+                user_position=context.user_position or "",
+                james_last=context.james_last or "",
+                linda_last=context.linda_last or "",
+                lecture_context=context.lecture_context or "",
+                bypass_cache=request.bypass_cache,
+                session_id=request.session_id,
+            ):
+                count += 1
+                yield format_sse("suggestion", suggestion.model_dump(mode="json"))
+            yield format_sse("done", {"count": count})
+        except Exception as e:
+            logger.error(f"추천 스트리밍 실패: {e}")
+            yield format_sse("error", {"detail": str(e)})
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
+@router.post(
+    "/batch",
+    response_model=SuggestionBatchResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "잘못된 요청"},
+        500: {"model": ErrorResponse, "description": "서버 에러"},
+    },
+    summary="추천 일괄 생성",
+    description="여러 유형의 추천(주제/질문/발언)을 한 번의 요청으로 생성합니다.",
+)
+async def generate_suggestions_batch(
+    request: SuggestionBatchRequest,
+    suggestion_service: SuggestionService = Depends(get_suggestion_service),
+):
+    """
+    여러 유형의 추천을 한 번에 생성합니다.
+    
+    캐시에 없는 유형들은 하나의 LLM 호출로 함께 생성하며,
+    생성에 실패한 유형은 유형별 기본 추천을 반환합니다.
+    """
+    try:
+        context = request.context
+        
+        suggestions = await suggestion_service.generate_batch(
+            suggestion_types=[suggestion_type.value for suggestion_type in request.suggestion_types],
+            topic=context.topic or "",
+            user_position=context.user_position or "",
+            james_last=context.james_last or "",
+            linda_last=context.linda_last or "",
+            lecture_context=context.lecture_context or "",
+            bypass_cache=request.bypass_cache,
+        )
+        
+        return SuggestionBatchResponse(suggestions=suggestions)
+        
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e),
+        )
+
+
 @router.get(
     "/types",
     summary="추천 유형 목록",
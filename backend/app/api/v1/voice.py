@@ -1,34 +1,67 @@
 """
 음성 API 라우터 (ElevenLabs TTS)
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Response
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Response
+from typing import AsyncIterator
+import asyncio
 import logging
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from app.models.schemas import (
     VoiceSynthesizeRequest,
     VoiceSynthesizeResponse,
     ErrorResponse,
     DebaterRole,
 )
-from app.core.dependencies import get_voice_service
+from app.core.config import settings
+from app.core.dependencies import get_audio_artifact_store, get_voice_service
+from app.core.disconnect import (
+    CLIENT_CLOSED_REQUEST,
+    ClientDisconnected,
+    cancel_on_disconnect,
+    record_disconnect,
+)
+from app.services.audio_artifacts import ArtifactNotFound, AudioArtifactStore
 from app.services.voice_service import VoiceService
+from app.services.circuit_breaker import CircuitOpenError, OPEN
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+def _use_pipeline(request: VoiceSynthesizeRequest) -> bool:
+    return settings.TTS_PIPELINE_ENABLED if request.pipeline is None else request.pipeline
+
+
+async def _audio_stream(voice_service: VoiceService, request: VoiceSynthesizeRequest) -> AsyncIterator[bytes]:
+    """TTS 스트림 전달 (클라이언트 연결이 끊기면 ElevenLabs 스트림을 바로 닫음)"""
+    if _use_pipeline(request):
+        stream = voice_service.synthesize_pipeline(text=request.text, voice=request.voice)
+    else:
+        stream = voice_service.synthesize_stream(text=request.text, voice=request.voice)
+    try:
+        async for chunk in stream:
+            yield chunk
+    except (asyncio.CancelledError, GeneratorExit):
+        record_disconnect("voice_stream")
+        raise
+    finally:
+        await stream.aclose()
+
+
 @router.post(
     "/synthesize",
     responses={
         200: {"content": {"audio/mpeg": {}}, "description": "MP3 오디오 데이터"},
         400: {"model": ErrorResponse, "description": "잘못된 요청"},
         500: {"model": ErrorResponse, "description": "서버 에러"},
+        503: {"model": ErrorResponse, "description": "음성 서비스 일시 차단"},
     },
     summary="텍스트를 음성으로 변환",
     description="ElevenLabs를 사용하여 텍스트를 음성으로 변환하고 MP3 오디오를 반환합니다.",
 )
 async def synthesize_voice(
     request: VoiceSynthesizeRequest,
+    http_request: Request,
     voice_service: VoiceService = Depends(get_voice_service),
 ):
     """
@@ -46,9 +79,14 @@ async def synthesize_voice(
             request.voice.value,
             len(request.text),
         )
-        audio_bytes = await voice_service.synthesize(
-            text=request.text,
-            voice=request.voice,
+        # 응답 전에 클라이언트 연결이 끊기면 합성 요청 취소
+        audio_bytes = await cancel_on_disconnect(
+            http_request,
+            voice_service.synthesize(
+                text=request.text,
+                voice=request.voice,
+            ),
+            "voice_synthesize",
         )
         logger.info(
             "TTS synthesize response voice=%s bytes=%s",
@@ -64,6 +102,14 @@ async def synthesize_voice(
                 "Content-Length": str(len(audio_bytes)),
             }
         )
+    except ClientDisconnected:
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
+    except CircuitOpenError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(int(e.retry_after) + 1)},
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -82,6 +128,7 @@ async def synthesize_voice(
         200: {"content": {"audio/mpeg": {}}, "description": "스트리밍 MP3 오디오"},
         400: {"model": ErrorResponse, "description": "잘못된 요청"},
         500: {"model": ErrorResponse, "description": "서버 에러"},
+        503: {"model": ErrorResponse, "description": "음성 서비스 일시 차단"},
     },
     summary="스트리밍 TTS",
     description="텍스트를 음성으로 변환하여 스트리밍합니다.",
@@ -95,16 +142,23 @@ async def synthesize_voice_stream(
     
     - **text**: 변환할 텍스트 (최대 5000자)
     - **voice**: 사용할 음성 (james/linda)
+    - **pipeline**: 문장 단위로 나눠 동시에 합성하고 순서대로 스트리밍 (선택, 긴 텍스트의 첫 오디오 지연 단축)
     
     Returns:
         스트리밍 audio/mpeg 형식의 오디오 데이터
     """
+    # 스트림은 응답 시작 후에 실행되므로 회로 차단 여부를 미리 확인
+    if voice_service.breaker.state == OPEN and not voice_service.is_cached(
+        request.text, request.voice, pipeline=_use_pipeline(request)
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="음성 서비스가 일시적으로 차단되었습니다. 잠시 후 다시 시도해주세요.",
+        )
+
     try:
         return StreamingResponse(
-            voice_service.synthesize_stream(
-                text=request.text,
-                voice=request.voice,
-            ),
+            _audio_stream(voice_service, request),
             media_type="audio/mpeg",
             headers={
                 "Content-Disposition": f'attachment; filename="{request.voice.value}_stream.mp3"',
@@ -123,6 +177,52 @@ async def synthesize_voice_stream(
         )
 
 
+@router.get(
+    "/artifacts/{artifact_id}",
+    responses={
+        200: {"content": {"audio/mpeg": {}}, "description": "MP3 오디오 (합성 중이면 스트리밍)"},
+        404: {"model": ErrorResponse, "description": "없거나 만료된 음성"},
+        502: {"model": ErrorResponse, "description": "음성 합성 실패"},
+    },
+    summary="사전 합성된 토론 응답 음성",
+    description="토론 메시지 요청의 synthesize_audio로 받은 audio_url의 음성을 반환합니다.",
+)
+async def get_audio_artifact(
+    artifact_id: str,
+    artifact_store: AudioArtifactStore = Depends(get_audio_artifact_store),
+):
+    """
+    사전 합성된 음성을 반환합니다.
+    
+    합성이 진행 중이면 지금까지 합성된 부분부터 스트리밍하고 완료될 때까지 이어서 보냅니다.
+    다른 워커가 합성한 음성은 완료된 뒤에만 제공됩니다.
+    """
+    not_found = HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="음성을 찾을 수 없거나 보관 기간이 지났습니다.",
+    )
+    try:
+        artifact = artifact_store.get(artifact_id)
+    except ArtifactNotFound:
+        # 다른 워커가 완료한 음성 파일
+        path = artifact_store.find_file(artifact_id)
+        if path is None:
+            raise not_found
+        return FileResponse(path, media_type="audio/mpeg")
+    if artifact.path is not None and not artifact.path.exists():
+        raise not_found
+    if artifact.done and artifact.error and artifact.path is None and not artifact.chunks:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"음성 합성 실패: {artifact.error}",
+        )
+    
+    return StreamingResponse(
+        artifact_store.stream(artifact_id),
+        media_type="audio/mpeg",
+    )
+
+
 @router.get(
     "/voices",
     summary="사용 가능한 음성 목록",
@@ -15,11 +15,116 @@ class Settings(BaseSettings):
     
     # NVIDIA AI API
     NVIDIA_API_KEY: Optional[str] = None
+    # LLM 게이트웨이 제한 (기본값 0 = 비활성화, NIM 할당량에 맞춰 워커별로 설정)
+    # 스트리밍/헤지 요청은 생성이 끝날 때까지 동시 요청 슬롯을 잡고 있으므로
+    # 너무 낮게 잡으면 토론 턴이 대기하다 DEBATE_LLM_TIMEOUT_SECONDS를 넘길 수 있음
+    # API 키별 초당 요청 수 (0이면 제한 없음) 및 버스트 크기
+    LLM_RATE_LIMIT_PER_SECOND: float = 0
+    LLM_RATE_LIMIT_BURST: int = 20
+    # 모델별 최대 동시 요청 수 (0이면 제한 없음)
+    LLM_MAX_IN_FLIGHT_PER_MODEL: int = 0
+    # 토론자 LLM 호출 마감 시간(초, 0이면 무제한), 초과 시 스텁 응답
+    DEBATE_LLM_TIMEOUT_SECONDS: float = 20
+    # 헤지 요청: 응답이 늦으면 두 번째 요청(LLM_HEDGE_MODEL, 비어 있으면 같은 모델)을 보내 먼저 끝난 응답 사용
+    LLM_HEDGE_ENABLED: bool = False
+    LLM_HEDGE_MODEL: str = ""
+    # 헤지 발송 지연 = 최근 응답 시간의 백분위 (표본 부족 시 LLM_HEDGE_DELAY_SECONDS)
+    LLM_HEDGE_PERCENTILE: float = 95
+    LLM_HEDGE_DELAY_SECONDS: float = 4
+    LLM_HEDGE_MIN_SAMPLES: int = 20
+    LLM_LATENCY_SAMPLE_SIZE: int = 200
+
+    # Circuit Breaker (NIM/ElevenLabs/Supabase): 연속 실패 횟수, 차단 유지 시간, 반열림 시험 요청 수
+    CIRCUIT_FAILURE_THRESHOLD: int = 5
+    CIRCUIT_RECOVERY_SECONDS: float = 30
+    CIRCUIT_HALF_OPEN_MAX_CALLS: int = 1
+
+    # 클라이언트 연결 끊김 확인 주기(초, 0이면 비활성화): 끊기면 진행 중인 LLM/TTS 작업 취소
+    CLIENT_DISCONNECT_POLL_SECONDS: float = 0.5
+
+    # 공유 HTTP 클라이언트 (ElevenLabs/Supabase 업스트림별 keep-alive 연결 풀, 0이면 제한 없음)
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30
+    HTTP_CONNECT_TIMEOUT_SECONDS: float = 5
+    # HTTP/2 사용 (h2 패키지 필요, 없으면 HTTP/1.1)
+    HTTP2_ENABLED: bool = False
+
+    # Suggestion Cache (포맷된 프롬프트 해시 기준 LRU + 유형별 TTL, 0이면 비활성화)
+    SUGGESTION_CACHE_MAX_ENTRIES: int = 2048
+    SUGGESTION_CACHE_TTL_TOPIC_SECONDS: float = 3600
+    SUGGESTION_CACHE_TTL_QUESTION_SECONDS: float = 600
+    SUGGESTION_CACHE_TTL_ARGUMENT_SECONDS: float = 600
+    # 토론 턴 직후 question/argument 추천 미리 생성 (요청의 prefetch_suggestions로 개별 지정 가능)
+    SUGGESTION_PREFETCH_ENABLED: bool = False
+    # 미리 생성한 추천 보관 기간
+    SUGGESTION_PREFETCH_TTL_SECONDS: float = 120
+
+    # Debate Engine
+    # True면 James/Linda 응답을 동시에 생성 (Linda는 James 응답을 참고하지 않음)
+    DEBATE_PARALLEL_MODE: bool = False
+    # 토론 모델 및 지연 시간 예산 모드(fast)용 경량 모델
+    DEBATE_MODEL: str = "ai-llama-3_3-70b-instruct"
+    DEBATE_FAST_MODEL: str = "meta/llama-3.1-8b-instruct"
+    # latency_budget_ms가 이 값 이상이면 기본 생성, 미만이면 출력/히스토리 축소
+    DEBATE_LATENCY_FULL_MS: int = 8000
+    # latency_budget_ms가 이 값 미만이면 경량 모델 사용
+    DEBATE_LATENCY_FAST_MS: int = 4000
+
+    # Debate Sessions (유휴 TTL 만료 + 최대 세션 수 LRU 제거, 0이면 비활성화)
+    SESSION_TTL_SECONDS: float = 3600
+    SESSION_MAX_COUNT: int = 10000
+    SESSION_SWEEP_INTERVAL_SECONDS: float = 60
+    # 세션 백엔드: memory(프로세스 내부) | sqlite(여러 워커가 공유하는 WAL 파일)
+    SESSION_BACKEND: str = "memory"
+    SESSION_SQLITE_PATH: str = "data/sessions.db"
+    # 다른 워커의 쓰기 락을 기다리는 최대 시간 (밀리초, 기다리는 동안 이벤트 루프가 멈추므로 짧게 유지)
+    SESSION_SQLITE_BUSY_TIMEOUT_MS: int = 100
+
+    # Rolling Summary (리포트용 누적 요약, 백그라운드 갱신)
+    DEBATE_SUMMARY_ENABLED: bool = True
+    # 요약되지 않은 턴이 이 수 이상이면 요약 갱신
+    DEBATE_SUMMARY_TRIGGER_TURNS: int = 12
+    # 요약 갱신 시 원문으로 남겨둘 최근 턴 수
+    DEBATE_SUMMARY_KEEP_TURNS: int = 6
+    # 리포트 생성 시 진행 중인 요약 갱신을 기다리는 최대 시간(초, 0이면 기다리지 않음)
+    # 초과하면 현재 요약 + 요약되지 않은 턴 원문으로 리포트 생성
+    DEBATE_REPORT_SUMMARY_WAIT_SECONDS: float = 2
+
+    # Debater Memory
+    # window: 최근 k개 교환 그대로 | token_budget: 추정 토큰 예산 안에서 최근 교환부터 채움
+    DEBATE_MEMORY_MODE: str = "window"
+    # token_budget 모드에서 대화 히스토리에 쓸 추정 토큰 예산
+    DEBATE_MEMORY_TOKEN_BUDGET: int = 1200
+    # token_budget 모드에서 히스토리 메시지 하나당 최대 추정 토큰 (초과분은 잘라냄)
+    DEBATE_MEMORY_MAX_MESSAGE_TOKENS: int = 200
+
+    # Lecture Context Retrieval (긴 강의 컨텍스트는 BM25 상위 청크만 프롬프트에 포함)
+    LECTURE_RETRIEVAL_ENABLED: bool = True
+    # 이 길이(문자) 미만의 강의 컨텍스트는 그대로 사용
+    LECTURE_RETRIEVAL_MIN_CHARS: int = 1500
+    LECTURE_CHUNK_CHARS: int = 500
+    LECTURE_RETRIEVAL_TOP_K: int = 3
     
     # ElevenLabs TTS API
     ELEVENLABS_API_KEY: Optional[str] = None
     ELEVENLABS_JAMES_VOICE_ID: Optional[str] = None
     ELEVENLABS_LINDA_VOICE_ID: Optional[str] = None
+    # TTS 오디오 디스크 캐시 (음성/모델/설정/문장 해시 기준, 총 바이트 수 LRU, 0이면 비활성화)
+    # 용량 제한은 워커별 (여러 워커가 디렉터리를 공유하면 최대 워커 수 × TTS_CACHE_MAX_BYTES)
+    TTS_CACHE_DIR: str = "data/tts_cache"
+    TTS_CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+    # 문장 단위 파이프라인 합성 (요청의 pipeline으로 개별 지정 가능): 청크 최대 길이, 동시 합성 수
+    TTS_PIPELINE_ENABLED: bool = False
+    TTS_PIPELINE_CHUNK_CHARS: int = 250
+    TTS_PIPELINE_WINDOW: int = 3
+    # 토론 음성 스트리밍: 이 길이(문자) 미만의 문장은 다음 문장과 합쳐 합성
+    TTS_SPEECH_MIN_CHARS: int = 10
+    # 토론 응답 음성 사전 합성 (요청의 synthesize_audio로 개별 지정 가능): 저장 위치, 보관 기간, 최대 개수
+    AUDIO_PRESYNTHESIS_ENABLED: bool = False
+    AUDIO_ARTIFACT_DIR: str = "data/audio_artifacts"
+    AUDIO_ARTIFACT_TTL_SECONDS: float = 900
+    AUDIO_ARTIFACT_MAX_COUNT: int = 500
 
     # Supabase (reports storage)
     SUPABASE_URL: Optional[str] = None
@@ -3,6 +3,7 @@
 """
 from functools import lru_cache
 from app.core.config import settings
+from app.services.audio_artifacts import AudioArtifactStore
 from app.services.debate_engine import DebateEngine
 from app.services.voice_service import VoiceService
 
@@ -17,3 +18,14 @@ def get_debate_engine() -> DebateEngine:
 def get_voice_service() -> VoiceService:
     """음성 서비스 싱글톤 반환"""
     return VoiceService()
+
+
+@lru_cache()
+def get_audio_artifact_store() -> AudioArtifactStore:
+    """음성 아티팩트 저장소 싱글톤 반환"""
+    return AudioArtifactStore(
+        get_voice_service(),
+        directory=settings.AUDIO_ARTIFACT_DIR,
+        ttl_seconds=settings.AUDIO_ARTIFACT_TTL_SECONDS,
+        max_count=settings.AUDIO_ARTIFACT_MAX_COUNT,
+    )
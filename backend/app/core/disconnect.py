@@ -0,0 +1,66 @@
+"""
+클라이언트 연결 끊김 처리 유틸리티
+응답을 기다리던 클라이언트가 떠나면 진행 중인 LLM/TTS 작업을 취소해
+버려질 응답에 업스트림 할당량을 쓰지 않도록 합니다.
+
+- 일반 응답: cancel_on_disconnect가 작업과 함께 request.is_disconnected()를 주기적으로 확인
+- 스트리밍 응답: Starlette가 연결 끊김(또는 전송 실패) 시 스트림 제너레이터를 취소/종료
+"""
+from typing import Awaitable, Dict, TypeVar
+import asyncio
+import logging
+
+from starlette.requests import Request
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# nginx 관례의 "Client Closed Request" 상태 코드 (로그/지표용, 클라이언트는 받지 못함)
+CLIENT_CLOSED_REQUEST = 499
+
+# 엔드포인트별 연결 끊김으로 취소된 요청 수
+_disconnects: Dict[str, int] = {}
+
+
+class ClientDisconnected(Exception):
+    """작업이 끝나기 전에 클라이언트 연결이 끊김"""
+
+
+def record_disconnect(endpoint: str):
+    """연결 끊김으로 중단된 요청 기록"""
+    _disconnects[endpoint] = _disconnects.get(endpoint, 0) + 1
+    logger.info(f"클라이언트 연결 끊김으로 작업 취소: {endpoint}")
+
+
+def disconnect_stats() -> Dict[str, int]:
+    return dict(_disconnects)
+
+
+async def cancel_on_disconnect(request: Request, awaitable: Awaitable[T], endpoint: str) -> T:
+    """
+    awaitable을 실행하면서 클라이언트 연결을 감시
+
+    CLIENT_DISCONNECT_POLL_SECONDS마다 연결 상태를 확인하고, 끊겼으면 작업을 취소한 뒤
+    ClientDisconnected를 발생시킵니다 (0이면 감시하지 않음).
+    """
+    interval = settings.CLIENT_DISCONNECT_POLL_SECONDS
+    if interval <= 0:
+        return await awaitable
+
+    task = asyncio.ensure_future(awaitable)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=interval)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                record_disconnect(endpoint)
+                raise ClientDisconnected(endpoint)
+    finally:
+        # 연결 끊김 또는 요청 자체가 취소된 경우 작업 취소
+        if not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
@@ -0,0 +1,57 @@
+"""
+공유 HTTP 클라이언트 관리
+업스트림(ElevenLabs, Supabase)별로 keep-alive 연결 풀을 가진 httpx.AsyncClient를 하나씩 두고
+재사용해 호출마다 DNS 조회/TCP 연결/TLS 핸드셰이크를 반복하지 않도록 합니다.
+클라이언트는 처음 사용할 때 만들어지고 앱 종료(lifespan) 시 close_http_clients()로 닫힙니다.
+"""
+from typing import Dict
+import importlib.util
+import logging
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 업스트림 이름 → 공유 클라이언트
+_clients: Dict[str, httpx.AsyncClient] = {}
+
+
+def _http2_available() -> bool:
+    """HTTP/2 사용 가능 여부 (httpx[http2]의 h2 패키지 필요)"""
+    if not settings.HTTP2_ENABLED:
+        return False
+    if importlib.util.find_spec("h2") is None:
+        logger.warning("HTTP2_ENABLED이지만 h2 패키지가 없어 HTTP/1.1을 사용합니다. (pip install 'httpx[http2]')")
+        return False
+    return True
+
+
+def get_http_client(name: str) -> httpx.AsyncClient:
+    """업스트림별 공유 클라이언트 반환 (없거나 닫혔으면 새로 생성)"""
+    client = _clients.get(name)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=_http2_available(),
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_MAX_CONNECTIONS or None,
+                max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS or None,
+                keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            # 요청별 timeout을 지정하지 않은 호출의 기본값
+            timeout=httpx.Timeout(30.0, connect=settings.HTTP_CONNECT_TIMEOUT_SECONDS),
+        )
+        _clients[name] = client
+    return client
+
+
+async def close_http_clients():
+    """모든 공유 클라이언트 종료 (연결 풀 정리)"""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.error(f"HTTP 클라이언트 종료 실패: {e}")
@@ -0,0 +1,70 @@
+"""
+증분 JSON 배열 파서
+LLM 스트리밍 출력에서 최상위 JSON 배열의 객체 항목을
+닫히는 즉시 하나씩 꺼냅니다 (```json 코드 블록 등 앞뒤 텍스트는 무시).
+"""
+from typing import Any, Dict, List
+import json
+
+
+class JSONArrayItemParser:
+    """청크 단위로 입력받아 완성된 배열 항목(객체)을 반환하는 파서"""
+
+    def __init__(self):
+        self._in_array = False
+        self._done = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._buffer: List[str] = []
+
+    @property
+    def done(self) -> bool:
+        """배열이 닫혔는지 여부"""
+        return self._done
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """청크를 처리하고 이번에 완성된 객체 목록 반환 (JSON 오류 항목은 건너뜀)"""
+        items: List[Dict[str, Any]] = []
+        for ch in chunk:
+            if self._done:
+                break
+            if not self._in_array:
+                if ch == "[":
+                    self._in_array = True
+                continue
+
+            if self._depth > 0:
+                self._buffer.append(ch)
+                if self._in_string:
+                    if self._escape:
+                        self._escape = False
+                    elif ch == "\\":
+                        self._escape = True
+                    elif ch == '"':
+                        self._in_string = False
+                elif ch == '"':
+                    self._in_string = True
+                elif ch == "{":
+                    self._depth += 1
+                elif ch == "}":
+                    self._depth -= 1
+                    if self._depth == 0:
+                        item = self._decode("".join(self._buffer))
+                        if item is not None:
+                            items.append(item)
+                        self._buffer = []
+            elif ch == "{":
+                self._depth = 1
+                self._buffer = [ch]
+            elif ch == "]":
+                self._done = True
+        return items
+
+    @staticmethod
+    def _decode(text: str):
+        try:
+            item = json.loads(text)
+        except json.JSONDecodeError:
+            return None
+        return item if isinstance(item, dict) else None
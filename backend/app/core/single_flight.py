@@ -0,0 +1,48 @@
+"""
+Single-flight 요청 병합 유틸리티
+같은 키로 동시에 들어온 요청은 먼저 시작된 하나의 작업 결과를 함께 기다립니다.
+"""
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+import asyncio
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """키별 진행 중 작업 병합"""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        key로 진행 중인 작업이 있으면 그 결과를, 없으면 fn()을 새로 실행해 반환
+
+        공유 작업은 태스크로 실행되므로 기다리던 요청 하나가 취소되어도
+        다른 요청이 받을 결과에는 영향을 주지 않습니다.
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.create_task(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self.leaders += 1
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # 기다리는 요청이 모두 취소된 경우 "exception never retrieved" 경고 방지
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "in_flight": len(self._calls),
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+        }
@@ -0,0 +1,18 @@
+"""
+Server-Sent Events 유틸리티
+"""
+import json
+from typing import Any, Dict
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    # 프록시(nginx 등) 버퍼링 비활성화
+    "X-Accel-Buffering": "no",
+}
+
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    """SSE 이벤트 문자열 생성 (data는 JSON 직렬화)"""
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return f"event: {event}\ndata: {payload}\n\n"
@@ -0,0 +1,41 @@
+"""
+프롬프트 토큰 수 추정 유틸리티
+
+실제 토크나이저 없이 대략적인 토큰 수를 계산합니다.
+- ASCII 문자: 약 4자당 1토큰
+- 한글 등 비ASCII 문자: 약 1자당 1토큰
+"""
+from typing import Iterable
+
+from langchain_core.messages import BaseMessage
+
+# 메시지마다 붙는 역할/구분자 토큰
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """텍스트의 추정 토큰 수"""
+    if not text:
+        return 0
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+def estimate_message_tokens(messages: Iterable[BaseMessage]) -> int:
+    """LLM 입력 메시지 목록의 추정 토큰 수"""
+    return sum(
+        estimate_tokens(str(message.content)) + MESSAGE_OVERHEAD_TOKENS
+        for message in messages
+    )
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """추정 토큰 수가 max_tokens 이하가 되도록 뒷부분을 잘라냄"""
+    if max_tokens <= 0 or estimate_tokens(text) <= max_tokens:
+        return text
+    used = 0.0
+    for index, ch in enumerate(text):
+        used += 0.25 if ord(ch) < 128 else 1
+        if used > max_tokens:
+            return text[:index].rstrip() + "…"
+    return text
@@ -1,10 +1,32 @@
 """
 FastAPI Backend for AI Debate Platform
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.v1 import debate, voice, suggestions
 from app.core.config import settings
+from app.core.dependencies import get_audio_artifact_store, get_debate_engine, get_voice_service
+from app.core.disconnect import disconnect_stats
+from app.core.http_client import close_http_clients
+from app.services.circuit_breaker import circuit_breaker_stats
+from app.services.llm_gateway import get_llm_gateway
+from app.services.suggestion_service import get_suggestion_service
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 시작/종료 시 백그라운드 작업 관리"""
+    debate_engine = get_debate_engine()
+    debate_engine.start()
+    try:
+        yield
+    finally:
+        await get_suggestion_service().aclose()
+        await debate_engine.aclose()
+        await get_audio_artifact_store().aclose()
+        await close_http_clients()
+
 
 app = FastAPI(
     title="AI Debate Platform API",
@@ -12,6 +34,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # CORS 설정
@@ -41,6 +64,21 @@ async def health_check():
         "status": "healthy",
         "version": "1.0.0",
         "environment": settings.ENV,
+        "circuits": circuit_breaker_stats(),
+    }
+
+
+@app.get("/api/v1/metrics", tags=["health"])
+async def metrics():
+    """런타임 지표 (세션 저장소 등)"""
+    return {
+        "sessions": get_debate_engine().session_store.stats(),
+        "prompts": get_debate_engine().prompt_token_stats(),
+        "llm": get_llm_gateway().stats(),
+        "suggestions": get_suggestion_service().stats(),
+        "disconnects": disconnect_stats(),
+        "tts_cache": get_voice_service().cache_stats(),
+        "audio_artifacts": get_audio_artifact_store().stats(),
     }
 
 
@@ -2,7 +2,7 @@
 Pydantic 모델 정의
 """
 from pydantic import BaseModel, Field
-from typing import Optional, List, Literal
+from typing import Optional, Dict, List, Literal
 from datetime import datetime
 from enum import Enum
 
@@ -52,6 +52,23 @@ class DebateMessageRequest(BaseModel):
     session_id: str = Field(..., description="세션 ID")
     user_message: str = Field(..., description="사용자 메시지")
     lecture_context: Optional[str] = Field(None, description="강의 컨텍스트")
+    parallel: Optional[bool] = Field(
+        None,
+        description="James/Linda 동시 생성 여부 (미지정 시 서버 설정 사용)",
+    )
+    prefetch_suggestions: Optional[bool] = Field(
+        None,
+        description="응답 직후 question/argument 추천 미리 생성 여부 (미지정 시 서버 설정 사용)",
+    )
+    latency_budget_ms: Optional[int] = Field(
+        None,
+        ge=0,
+        description="응답 지연 시간 예산(ms). 작을수록 경량 모델/짧은 응답/얕은 히스토리 사용 (fast mode)",
+    )
+    synthesize_audio: Optional[bool] = Field(
+        None,
+        description="응답 음성을 서버에서 미리 합성하고 audio_url 반환 여부 (미지정 시 서버 설정 사용)",
+    )
     
     class Config:
         json_schema_extra = {
@@ -69,6 +86,11 @@ class DebateMessageResponse(BaseModel):
     james_response: str = Field(..., description="제임스(비판적 관점)의 응답")
     linda_response: str = Field(..., description="린다(지지적 관점)의 응답")
     tokens_earned: int = Field(default=0, description="획득한 토큰 수")
+    prompt_tokens: Optional[Dict[str, int]] = Field(
+        default=None, description="토론자별 LLM 호출 추정 프롬프트 토큰 수"
+    )
+    james_audio_url: Optional[str] = Field(default=None, description="제임스 응답 음성 URL (synthesize_audio 요청 시)")
+    linda_audio_url: Optional[str] = Field(default=None, description="린다 응답 음성 URL (synthesize_audio 요청 시)")
     timestamp: datetime = Field(default_factory=datetime.utcnow)
     
     class Config:
@@ -91,6 +113,10 @@ class SingleDebateMessageRequest(BaseModel):
         default=DebaterRole.JAMES,
         description="응답할 토론자 선택"
     )
+    synthesize_audio: Optional[bool] = Field(
+        None,
+        description="응답 음성을 서버에서 미리 합성하고 audio_url 반환 여부 (미지정 시 서버 설정 사용)",
+    )
     
     class Config:
         json_schema_extra = {
@@ -159,6 +185,10 @@ class VoiceSynthesizeRequest(BaseModel):
         default=DebaterRole.JAMES,
         description="음성 선택 (james/linda)"
     )
+    pipeline: Optional[bool] = Field(
+        default=None,
+        description="스트리밍 시 문장 단위 동시 합성 여부 (미지정 시 서버 설정 TTS_PIPELINE_ENABLED)"
+    )
     
     class Config:
         json_schema_extra = {
@@ -230,6 +260,7 @@ class SuggestionGenerateRequest(BaseModel):
     session_id: str = Field(..., description="세션 ID")
     suggestion_type: SuggestionType = Field(..., description="추천 유형")
     context: SuggestionContext = Field(default_factory=SuggestionContext)
+    bypass_cache: bool = Field(default=False, description="True면 캐시된 추천을 사용하지 않고 새로 생성")
     
     class Config:
         json_schema_extra = {
@@ -250,3 +281,35 @@ class SuggestionGenerateResponse(BaseModel):
     """추천 생성 응답"""
     suggestions: List[Suggestion] = Field(..., description="추천 목록")
     generated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class SuggestionBatchRequest(BaseModel):
+    """여러 유형 추천 일괄 생성 요청"""
+    session_id: str = Field(..., description="세션 ID")
+    suggestion_types: List[SuggestionType] = Field(
+        default_factory=lambda: list(SuggestionType),
+        min_length=1,
+        description="추천 유형 목록",
+    )
+    context: SuggestionContext = Field(default_factory=SuggestionContext)
+    bypass_cache: bool = Field(default=False, description="True면 캐시된 추천을 사용하지 않고 새로 생성")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "session_id": "session_123",
+                "suggestion_types": ["question", "argument"],
+                "context": {
+                    "topic": "AI가 인간의 일자리를 대체해야 하는가?",
+                    "user_position": "pro",
+                    "james_last": "흥미로운 관점이지만, 반례가 있습니다.",
+                    "linda_last": "좋은 지적이에요! 😊"
+                }
+            }
+        }
+
+
+class SuggestionBatchResponse(BaseModel):
+    """여러 유형 추천 일괄 생성 응답"""
+    suggestions: Dict[SuggestionType, List[Suggestion]] = Field(..., description="유형별 추천 목록")
+    generated_at: datetime = Field(default_factory=datetime.utcnow)
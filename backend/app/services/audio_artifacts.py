@@ -0,0 +1,254 @@
+"""
+토론 응답 음성 아티팩트 저장소
+토론 응답 텍스트가 만들어지는 즉시 백그라운드로 TTS를 시작하고, 클라이언트에는
+바로 audio_url을 돌려줍니다. URL은 합성이 진행 중이면 지금까지 받은 오디오부터
+스트리밍하고, 완료된 오디오는 로컬 디스크 파일에서 제공합니다.
+
+여러 워커가 같은 AUDIO_ARTIFACT_DIR을 쓰므로 파일은 워커(PID)별 하위 디렉터리에 저장합니다.
+완료된 오디오는 다른 워커에서도 파일로 제공되지만, 합성 중인 오디오의 부분 스트리밍은
+합성을 시작한 워커에서만 가능합니다.
+"""
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
+import asyncio
+import logging
+import os
+import tempfile
+import time
+import uuid
+
+from app.core.config import settings
+from app.models.schemas import DebaterRole
+from app.services.voice_service import VoiceService
+
+logger = logging.getLogger(__name__)
+
+
+class ArtifactNotFound(KeyError):
+    """없거나 만료된 음성 아티팩트"""
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class AudioArtifact:
+    """백그라운드 합성 중이거나 완료된 음성 하나"""
+
+    __slots__ = ("artifact_id", "voice", "chunks", "path", "done", "error", "task", "changed", "created_at")
+
+    def __init__(self, artifact_id: str, voice: DebaterRole):
+        self.artifact_id = artifact_id
+        self.voice = voice
+        # 합성 중 받은 오디오 (완료 후 파일로 옮기면 비움)
+        self.chunks: List[bytes] = []
+        self.path: Optional[Path] = None
+        self.done = False
+        self.error: Optional[str] = None
+        self.task: Optional[asyncio.Task] = None
+        # 새 청크/완료 알림
+        self.changed = asyncio.Event()
+        self.created_at = asyncio.get_running_loop().time()
+
+
+class AudioArtifactStore:
+    """음성 아티팩트 생성/조회 (보관 기간 TTL + 최대 개수)"""
+
+    def __init__(self, voice_service: VoiceService, directory: str, ttl_seconds: float, max_count: int):
+        self.voice_service = voice_service
+        self.root = Path(directory)
+        # 이 워커 전용 하위 디렉터리 (다른 워커의 파일은 건드리지 않음)
+        self.directory = self.root / f"worker-{os.getpid()}"
+        self.ttl_seconds = ttl_seconds
+        self.max_count = max_count
+        self._artifacts: Dict[str, AudioArtifact] = {}
+        self._stats = {"created": 0, "completed": 0, "failed": 0, "expired": 0, "served": 0, "cancelled": 0}
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._cleanup_stale()
+
+    def _cleanup_stale(self):
+        """
+        이전 실행에서 남은 파일 정리
+
+        같은 PID를 쓰던 이전 프로세스의 파일과, 더 이상 실행 중이 아닌 워커의 디렉터리만 삭제합니다.
+        """
+        for path in self.directory.iterdir():
+            path.unlink(missing_ok=True)
+        for worker_dir in self.root.glob("worker-*"):
+            try:
+                pid = int(worker_dir.name.split("-", 1)[1])
+            except ValueError:
+                continue
+            if pid == os.getpid() or _process_alive(pid):
+                continue
+            for path in worker_dir.iterdir():
+                path.unlink(missing_ok=True)
+            try:
+                worker_dir.rmdir()
+            except OSError:
+                pass
+
+    def url_for(self, artifact_id: str) -> str:
+        return f"{settings.API_V1_PREFIX}/voice/artifacts/{artifact_id}"
+
+    def create(self, text: str, voice: DebaterRole) -> Optional[str]:
+        """
+        백그라운드 합성 시작 후 audio_url 반환
+
+        음성 서비스가 설정되지 않았거나 텍스트가 비어 있으면 None을 반환합니다.
+        """
+        if not text.strip() or not self.voice_service.configured:
+            return None
+        self._prune()
+
+        artifact = AudioArtifact(uuid.uuid4().hex, voice)
+        artifact.task = asyncio.create_task(self._synthesize(artifact, text))
+        self._artifacts[artifact.artifact_id] = artifact
+        self._stats["created"] += 1
+        return self.url_for(artifact.artifact_id)
+
+    async def _synthesize(self, artifact: AudioArtifact, text: str):
+        """오디오를 받는 대로 보관하고, 완료되면 디스크 파일로 옮김"""
+        try:
+            if settings.TTS_PIPELINE_ENABLED:
+                stream = self.voice_service.synthesize_pipeline(text, artifact.voice)
+            else:
+                stream = self.voice_service.synthesize_stream(text, artifact.voice)
+            try:
+                async for chunk in stream:
+                    artifact.chunks.append(chunk)
+                    artifact.changed.set()
+            finally:
+                await stream.aclose()
+
+            path = self.directory / f"{artifact.artifact_id}.mp3"
+            await asyncio.to_thread(self._write, path, b"".join(artifact.chunks))
+            artifact.path = path
+            artifact.chunks = []
+            self._stats["completed"] += 1
+        except asyncio.CancelledError:
+            artifact.error = "취소됨"
+            raise
+        except Exception as e:
+            logger.error(f"음성 사전 합성 실패 ({artifact.voice.value}): {e}")
+            artifact.error = str(e)
+            self._stats["failed"] += 1
+        finally:
+            artifact.done = True
+            artifact.changed.set()
+
+    def _write(self, path: Path, data: bytes):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def get(self, artifact_id: str) -> AudioArtifact:
+        artifact = self._artifacts.get(artifact_id)
+        if artifact is None:
+            raise ArtifactNotFound(artifact_id)
+        return artifact
+
+    def find_file(self, artifact_id: str) -> Optional[Path]:
+        """다른 워커가 완료한 아티팩트 파일 (보관 기간 내, 없으면 None)"""
+        if not artifact_id.isalnum():
+            return None
+        for path in self.root.glob(f"worker-*/{artifact_id}.mp3"):
+            try:
+                age = time.time() - path.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            if age <= self.ttl_seconds:
+                return path
+        return None
+
+    def discard(self, audio_url: Optional[str]):
+        """더 이상 필요 없는 아티팩트의 합성 취소 및 삭제 (예: 턴이 버려진 경우)"""
+        if not audio_url:
+            return
+        artifact = self._artifacts.pop(audio_url.rsplit("/", 1)[-1], None)
+        if artifact is not None:
+            self._remove(artifact)
+            self._stats["cancelled"] += 1
+
+    async def stream(self, artifact_id: str) -> AsyncIterator[bytes]:
+        """
+        아티팩트 오디오 스트리밍
+
+        합성 중이면 지금까지 받은 오디오부터 보내고 새 청크를 기다립니다.
+        합성이 중간에 실패하면 받은 부분까지만 보냅니다.
+        """
+        artifact = self.get(artifact_id)
+        self._stats["served"] += 1
+        if artifact.path is not None and not artifact.path.exists():
+            raise ArtifactNotFound(artifact_id)
+        sent_chunks = 0
+        sent_bytes = 0
+        while True:
+            artifact.changed.clear()
+            if artifact.path is not None:
+                # 완료 후 파일로 옮겨진 경우 (이미 보낸 바이트 이후부터)
+                try:
+                    data = await asyncio.to_thread(artifact.path.read_bytes)
+                except FileNotFoundError:
+                    # 응답 시작 후 파일이 삭제됨 (빈 정상 응답이 되지 않도록 오류로 종료)
+                    raise ArtifactNotFound(artifact_id)
+                if len(data) > sent_bytes:
+                    yield data[sent_bytes:]
+                return
+            chunks = artifact.chunks
+            while sent_chunks < len(chunks):
+                chunk = chunks[sent_chunks]
+                sent_chunks += 1
+                sent_bytes += len(chunk)
+                yield chunk
+            if artifact.done:
+                return
+            await artifact.changed.wait()
+
+    def _prune(self):
+        """보관 기간이 지났거나 최대 개수를 넘은 아티팩트 제거 (오래된 것부터)"""
+        now = asyncio.get_running_loop().time()
+        expired = [
+            artifact_id for artifact_id, artifact in self._artifacts.items()
+            if now - artifact.created_at > self.ttl_seconds
+        ]
+        overflow = len(self._artifacts) - len(expired) - self.max_count + 1
+        if overflow > 0:
+            expired += [artifact_id for artifact_id in self._artifacts if artifact_id not in expired][:overflow]
+        for artifact_id in expired:
+            self._remove(self._artifacts.pop(artifact_id))
+        self._stats["expired"] += len(expired)
+
+    def _remove(self, artifact: AudioArtifact):
+        if artifact.task is not None and not artifact.task.done():
+            artifact.task.cancel()
+        if artifact.path is not None:
+            artifact.path.unlink(missing_ok=True)
+
+    async def aclose(self):
+        """진행 중인 합성 취소 및 파일 정리 (앱 종료 시 호출)"""
+        artifacts = list(self._artifacts.values())
+        self._artifacts.clear()
+        tasks = [artifact.task for artifact in artifacts if artifact.task is not None]
+        for artifact in artifacts:
+            self._remove(artifact)
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "artifacts": len(self._artifacts),
+            "in_progress": sum(1 for artifact in self._artifacts.values() if not artifact.done),
+            **self._stats,
+        }
@@ -0,0 +1,173 @@
+"""
+TTS 오디오 디스크 캐시
+(voice_id, model_id, voice_settings, text) 해시를 키로 MP3를 로컬 디스크에 저장해
+같은 문장을 같은 음성으로 다시 합성할 때 ElevenLabs를 호출하지 않습니다.
+
+- 파일 쓰기는 임시 파일에 쓴 뒤 os.replace로 교체 (읽는 쪽은 완성된 파일만 봄)
+- 메모리 인덱스(키 → 바이트 수)로 조회하고 총 바이트 수 기준 LRU 제거
+- 시작 시 디렉터리를 읽어 인덱스 복구 (수정 시각 순서)
+
+인덱스와 용량 제한은 워커(프로세스)별입니다. 여러 워커가 같은 디렉터리를 쓰면
+디스크 사용량은 최대 워커 수 × max_bytes까지 늘어날 수 있습니다.
+"""
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_SUFFIX = ".mp3"
+# 이보다 오래된 임시 파일만 정리 (다른 워커가 쓰는 중인 파일은 남김)
+_STALE_TMP_SECONDS = 600
+
+
+def audio_cache_key(voice_id: str, model_id: str, voice_settings: Dict[str, Any], text: str) -> str:
+    """합성 조건 해시 (같은 조건이면 같은 오디오)"""
+    payload = json.dumps(
+        {"voice_id": voice_id, "model_id": model_id, "voice_settings": voice_settings, "text": text},
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AudioCache:
+    """콘텐츠 주소 기반 MP3 디스크 캐시 (총 바이트 수 제한 LRU)"""
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        # 키 → 파일 크기 (앞쪽이 가장 오래 사용되지 않은 항목)
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_SUFFIX}"
+
+    def _load_index(self):
+        """디스크의 기존 캐시 파일로 인덱스 복구 (오래된 임시 파일은 삭제)"""
+        entries = []
+        now = time.time()
+        for path in self.directory.iterdir():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # 다른 워커가 교체/삭제한 파일
+                continue
+            if path.name.startswith("."):
+                if now - stat.st_mtime > _STALE_TMP_SECONDS:
+                    path.unlink(missing_ok=True)
+                continue
+            if path.suffix != _SUFFIX:
+                continue
+            entries.append((stat.st_mtime, path.stem, stat.st_size))
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self.total_bytes += size
+        self._evict()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """캐시된 오디오 반환 (없으면 None, 다른 워커가 저장한 파일은 인덱스에 추가)"""
+        try:
+            data = await asyncio.to_thread(self._path(key).read_bytes)
+        except FileNotFoundError:
+            # 없거나 다른 워커가 제거한 파일
+            self._forget(key)
+            self.misses += 1
+            return None
+        if key in self._index:
+            self._index.move_to_end(key)
+        else:
+            self._index[key] = len(data)
+            self.total_bytes += len(data)
+            self._evict()
+        self.hits += 1
+        return data
+
+    async def put(self, key: str, data: bytes):
+        """오디오 저장 (원자적 교체 후 용량 초과분 제거)"""
+        if not data or len(data) > self.max_bytes:
+            return
+        try:
+            await asyncio.to_thread(self._write, key, data)
+        except OSError as e:
+            logger.error(f"TTS 캐시 저장 실패: {e}")
+            return
+        self._forget(key)
+        self._index[key] = len(data)
+        self.total_bytes += len(data)
+        self.writes += 1
+        self._evict()
+
+    def _write(self, key: str, data: bytes):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{os.getpid()}-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def _forget(self, key: str):
+        size = self._index.pop(key, None)
+        if size is not None:
+            self.total_bytes -= size
+
+    def _evict(self):
+        """총 바이트 수가 max_bytes 이하가 될 때까지 오래된 항목부터 삭제"""
+        while self.total_bytes > self.max_bytes and self._index:
+            key, size = self._index.popitem(last=False)
+            self.total_bytes -= size
+            self.evictions += 1
+            try:
+                self._path(key).unlink(missing_ok=True)
+            except OSError as e:
+                logger.error(f"TTS 캐시 삭제 실패: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._index),
+            "total_bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "writes": self.writes,
+            "evictions": self.evictions,
+        }
+
+
+_audio_cache: Optional[AudioCache] = None
+
+
+def get_audio_cache() -> Optional[AudioCache]:
+    """TTS 오디오 캐시 싱글톤 반환 (비활성화 또는 디렉터리 생성 실패 시 None)"""
+    global _audio_cache
+    if _audio_cache is None and settings.TTS_CACHE_MAX_BYTES > 0:
+        try:
+            _audio_cache = AudioCache(settings.TTS_CACHE_DIR, settings.TTS_CACHE_MAX_BYTES)
+        except OSError as e:
+            logger.error(f"TTS 캐시 초기화 실패: {e}")
+            return None
+    return _audio_cache
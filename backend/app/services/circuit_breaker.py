@@ -0,0 +1,172 @@
+"""
+업스트림 서비스별 서킷 브레이커
+NVIDIA NIM, ElevenLabs, Supabase 호출이 연속으로 실패하면 회로를 열어
+복구 대기 시간 동안 요청을 즉시 실패시키고 (호출 측은 바로 폴백),
+이후 반열림(half-open) 상태에서 시험 요청으로 복구 여부를 확인합니다.
+
+상태 전이:
+    closed --(연속 실패 threshold회)--> open --(recovery 경과)--> half_open
+    half_open --(시험 요청 성공)--> closed
+    half_open --(시험 요청 실패)--> open
+"""
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Tuple, Type
+import logging
+import time
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 기본으로 상태를 노출하는 업스트림
+UPSTREAMS = ("nim", "elevenlabs", "supabase")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """회로가 열려 있어 호출하지 않고 즉시 실패"""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"{name} 회로 차단 중 ({retry_after:.0f}초 후 재시도)")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """업스트림 하나에 대한 서킷 브레이커"""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_seconds: float = 30,
+        half_open_max_calls: int = 1,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.half_open_max_calls = half_open_max_calls
+
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self.consecutive_failures = 0
+        self.failures = 0
+        self.successes = 0
+        self.rejected = 0
+        self.opened = 0
+        self.last_error: Optional[str] = None
+
+    @property
+    def state(self) -> str:
+        """현재 상태 (복구 대기 시간이 지났으면 half_open)"""
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.recovery_seconds:
+            self._state = HALF_OPEN
+            self._half_open_calls = 0
+        return self._state
+
+    def allow(self) -> bool:
+        """호출 허용 여부 (half_open에서는 시험 요청 수만큼만 허용)"""
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and self._half_open_calls < self.half_open_max_calls:
+            self._half_open_calls += 1
+            return True
+        self.rejected += 1
+        return False
+
+    def check(self):
+        """호출 허용 여부 확인 (차단 중이면 CircuitOpenError)"""
+        if not self.allow():
+            retry_after = max(0.0, self.recovery_seconds - (time.monotonic() - self._opened_at))
+            raise CircuitOpenError(self.name, retry_after)
+
+    def record_success(self):
+        self.successes += 1
+        self.consecutive_failures = 0
+        if self._state != CLOSED:
+            logger.info(f"{self.name} 회로 복구 (closed)")
+        self._state = CLOSED
+
+    def record_failure(self, error: Optional[BaseException] = None):
+        self.failures += 1
+        self.consecutive_failures += 1
+        if error is not None:
+            self.last_error = repr(error)[:200]
+        if self._state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self._state != OPEN:
+                self.opened += 1
+                logger.warning(
+                    f"{self.name} 회로 차단 (open): 연속 실패 {self.consecutive_failures}회, {self.last_error}"
+                )
+            self._state = OPEN
+            self._opened_at = time.monotonic()
+
+    @asynccontextmanager
+    async def guard(self, ignore: Tuple[Type[BaseException], ...] = ()) -> AsyncIterator[None]:
+        """
+        호출 구간 보호
+
+        차단 중이면 CircuitOpenError를 발생시키고, 구간에서 발생한 예외(ignore 제외)는
+        실패로, 정상 종료는 성공으로 기록합니다. 취소(CancelledError)는 기록하지 않습니다.
+        """
+        self.check()
+        try:
+            yield
+        except ignore:
+            self.record_success()
+            raise
+        except Exception as e:
+            self.record_failure(e)
+            raise
+        except BaseException:
+            # 취소된 시험 요청은 다음 요청이 다시 시험할 수 있도록 반환
+            self.release_trial()
+            raise
+        else:
+            self.record_success()
+
+    def release_trial(self):
+        """결과 없이 끝난 half_open 시험 요청 반환"""
+        if self._state == HALF_OPEN and self._half_open_calls > 0:
+            self._half_open_calls -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "failures": self.failures,
+            "successes": self.successes,
+            "rejected": self.rejected,
+            "opened": self.opened,
+            "last_error": self.last_error,
+        }
+
+
+# 업스트림 이름 → 서킷 브레이커
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """업스트림별 서킷 브레이커 반환 (설정값으로 생성)"""
+    breaker = _breakers.get(name)
+    if breaker is None:
+        breaker = CircuitBreaker(
+            name,
+            failure_threshold=settings.CIRCUIT_FAILURE_THRESHOLD,
+            recovery_seconds=settings.CIRCUIT_RECOVERY_SECONDS,
+            half_open_max_calls=settings.CIRCUIT_HALF_OPEN_MAX_CALLS,
+        )
+        _breakers[name] = breaker
+    return breaker
+
+
+def circuit_breaker_stats() -> Dict[str, Dict[str, Any]]:
+    """모든 서킷 브레이커 상태 (기본 업스트림은 호출 전이라도 포함)"""
+    for name in UPSTREAMS:
+        get_circuit_breaker(name)
+    return {name: breaker.stats() for name, breaker in _breakers.items()}
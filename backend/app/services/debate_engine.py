@@ -2,17 +2,26 @@
 AI 토론 엔진 서비스
 NVIDIA NIM + LangChain을 사용한 3자 토론 AI 엔진
 """
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, List, Tuple, AsyncIterator, Any, Awaitable, Callable
 from pathlib import Path
+import asyncio
 import logging
 import json
 
-from langchain_nvidia_ai_endpoints import ChatNVIDIA
-from langchain.memory import ConversationBufferWindowMemory
-from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
+from langchain_core.messages import SystemMessage, HumanMessage
 
 from app.core.config import settings
+from app.core.tokens import estimate_message_tokens
 from app.models.schemas import DebaterRole
+from app.services.lecture_index import LectureIndex
+from app.services.llm_gateway import GatewayLLM, Priority, get_llm_gateway
+from app.services.session_store import (
+    MEMORY_WINDOW_K,
+    DebaterMemory,
+    Session,
+    SessionStore,
+    create_session_backend,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -25,6 +34,14 @@ class TokenCalculator:
     LONG_MESSAGE_TOKENS = 20  # 50자 이상
     QUESTION_TOKENS = 15
     
+    # 질문 형태 (?, 까요, 는지, 일까 등)
+    QUESTION_MARKERS = ('?', '까요', '나요', '는지', '일까', '할까', '을까')
+    
+    @classmethod
+    def is_question(cls, message: str) -> bool:
+        """질문 형태 발언 여부"""
+        return any(marker in message for marker in cls.QUESTION_MARKERS)
+    
     @classmethod
     def calculate(cls, message: str) -> int:
         """
@@ -40,14 +57,76 @@ class TokenCalculator:
         if len(message) >= 50:
             tokens = cls.LONG_MESSAGE_TOKENS
         
-        # 질문 형태 (?, 까요, 는지, 일까 등)
-        question_markers = ['?', '까요', '나요', '는지', '일까', '할까', '을까']
-        if any(marker in message for marker in question_markers):
+        # 질문 형태
+        if cls.is_question(message):
             tokens = max(tokens, cls.QUESTION_TOKENS)
         
         return tokens
 
 
+class RenderedPrompts:
+    """
+    세션별로 렌더링된 시스템 프롬프트 및 토론 컨텍스트 헤더
+    
+    시스템 프롬프트는 강의 컨텍스트 자리({lecture_context})를 기준으로 나눠 두고,
+    턴마다 선택된 강의 발췌만 끼워 넣습니다.
+    """
+    
+    __slots__ = ("key", "james_parts", "linda_parts", "james_header", "linda_header")
+    
+    def __init__(
+        self,
+        key: tuple,
+        james_parts: List[str],
+        linda_parts: List[str],
+        james_header: str,
+        linda_header: str,
+    ):
+        self.key = key
+        self.james_parts = james_parts
+        self.linda_parts = linda_parts
+        self.james_header = james_header
+        self.linda_header = linda_header
+    
+    def system_prompt(self, debater: DebaterRole, lecture_context: str) -> str:
+        parts = self.james_parts if debater == DebaterRole.JAMES else self.linda_parts
+        return lecture_context.join(parts)
+    
+    def debate_context(self, debater: DebaterRole) -> str:
+        return self.james_header if debater == DebaterRole.JAMES else self.linda_header
+
+
+class GenerationPlan:
+    """
+    토론 턴 생성 계획 (지연 시간 예산에 따라 선택)
+    
+    mode: full(기본) | trimmed(히스토리/출력 축소) | fast(경량 모델)
+    hedge: 응답이 늦을 때 두 번째 요청을 보낼 모델 (None이면 헤지하지 않음)
+    """
+    
+    __slots__ = ("mode", "llm", "history_k", "stop", "parallel", "hedge")
+    
+    def __init__(
+        self,
+        mode: str,
+        llm: Optional[GatewayLLM],
+        history_k: int,
+        stop: Optional[List[str]] = None,
+        parallel: Optional[bool] = None,
+        hedge: Optional[GatewayLLM] = None,
+    ):
+        self.mode = mode
+        self.llm = llm
+        self.history_k = history_k
+        self.stop = stop
+        self.parallel = parallel
+        self.hedge = hedge
+    
+    def call_options(self) -> Dict[str, Any]:
+        """LLM 호출 옵션"""
+        return {"stop": self.stop} if self.stop else {}
+
+
 class DebateEngine:
     """
     AI 토론 엔진
@@ -55,35 +134,82 @@ class DebateEngine:
     """
     
     def __init__(self):
-        self.sessions: Dict[str, dict] = {}
         self.james_prompt: Optional[str] = None
         self.linda_prompt: Optional[str] = None
         
-        # LangChain 메모리 (세션별로 관리)
-        self.james_memories: Dict[str, ConversationBufferWindowMemory] = {}
-        self.linda_memories: Dict[str, ConversationBufferWindowMemory] = {}
+        # 세션 (턴 로그 + 토론자 메모리 뷰, TTL/LRU 제거)
+        self.session_store = SessionStore(
+            ttl_seconds=settings.SESSION_TTL_SECONDS,
+            max_sessions=settings.SESSION_MAX_COUNT,
+            sweep_interval_seconds=settings.SESSION_SWEEP_INTERVAL_SECONDS,
+            backend=create_session_backend(),
+        )
+        
+        # 세션별 롤링 요약 갱신 백그라운드 태스크
+        self._summary_tasks: Dict[str, asyncio.Task] = {}
+        
+        # 토론자별 추정 프롬프트 토큰 통계 (호출 수, 합계, 최대)
+        self._prompt_token_stats: Dict[str, Dict[str, int]] = {
+            name: {"calls": 0, "total_tokens": 0, "max_tokens": 0}
+            for name in ("james", "linda")
+        }
+        
+        # 지연 시간 예산별 생성 모드 사용 횟수
+        self._generation_modes: Dict[str, int] = {"full": 0, "trimmed": 0, "fast": 0}
         
-        # NVIDIA LLM 초기화
-        self.llm: Optional[ChatNVIDIA] = None
+        # NVIDIA LLM 초기화 (LLM 게이트웨이 경유)
+        self.llm: Optional[GatewayLLM] = None
+        # 지연 시간 예산 모드용 모델 핸들 (max_tokens 축소 / 경량 모델)
+        self.trimmed_llm: Optional[GatewayLLM] = None
+        self.fast_llm: Optional[GatewayLLM] = None
+        # 헤지 요청용 모델 핸들 (LLM_HEDGE_ENABLED)
+        self.hedge_llm: Optional[GatewayLLM] = None
         self._init_llm()
         self._load_prompts()
     
+    def start(self):
+        """백그라운드 작업 시작 (앱 시작 시 호출)"""
+        self.session_store.start_sweeper()
+    
+    async def aclose(self):
+        """백그라운드 작업 정리 및 세션 백엔드 종료 (앱 종료 시 호출)"""
+        tasks = list(self._summary_tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.session_store.stop_sweeper()
+        self.session_store.close()
+    
     def _init_llm(self):
-        """NVIDIA ChatNVIDIA LLM 초기화"""
-        if settings.NVIDIA_API_KEY:
-            try:
-                self.llm = ChatNVIDIA(
-                    model="ai-llama-3_3-70b-instruct",
-                    nvidia_api_key=settings.NVIDIA_API_KEY,
+        """NVIDIA LLM 초기화 (토론 턴 우선순위로 게이트웨이에 연결)"""
+        gateway = get_llm_gateway()
+        self.llm = gateway.bind(
+            model=settings.DEBATE_MODEL,
+            temperature=0.7,
+            max_tokens=256,
+            priority=Priority.DEBATE,
+        )
+        if self.llm:
+            self.trimmed_llm = gateway.bind(
+                model=settings.DEBATE_MODEL,
+                temperature=0.7,
+                max_tokens=160,
+                priority=Priority.DEBATE,
+            )
+            self.fast_llm = gateway.bind(
+                model=settings.DEBATE_FAST_MODEL,
+                temperature=0.7,
+                max_tokens=128,
+                priority=Priority.DEBATE,
+            )
+            if settings.LLM_HEDGE_ENABLED:
+                self.hedge_llm = gateway.bind(
+                    model=settings.LLM_HEDGE_MODEL or settings.DEBATE_MODEL,
                     temperature=0.7,
                     max_tokens=256,
+                    priority=Priority.DEBATE,
                 )
-                logger.info("NVIDIA LLM 초기화 완료")
-            except Exception as e:
-                logger.warning(f"NVIDIA LLM 초기화 실패: {e}")
-                self.llm = None
-        else:
-            logger.warning("NVIDIA_API_KEY가 설정되지 않았습니다.")
+            logger.info("NVIDIA LLM 초기화 완료")
     
     def _load_prompts(self):
         """시스템 프롬프트 로드"""
@@ -175,34 +301,17 @@ class DebateEngine:
         return "미정", "비판적 관점", "지지적 관점"
 
     def _get_session_context(self, session_id: str) -> Dict[str, str]:
-        """세션별 토론 컨텍스트 조회 및 보정"""
-        session = self.sessions.get(session_id, {})
-
-        topic = (session.get("topic") or "").strip() or "자유 토론"
-        session["topic"] = topic
-
-        user_position = session.get("user_position") or ""
-        user_position_label = session.get("user_position_label")
-        james_position = session.get("james_position")
-        linda_position = session.get("linda_position")
-
-        if not (user_position_label and james_position and linda_position):
-            derived_user_label, derived_james, derived_linda = self._derive_positions(user_position)
-            user_position_label = user_position_label or derived_user_label
-            james_position = james_position or derived_james
-            linda_position = linda_position or derived_linda
-            session["user_position_label"] = user_position_label
-            session["james_position"] = james_position
-            session["linda_position"] = linda_position
-
-        lecture_context = session.get("lecture_context") or ""
+        """세션별 토론 컨텍스트 조회"""
+        return self._session_context(self.session_store.get(session_id) or Session())
 
+    def _session_context(self, session: Session) -> Dict[str, str]:
+        """세션 객체의 토론 컨텍스트"""
         return {
-            "topic": topic,
-            "user_position_label": user_position_label,
-            "james_position": james_position,
-            "linda_position": linda_position,
-            "lecture_context": lecture_context,
+            "topic": session.topic,
+            "user_position_label": session.user_position_label,
+            "james_position": session.james_position,
+            "linda_position": session.linda_position,
+            "lecture_context": session.lecture_context or "",
         }
 
     def _apply_prompt_context(
@@ -214,6 +323,16 @@ class DebateEngine:
     ) -> str:
         """프롬프트에 토론 컨텍스트 치환 적용"""
         context = self._get_session_context(session_id)
+        return self._render_prompt(prompt, context, lecture_context, debater)
+
+    def _render_prompt(
+        self,
+        prompt: str,
+        context: Dict[str, str],
+        lecture_context: str,
+        debater: DebaterRole,
+    ) -> str:
+        """프롬프트 템플릿 렌더링"""
         ai_position = (
             context["james_position"]
             if debater == DebaterRole.JAMES
@@ -236,9 +355,23 @@ class DebateEngine:
 
         return prompt
 
+    def _render_prompt_parts(
+        self,
+        prompt: str,
+        context: Dict[str, str],
+        debater: DebaterRole,
+    ) -> List[str]:
+        """강의 컨텍스트를 제외한 치환을 적용하고 {lecture_context} 자리에서 분할"""
+        marker = "\x00lecture\x00"
+        rendered = self._render_prompt(prompt.replace("{lecture_context}", marker), context, "", debater)
+        return rendered.split(marker)
+
     def _build_debate_context(self, session_id: str, debater: DebaterRole) -> str:
         """현재 토론 상태를 사용자 입력에 포함하기 위한 컨텍스트 구성"""
-        context = self._get_session_context(session_id)
+        return self._render_debate_context(self._get_session_context(session_id), debater)
+
+    def _render_debate_context(self, context: Dict[str, str], debater: DebaterRole) -> str:
+        """토론 컨텍스트 헤더 렌더링"""
         ai_position = (
             context["james_position"]
             if debater == DebaterRole.JAMES
@@ -250,21 +383,138 @@ class DebateEngine:
             f"당신의 입장: {ai_position}",
         ])
     
+    def _get_rendered_prompts(self, session: Session) -> RenderedPrompts:
+        """
+        세션별 렌더링된 프롬프트 조회
+        
+        토론 주제/입장이 바뀐 경우에만 다시 렌더링하고,
+        결과는 세션 객체에 캐시합니다 (세션 백엔드에는 저장하지 않음).
+        강의 컨텍스트는 턴마다 _get_lecture_excerpt로 따로 채웁니다.
+        """
+        context = self._session_context(session)
+        key = (
+            context["topic"],
+            context["user_position_label"],
+            context["james_position"],
+            context["linda_position"],
+        )
+        
+        if session.prompts and session.prompts.key == key:
+            return session.prompts
+        
+        prompts = RenderedPrompts(
+            key=key,
+            james_parts=self._render_prompt_parts(self.james_prompt, context, DebaterRole.JAMES),
+            linda_parts=self._render_prompt_parts(self.linda_prompt, context, DebaterRole.LINDA),
+            james_header=self._render_debate_context(context, DebaterRole.JAMES),
+            linda_header=self._render_debate_context(context, DebaterRole.LINDA),
+        )
+        session.prompts = prompts
+        return prompts
+    
+    def _get_lecture_excerpt(self, session: Session, user_message: str, lecture_context: str = "") -> str:
+        """
+        이번 턴 프롬프트에 넣을 강의 컨텍스트
+        
+        강의 컨텍스트가 LECTURE_RETRIEVAL_MIN_CHARS 이상이면 세션별 BM25 인덱스에서
+        사용자 발언과 관련된 상위 LECTURE_RETRIEVAL_TOP_K개 청크만 사용합니다.
+        """
+        effective_lecture_context = lecture_context.strip() if lecture_context else session.lecture_context
+        if not effective_lecture_context:
+            return "일반적인 토론"
+        if (
+            not settings.LECTURE_RETRIEVAL_ENABLED
+            or len(effective_lecture_context) < settings.LECTURE_RETRIEVAL_MIN_CHARS
+        ):
+            return effective_lecture_context
+        
+        # 강의 컨텍스트가 바뀐 경우에만 인덱스 재구성
+        index = session.lecture_index
+        if index is None or index.source != effective_lecture_context:
+            index = LectureIndex(effective_lecture_context, settings.LECTURE_CHUNK_CHARS)
+            session.lecture_index = index
+        return index.search(user_message, settings.LECTURE_RETRIEVAL_TOP_K)
+    
     def _get_session_memory(
         self, 
         session_id: str, 
-        debater: DebaterRole
-    ) -> ConversationBufferWindowMemory:
-        """세션별 메모리 가져오기 또는 생성"""
-        memories = self.james_memories if debater == DebaterRole.JAMES else self.linda_memories
-        
-        if session_id not in memories:
-            memories[session_id] = ConversationBufferWindowMemory(
-                k=10,
-                return_messages=True,
-            )
+        debater: DebaterRole,
+        k: int = MEMORY_WINDOW_K,
+    ) -> DebaterMemory:
+        """세션별 토론자 메모리 뷰 가져오기 (세션이 없으면 생성)"""
+        session = self.session_store.get(session_id)
+        if session is None:
+            session = self._create_session(session_id)
+        
+        return session.memory_for(debater, k)
+    
+    def _default_plan(self) -> GenerationPlan:
+        """기본 생성 계획 (지연 시간 예산 없음, 통계에 집계하지 않음)"""
+        return GenerationPlan("full", self.llm, MEMORY_WINDOW_K, hedge=self.hedge_llm)
+    
+    def _plan_generation(self, user_message: str, latency_budget_ms: Optional[int] = None) -> GenerationPlan:
+        """
+        지연 시간 예산에 맞는 생성 계획 선택
+        
+        - 예산 없음 / DEBATE_LATENCY_FULL_MS 이상: 기본 모델, 전체 히스토리 (full)
+        - DEBATE_LATENCY_FAST_MS 이상: 기본 모델, max_tokens/히스토리 축소, 병렬 생성 (trimmed)
+        - 그 미만: 경량 모델, 최소 히스토리, 병렬 생성 (fast)
+        
+        축소 모드에서는 2~3문장 답변을 넘기지 않도록 빈 줄에서 생성을 멈추고,
+        긴 발언은 입력 자체가 크므로 히스토리를 한 단계 더 줄입니다.
+        """
+        if (
+            latency_budget_ms is None
+            or latency_budget_ms >= settings.DEBATE_LATENCY_FULL_MS
+            or not (self.trimmed_llm and self.fast_llm)
+        ):
+            plan = self._default_plan()
+        else:
+            long_message = TokenCalculator.calculate(user_message) == TokenCalculator.LONG_MESSAGE_TOKENS
+            if latency_budget_ms >= settings.DEBATE_LATENCY_FAST_MS:
+                plan = GenerationPlan(
+                    "trimmed", self.trimmed_llm, 3 if long_message else 4, stop=["\n\n"], parallel=True,
+                    hedge=self.hedge_llm,
+                )
+            else:
+                # 경량 모델은 같은 모델로 헤지
+                plan = GenerationPlan(
+                    "fast", self.fast_llm, 1 if long_message else 2, stop=["\n\n"], parallel=True,
+                    hedge=self.fast_llm if self.hedge_llm else None,
+                )
         
-        return memories[session_id]
+        self._generation_modes[plan.mode] += 1
+        return plan
+    
+    def _create_session(
+        self,
+        session_id: str,
+        topic: str = "",
+        user_position: str = "",
+        lecture_context: str = "",
+    ) -> Session:
+        """세션 생성 및 저장"""
+        normalized_topic = (topic or "").strip() or "자유 토론"
+        user_position_label, james_position, linda_position = self._derive_positions(user_position)
+
+        session = Session(
+            topic=normalized_topic,
+            user_position=user_position,
+            user_position_label=user_position_label,
+            james_position=james_position,
+            linda_position=linda_position,
+            lecture_context=lecture_context,
+        )
+        return self.session_store.put(session_id, session)
+    
+    def _get_or_create_session(self, session_id: str, lecture_context: str = "") -> Session:
+        """메시지 처리용 세션 조회 (없으면 생성, 강의 컨텍스트 갱신)"""
+        session = self.session_store.get(session_id)
+        if session is None:
+            session = self._create_session(session_id, lecture_context=lecture_context)
+        elif lecture_context:
+            session.lecture_context = lecture_context
+        return session
     
     async def initialize_session(
         self,
@@ -272,7 +522,7 @@ class DebateEngine:
         topic: str = "",
         user_position: str = "",
         lecture_context: str = "",
-    ) -> dict:
+    ) -> Session:
         """
         토론 세션 초기화
         
@@ -285,163 +535,395 @@ class DebateEngine:
         Returns:
             세션 정보
         """
-        normalized_topic = (topic or "").strip() or "자유 토론"
-        user_position_label, james_position, linda_position = self._derive_positions(user_position)
-
-        self.sessions[session_id] = {
-            "topic": normalized_topic,
-            "user_position": user_position,
-            "user_position_label": user_position_label,
-            "james_position": james_position,
-            "linda_position": linda_position,
-            "lecture_context": lecture_context,
-            "history": [],
-            "total_tokens_earned": 0,
-        }
-        
-        # 세션별 메모리 초기화
-        self.james_memories[session_id] = ConversationBufferWindowMemory(
-            k=10, return_messages=True
-        )
-        self.linda_memories[session_id] = ConversationBufferWindowMemory(
-            k=10, return_messages=True
+        session = self._create_session(
+            session_id,
+            topic=topic,
+            user_position=user_position,
+            lecture_context=lecture_context,
         )
         
-        return self.sessions[session_id]
+        # 세션 프롬프트 미리 렌더링
+        self._get_rendered_prompts(session)
+        return session
     
     async def process_message(
         self,
         session_id: str,
         user_message: str,
         lecture_context: str = "",
+        parallel: Optional[bool] = None,
+        latency_budget_ms: Optional[int] = None,
+        on_reply: Optional[Callable[[str, str], None]] = None,
     ) -> Tuple[str, str, int]:
         """
         3자 토론 메시지 처리 (User → James → Linda 순차 응답)
         
+        병렬 모드에서는 James와 Linda 응답을 동시에 생성합니다.
+        이때 Linda는 James 응답 없이 사용자 발언만 보고 답변합니다.
+        
+        턴은 두 응답이 모두 생성된 뒤에만 기록되므로, 그 전에 취소되면
+        (클라이언트 연결 끊김 등) 진행 중인 LLM 호출도 취소되고 턴 전체가 버려집니다.
+        
         Args:
             session_id: 세션 ID
             user_message: 사용자 메시지
             lecture_context: 강의 컨텍스트
+            parallel: 병렬 생성 여부 (None이면 지연 시간 예산 모드 또는 설정값 DEBATE_PARALLEL_MODE 사용)
+            latency_budget_ms: 응답 지연 시간 예산 (지정 시 모델/출력 길이/히스토리 깊이 조정)
+            on_reply: 토론자 응답이 생성되는 즉시 (debater, response)로 호출 (음성 사전 합성 등)
             
         Returns:
             (james_response, linda_response, tokens_earned) 튜플
         """
-        # 세션 초기화 (없는 경우)
-        if session_id not in self.sessions:
-            await self.initialize_session(session_id, lecture_context=lecture_context)
-        elif lecture_context:
-            self.sessions[session_id]["lecture_context"] = lecture_context
+        # 같은 세션의 턴은 순서대로 처리 (다른 세션은 병렬 처리)
+        async with self.session_store.lock(session_id):
+            # 세션 조회 (없는 경우 초기화)
+            session = self._get_or_create_session(session_id, lecture_context)
+            session.last_prompt_tokens = {}
+            
+            # 토큰 계산
+            tokens_earned = TokenCalculator.calculate(user_message)
+            
+            # 지연 시간 예산에 따른 생성 계획
+            plan = self._plan_generation(user_message, latency_budget_ms)
+            if parallel is None:
+                parallel = plan.parallel if plan.parallel is not None else settings.DEBATE_PARALLEL_MODE
+            
+            if parallel:
+                # James/Linda 동시 생성 (Linda는 James 응답과 독립적인 프롬프트 사용)
+                # on_reply는 각 응답이 끝나는 즉시 호출 (느린 쪽을 기다리지 않음)
+                async def reply(debater: str, response: Awaitable[Tuple[str, bool]]) -> Tuple[str, bool]:
+                    result = await response
+                    if on_reply:
+                        on_reply(debater, result[0])
+                    return result
+                
+                (james_response, james_from_llm), (linda_response, linda_from_llm) = await asyncio.gather(
+                    reply("james", self._get_james_response(session, user_message, lecture_context, plan)),
+                    reply("linda", self._get_linda_response(session, user_message, "", lecture_context, plan)),
+                )
+            else:
+                # James 응답 생성
+                james_response, james_from_llm = await self._get_james_response(
+                    session, user_message, lecture_context, plan
+                )
+                if on_reply:
+                    on_reply("james", james_response)
+                
+                # Linda 응답 생성 (James 응답 참고)
+                linda_response, linda_from_llm = await self._get_linda_response(
+                    session, user_message, james_response, lecture_context, plan
+                )
+                if on_reply:
+                    on_reply("linda", linda_response)
+            
+            # 턴 기록 (히스토리 + 토론자 메모리)
+            self._commit_turn(
+                session_id,
+                session,
+                user_message,
+                [("james", james_response, james_from_llm), ("linda", linda_response, linda_from_llm)],
+                tokens_earned,
+            )
+            
+            return james_response, linda_response, tokens_earned
+    
+    async def stream_message(
+        self,
+        session_id: str,
+        user_message: str,
+        lecture_context: str = "",
+        latency_budget_ms: Optional[int] = None,
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        3자 토론 메시지 스트리밍 처리 (User → James → Linda 순차 응답)
         
-        # 토큰 계산
-        tokens_earned = TokenCalculator.calculate(user_message)
-        self.sessions[session_id]["total_tokens_earned"] += tokens_earned
+        James와 Linda 응답을 토큰 단위로 생성하며 (event, data) 튜플을 내보냅니다.
+        히스토리와 두 토론자의 메모리는 Linda 응답까지 완료된 뒤 한 번에 저장합니다.
+        그 전에 스트림이 닫히거나 취소되면 (클라이언트 연결 끊김 등) 진행 중인 LLM 스트림을
+        닫고 이미 내보낸 James 응답을 포함해 턴 전체를 버립니다.
         
-        # James 응답 생성
-        james_response = await self._get_james_response(
-            session_id, user_message, lecture_context
-        )
+        이벤트 순서:
+            james_delta* → james_done → linda_delta* → linda_done → tokens_earned
         
-        # Linda 응답 생성 (James 응답 참고)
-        linda_response = await self._get_linda_response(
-            session_id, user_message, james_response, lecture_context
-        )
+        Args:
+            session_id: 세션 ID
+            user_message: 사용자 메시지
+            lecture_context: 강의 컨텍스트
+            latency_budget_ms: 응답 지연 시간 예산 (지정 시 모델/출력 길이/히스토리 깊이 조정)
+            
+        Yields:
+            (event, data) 튜플
+        """
+        # 같은 세션의 턴은 순서대로 처리 (다른 세션은 병렬 처리)
+        async with self.session_store.lock(session_id):
+            # 세션 조회 (없는 경우 초기화)
+            session = self._get_or_create_session(session_id, lecture_context)
+            plan = self._plan_generation(user_message, latency_budget_ms)
+            
+            # James 응답 스트리밍
+            james_parts: List[str] = []
+            james_from_llm = False
+            james_messages = (
+                self._build_james_messages(session, user_message, lecture_context, plan.history_k)
+                if plan.llm else []
+            )
+            james_prompt_tokens = self._record_prompt_tokens(session, "james", james_messages)
+            async for delta, from_llm in self._astream_response(
+                james_messages, self._get_stub_james_response(user_message), "James", plan
+            ):
+                james_parts.append(delta)
+                james_from_llm = from_llm
+                yield "james_delta", {"delta": delta}
+            james_response = "".join(james_parts)
+            yield "james_done", {"message": james_response, "prompt_tokens": james_prompt_tokens}
+            
+            # Linda 응답 스트리밍 (James 응답 참고)
+            linda_parts: List[str] = []
+            linda_from_llm = False
+            linda_messages = (
+                self._build_linda_messages(
+                    session, user_message, james_response, lecture_context, plan.history_k
+                )
+                if plan.llm else []
+            )
+            linda_prompt_tokens = self._record_prompt_tokens(session, "linda", linda_messages)
+            async for delta, from_llm in self._astream_response(
+                linda_messages, self._get_stub_linda_response(user_message), "Linda", plan
+            ):
+                linda_parts.append(delta)
+                linda_from_llm = from_llm
+                yield "linda_delta", {"delta": delta}
+            linda_response = "".join(linda_parts)
+            yield "linda_done", {"message": linda_response, "prompt_tokens": linda_prompt_tokens}
+            
+            # 토큰 계산 및 턴 기록 (히스토리 + 토론자 메모리)
+            tokens_earned = TokenCalculator.calculate(user_message)
+            self._commit_turn(
+                session_id,
+                session,
+                user_message,
+                [("james", james_response, james_from_llm), ("linda", linda_response, linda_from_llm)],
+                tokens_earned,
+            )
+            
+            yield "tokens_earned", {
+                "tokens_earned": tokens_earned,
+                "total_tokens_earned": session.total_tokens_earned,
+            }
+    
+    async def _astream_response(
+        self,
+        messages: list,
+        fallback: str,
+        debater_name: str,
+        plan: Optional[GenerationPlan] = None,
+    ) -> AsyncIterator[Tuple[str, bool]]:
+        """
+        LLM 응답을 토큰 단위로 스트리밍
         
-        # 히스토리 저장
-        self._add_to_history(session_id, "user", user_message)
-        self._add_to_history(session_id, "james", james_response)
-        self._add_to_history(session_id, "linda", linda_response)
+        (delta, from_llm) 튜플을 내보냅니다. LLM이 없거나 첫 토큰 전에 실패하면
+        스텁 응답 전체를 하나의 delta로 내보냅니다. 스트리밍 도중 실패하면
+        그때까지 생성된 내용만 사용합니다.
         
-        return james_response, linda_response, tokens_earned
+        첫 토큰이 DEBATE_LLM_TIMEOUT_SECONDS 안에 오지 않으면 스텁 응답을 사용합니다.
+        """
+        emitted = False
+        llm = plan.llm if plan else self.llm
+        if llm:
+            stream = llm.astream(messages, **(plan.call_options() if plan else {}))
+            timeout = settings.DEBATE_LLM_TIMEOUT_SECONDS or None
+            try:
+                while True:
+                    try:
+                        # 첫 토큰까지만 마감 시간 적용
+                        chunk = await asyncio.wait_for(stream.__anext__(), None if emitted else timeout)
+                    except StopAsyncIteration:
+                        break
+                    if chunk.content:
+                        emitted = True
+                        yield chunk.content, True
+            except asyncio.TimeoutError as e:
+                logger.error(f"{debater_name} 스트리밍 첫 토큰 시간 초과 ({timeout}s)")
+                # 마감 시간 초과로 취소된 스트림은 guard에서 실패로 기록되지 않으므로 여기서 기록
+                llm.gateway.breaker.record_failure(e)
+            except Exception as e:
+                logger.error(f"{debater_name} 스트리밍 응답 생성 실패: {e!r}")
+            finally:
+                await stream.aclose()
+        
+        if not emitted:
+            yield fallback, False
     
     async def _get_james_response(
         self,
-        session_id: str,
+        session: Session,
         user_message: str,
         lecture_context: str = "",
-    ) -> str:
-        """제임스 응답 생성"""
-        if not self.llm:
-            return self._get_stub_james_response(user_message)
+        plan: Optional[GenerationPlan] = None,
+    ) -> Tuple[str, bool]:
+        """제임스 응답 생성 (응답, LLM 생성 여부)"""
+        plan = plan or self._default_plan()
+        if not plan.llm:
+            return self._get_stub_james_response(user_message), False
         
         try:
-            # 프롬프트에 토론 컨텍스트 적용
-            system_prompt = self._apply_prompt_context(
-                self.james_prompt, session_id, lecture_context, DebaterRole.JAMES
-            )
-            
-            # 메모리에서 대화 히스토리 가져오기
-            memory = self._get_session_memory(session_id, DebaterRole.JAMES)
-            chat_history = memory.chat_memory.messages
-            
-            # 메시지 구성
-            debate_context = self._build_debate_context(session_id, DebaterRole.JAMES)
-            messages = [SystemMessage(content=system_prompt)]
-            messages.extend(chat_history)
-            messages.append(HumanMessage(content=f"{debate_context}\n\n[사용자 발언]: {user_message}"))
-            
-            # LLM 호출
-            response = await self.llm.ainvoke(messages)
-            james_response = response.content
-            
-            # 메모리에 저장
-            memory.chat_memory.add_user_message(user_message)
-            memory.chat_memory.add_ai_message(james_response)
+            messages = self._build_james_messages(session, user_message, lecture_context, plan.history_k)
+            self._record_prompt_tokens(session, "james", messages)
             
-            return james_response
+            # LLM 호출 (마감 시간 + 헤지)
+            response = await self._invoke_debater(plan, messages)
+            return response.content, True
             
         except Exception as e:
-            logger.error(f"James 응답 생성 실패: {e}")
-            return self._get_stub_james_response(user_message)
+            logger.error(f"James 응답 생성 실패: {e!r}")
+            return self._get_stub_james_response(user_message), False
     
     async def _get_linda_response(
         self,
-        session_id: str,
+        session: Session,
         user_message: str,
         james_response: str,
         lecture_context: str = "",
-    ) -> str:
-        """린다 응답 생성 (제임스 응답 참고)"""
-        if not self.llm:
-            return self._get_stub_linda_response(user_message)
+        plan: Optional[GenerationPlan] = None,
+    ) -> Tuple[str, bool]:
+        """린다 응답 생성 (제임스 응답 참고) (응답, LLM 생성 여부)"""
+        plan = plan or self._default_plan()
+        if not plan.llm:
+            return self._get_stub_linda_response(user_message), False
         
         try:
-            # 프롬프트에 토론 컨텍스트 적용
-            system_prompt = self._apply_prompt_context(
-                self.linda_prompt, session_id, lecture_context, DebaterRole.LINDA
+            messages = self._build_linda_messages(
+                session, user_message, james_response, lecture_context, plan.history_k
             )
+            self._record_prompt_tokens(session, "linda", messages)
             
-            # 메모리에서 대화 히스토리 가져오기
-            memory = self._get_session_memory(session_id, DebaterRole.LINDA)
-            chat_history = memory.chat_memory.messages
+            # LLM 호출 (마감 시간 + 헤지)
+            response = await self._invoke_debater(plan, messages)
+            return response.content, True
             
-            # 린다에게 제공할 컨텍스트: 사용자 메시지 + 제임스 응답
-            debate_context = self._build_debate_context(session_id, DebaterRole.LINDA)
-            combined_context = f"""{debate_context}
+        except Exception as e:
+            logger.error(f"Linda 응답 생성 실패: {e!r}")
+            return self._get_stub_linda_response(user_message), False
+    
+    async def _invoke_debater(self, plan: GenerationPlan, messages: list) -> Any:
+        """토론자 LLM 호출 (DEBATE_LLM_TIMEOUT_SECONDS 마감 시간, 계획에 헤지 모델이 있으면 헤지)"""
+        return await get_llm_gateway().invoke_with_deadline(
+            plan.llm,
+            messages,
+            timeout=settings.DEBATE_LLM_TIMEOUT_SECONDS,
+            hedge=plan.hedge,
+            **plan.call_options(),
+        )
+    
+    def _build_james_messages(
+        self,
+        session: Session,
+        user_message: str,
+        lecture_context: str = "",
+        history_k: int = MEMORY_WINDOW_K,
+    ) -> list:
+        """제임스 LLM 입력 메시지 구성"""
+        # 세션별로 렌더링된 프롬프트 (토론 컨텍스트 적용) + 이번 턴 강의 발췌
+        prompts = self._get_rendered_prompts(session)
+        system_prompt = prompts.system_prompt(
+            DebaterRole.JAMES, self._get_lecture_excerpt(session, user_message, lecture_context)
+        )
+        
+        # 메모리에서 대화 히스토리 가져오기
+        memory = session.memory_for(DebaterRole.JAMES, history_k)
+        chat_history = memory.messages
+        
+        # 메시지 구성
+        debate_context = prompts.james_header
+        messages = [SystemMessage(content=self._with_memory_summary(session, system_prompt))]
+        messages.extend(chat_history)
+        messages.append(HumanMessage(content=f"{debate_context}\n\n[사용자 발언]: {user_message}"))
+        return messages
+    
+    def _build_linda_messages(
+        self,
+        session: Session,
+        user_message: str,
+        james_response: str,
+        lecture_context: str = "",
+        history_k: int = MEMORY_WINDOW_K,
+    ) -> list:
+        """린다 LLM 입력 메시지 구성"""
+        # 세션별로 렌더링된 프롬프트 (토론 컨텍스트 적용) + 이번 턴 강의 발췌
+        prompts = self._get_rendered_prompts(session)
+        system_prompt = prompts.system_prompt(
+            DebaterRole.LINDA, self._get_lecture_excerpt(session, user_message, lecture_context)
+        )
+        
+        # 메모리에서 대화 히스토리 가져오기
+        memory = session.memory_for(DebaterRole.LINDA, history_k)
+        chat_history = memory.messages
+        
+        # 린다에게 제공할 컨텍스트: 사용자 메시지 + 제임스 응답 (있는 경우)
+        combined_context = self._build_linda_input(prompts.linda_header, user_message, james_response)
+        
+        messages = [SystemMessage(content=self._with_memory_summary(session, system_prompt))]
+        messages.extend(chat_history)
+        messages.append(HumanMessage(content=combined_context))
+        return messages
+    
+    def _with_memory_summary(self, session: Session, system_prompt: str) -> str:
+        """token_budget 메모리 모드에서 예산 밖으로 밀려난 이전 대화를 롤링 요약으로 대체"""
+        if settings.DEBATE_MEMORY_MODE != "token_budget":
+            return system_prompt
+        if not session.summary:
+            return system_prompt
+        return f"{system_prompt}\n\n[이전 대화 요약]\n{session.summary}"
+    
+    def _record_prompt_tokens(self, session: Session, debater_name: str, messages: list) -> int:
+        """LLM 호출 1회의 추정 프롬프트 토큰 수 기록"""
+        if not messages:
+            return 0
+        tokens = estimate_message_tokens(messages)
+        stats = self._prompt_token_stats[debater_name]
+        stats["calls"] += 1
+        stats["total_tokens"] += tokens
+        stats["max_tokens"] = max(stats["max_tokens"], tokens)
+        session.last_prompt_tokens[debater_name] = tokens
+        logger.debug(f"{debater_name} 프롬프트 추정 토큰: {tokens}")
+        return tokens
+    
+    def prompt_token_stats(self) -> Dict[str, Any]:
+        """토론자별 추정 프롬프트 토큰 통계"""
+        return {
+            "memory_mode": settings.DEBATE_MEMORY_MODE,
+            "generation_modes": dict(self._generation_modes),
+            **{
+                name: {
+                    **stats,
+                    "avg_tokens": stats["total_tokens"] // stats["calls"] if stats["calls"] else 0,
+                }
+                for name, stats in self._prompt_token_stats.items()
+            },
+        }
+    
+    def _build_linda_input(
+        self,
+        debate_context: str,
+        user_message: str,
+        james_response: str,
+    ) -> str:
+        """린다 입력 메시지 구성 (제임스 응답이 없으면 사용자 발언만 사용)"""
+        if not james_response:
+            return f"""{debate_context}
+
+[사용자 발언]: {user_message}
+
+위 발언에 대해, 사용자의 주장을 지지하는 관점에서 토론 주제에 맞춰 응답해주세요."""
+
+        return f"""{debate_context}
 
 [사용자 발언]: {user_message}
 
 [제임스의 의견]: {james_response}
 
 위 내용을 참고하여, 사용자의 주장을 지지하는 관점에서 토론 주제에 맞춰 응답해주세요."""
-            
-            # 메시지 구성
-            messages = [SystemMessage(content=system_prompt)]
-            messages.extend(chat_history)
-            messages.append(HumanMessage(content=combined_context))
-            
-            # LLM 호출
-            response = await self.llm.ainvoke(messages)
-            linda_response = response.content
-            
-            # 메모리에 저장
-            memory.chat_memory.add_user_message(user_message)
-            memory.chat_memory.add_ai_message(linda_response)
-            
-            return linda_response
-            
-        except Exception as e:
-            logger.error(f"Linda 응답 생성 실패: {e}")
-            return self._get_stub_linda_response(user_message)
     
     def _get_stub_james_response(self, user_message: str) -> str:
         """제임스 스텁 응답"""
@@ -453,15 +935,15 @@ class DebateEngine:
 
     def _fallback_report(self, session_id: str, ocr_text: str = "") -> dict:
         """LLM 실패 시 기본 리포트 생성"""
-        session = self.sessions.get(session_id, {})
-        history = session.get("history", [])
-        user_messages = [h.get("message", "") for h in history if h.get("role") == "user"]
-        avg_len = int(sum(len(m) for m in user_messages) / max(len(user_messages), 1)) if user_messages else 0
+        session = self.get_session(session_id) or Session(topic="")
+        # 누적 통계 사용 (전체 기록을 다시 훑지 않음)
+        user_turns = session.user_turn_count
+        avg_len = session.user_char_count // user_turns if user_turns else 0
 
-        base = 60 if user_messages else 40
+        base = 60 if user_turns else 40
         logic = min(90, base + min(30, avg_len // 4))
         persuasion = min(90, base + min(25, avg_len // 5))
-        topic = min(90, base + (10 if session.get("topic") else 0))
+        topic = min(90, base + (10 if session.topic else 0))
 
         report = {
             "logic_score": logic,
@@ -531,20 +1013,47 @@ class DebateEngine:
         Returns:
             AI 응답 텍스트
         """
-        if debater == DebaterRole.JAMES:
-            return await self._get_james_response(session_id, user_message, lecture_context)
-        else:
-            return await self._get_linda_response(session_id, user_message, "", lecture_context)
+        # 같은 세션의 턴은 순서대로 처리
+        async with self.session_store.lock(session_id):
+            session = self._get_or_create_session(session_id)
+            if debater == DebaterRole.JAMES:
+                role = "james"
+                response, from_llm = await self._get_james_response(session, user_message, lecture_context)
+            else:
+                role = "linda"
+                response, from_llm = await self._get_linda_response(session, user_message, "", lecture_context)
+            
+            # 토론자 메모리가 턴 로그의 뷰이므로 단일 응답도 턴으로 기록
+            self._commit_turn(
+                session_id,
+                session,
+                user_message,
+                [(role, response, from_llm)],
+            )
+            return response
 
     async def generate_report(self, session_id: str, ocr_text: str = "") -> dict:
         """토론 성장 리포트 생성"""
-        session = self.sessions.get(session_id)
+        # 진행 중인 요약 갱신은 잠깐만 기다림 (실패/지연 시에는 현재 요약 + 요약되지 않은 턴 원문 사용)
+        pending_summary = self._summary_tasks.get(session_id)
+        if pending_summary is not None and settings.DEBATE_REPORT_SUMMARY_WAIT_SECONDS > 0:
+            await asyncio.wait({pending_summary}, timeout=settings.DEBATE_REPORT_SUMMARY_WAIT_SECONDS)
+        
+        session = self.get_session(session_id)
         if not session:
             raise ValueError("세션을 찾을 수 없습니다.")
 
-        history = session.get("history", [])
+        # 롤링 요약 + 요약되지 않은 모든 턴 (모든 턴이 요약 또는 원문 중 하나에 포함)
         transcript = "\n".join(
-            [f"{h.get('role')}: {h.get('message')}" for h in history]
+            [f"{role}: {message}" for role, message in session.turns.iter_range(session.summarized_turns)]
+        )
+        
+        user_turns = session.user_turn_count
+        stats = (
+            f"사용자 발언 {user_turns}회, "
+            f"평균 {session.user_char_count // user_turns if user_turns else 0}자, "
+            f"질문 {session.question_count}회, "
+            f"전체 턴 {len(session.turns)}개"
         )
 
         if not self.llm:
@@ -552,7 +1061,7 @@ class DebateEngine:
 
         system_prompt = "\n".join([
             "당신은 토론 코치이자 평가자입니다.",
-            "다음 토론 기록을 보고 성장 리포트를 생성하세요.",
+            "다음 토론 요약과 최근 토론 기록을 보고 성장 리포트를 생성하세요.",
             "출력은 반드시 JSON만 반환하세요.",
             "JSON 스키마:",
             "{",
@@ -567,10 +1076,14 @@ class DebateEngine:
         ])
 
         user_prompt = "\n".join([
-            f"토론 주제: {session.get('topic')}",
-            f"사용자 입장: {session.get('user_position_label')}",
+            f"토론 주제: {session.topic}",
+            f"사용자 입장: {session.user_position_label}",
+            f"발언 통계: {stats}",
             "",
-            "토론 기록:",
+            "이전 토론 요약:",
+            session.summary or "(없음)",
+            "",
+            "최근 토론 기록:",
             transcript or "(기록 없음)",
             "",
             "OCR 텍스트:",
@@ -581,7 +1094,7 @@ class DebateEngine:
             response = await self.llm.ainvoke([
                 SystemMessage(content=system_prompt),
                 HumanMessage(content=user_prompt),
-            ])
+            ], priority=Priority.REPORT)
             parsed = self._parse_report_json(response.content or "")
             if not parsed:
                 return self._fallback_report(session_id, ocr_text)
@@ -590,9 +1103,112 @@ class DebateEngine:
             logger.error(f"리포트 생성 실패: {e}")
             return self._fallback_report(session_id, ocr_text)
     
-    def get_session(self, session_id: str) -> Optional[dict]:
+    def get_prompt_tokens(self, session_id: str) -> Optional[Dict[str, int]]:
+        """세션의 마지막 턴 토론자별 추정 프롬프트 토큰 수 (LLM 미호출 시 None)"""
+        session = self.session_store.get(session_id, touch=False)
+        if session is None or not session.last_prompt_tokens:
+            return None
+        return dict(session.last_prompt_tokens)
+    
+    def get_session(self, session_id: str) -> Optional[Session]:
         """세션 정보 조회"""
-        return self.sessions.get(session_id)
+        return self.session_store.get(session_id)
+    
+    def _commit_turn(
+        self,
+        session_id: str,
+        session: Session,
+        user_message: str,
+        replies: List[Tuple[str, str, bool]],
+        tokens_earned: int = 0,
+    ):
+        """
+        한 턴을 턴 로그에 기록하고 세션 백엔드에 반영
+        
+        replies: (role, message, from_llm) 목록. LLM이 생성하지 않은 스텁 응답은
+        히스토리에는 남기되 토론자 메모리에서는 제외합니다.
+        """
+        self._append_turn(session, "user", user_message)
+        for role, message, from_llm in replies:
+            self._append_turn(session, role, message, in_memory=from_llm)
+        session.total_tokens_earned += tokens_earned
+        try:
+            self.session_store.save(session_id, session)
+        except Exception as e:
+            # 응답은 이미 생성됨 - 저장 실패로 턴을 버리지 않음
+            # (세션 객체는 이 워커의 캐시에 남아 다음 저장 때 함께 반영됨)
+            logger.error(f"세션 저장 실패 ({session_id}): {e}")
+        self._schedule_summary(session_id, session)
+    
+    def _append_turn(self, session: Session, role: str, message: str, in_memory: bool = True):
+        """턴 로그에 추가하고 사용자 발언 누적 통계 갱신"""
+        session.turns.append(role, message, in_memory=in_memory)
+        if role == "user":
+            session.user_turn_count += 1
+            session.user_char_count += len(message)
+            if TokenCalculator.is_question(message):
+                session.question_count += 1
+    
+    def _schedule_summary(self, session_id: str, session: Session):
+        """요약되지 않은 턴이 쌓이면 백그라운드에서 롤링 요약 갱신"""
+        if not (self.llm and settings.DEBATE_SUMMARY_ENABLED):
+            return
+        if len(session.turns) - session.summarized_turns < settings.DEBATE_SUMMARY_TRIGGER_TURNS:
+            return
+        if session_id in self._summary_tasks:
+            return
+        
+        task = asyncio.create_task(self._refresh_summary(session_id))
+        self._summary_tasks[session_id] = task
+        task.add_done_callback(lambda _: self._summary_tasks.pop(session_id, None))
+    
+    async def _refresh_summary(self, session_id: str):
+        """이전 요약 + 새 턴(최근 턴 제외)을 합쳐 롤링 요약 갱신"""
+        session = self.session_store.get(session_id, touch=False)
+        if session is None:
+            return
+        
+        start = session.summarized_turns
+        end = len(session.turns) - settings.DEBATE_SUMMARY_KEEP_TURNS
+        if end <= start:
+            return
+        
+        new_turns = "\n".join(
+            [f"{role}: {message}" for role, message in session.turns.iter_range(start, end)]
+        )
+        prompt = "\n".join([
+            "다음은 진행 중인 토론의 이전 요약과 그 이후의 대화입니다.",
+            "둘을 합쳐 5~8문장의 한국어 요약으로 갱신하세요.",
+            "사용자의 핵심 주장과 근거, 제임스의 반론, 린다의 지지 논점, 사용자가 보완한 점을 유지하세요.",
+            "요약 텍스트만 출력하세요.",
+            "",
+            f"토론 주제: {session.topic}",
+            f"사용자 입장: {session.user_position_label}",
+            "",
+            "이전 요약:",
+            session.summary or "(없음)",
+            "",
+            "이후 대화:",
+            new_turns,
+        ])
+        
+        try:
+            response = await self.llm.ainvoke([HumanMessage(content=prompt)], priority=Priority.REPORT)
+            summary = (response.content or "").strip()
+        except Exception as e:
+            logger.warning(f"롤링 요약 갱신 실패: {e}")
+            return
+        if not summary:
+            return
+        
+        # 요약 생성 중 다른 갱신이 없었던 경우에만 반영
+        async with self.session_store.lock(session_id):
+            session = self.session_store.get(session_id, touch=False)
+            if session is None or session.summarized_turns != start:
+                return
+            session.summary = summary
+            session.summarized_turns = end
+            self.session_store.save(session_id, session)
     
     def _add_to_history(
         self,
@@ -601,11 +1217,10 @@ class DebateEngine:
         message: str,
     ):
         """대화 히스토리에 메시지 추가"""
-        if session_id in self.sessions:
-            self.sessions[session_id]["history"].append({
-                "role": role,
-                "message": message,
-            })
+        session = self.session_store.get(session_id)
+        if session:
+            self._append_turn(session, role, message)
+            self.session_store.save(session_id, session)
     
     # 하위 호환성을 위한 별칭
     add_to_history = _add_to_history
@@ -0,0 +1,153 @@
+"""
+강의 컨텍스트 검색 인덱스
+긴 강의 컨텍스트를 청크로 나누고 BM25로 점수를 매겨
+매 턴마다 사용자 발언과 관련된 상위 청크만 프롬프트에 넣습니다.
+
+한국어는 조사/어미가 붙어 단어 단위 일치가 어렵기 때문에
+한글은 음절 bigram, 영문/숫자는 소문자 단어를 검색어로 사용합니다.
+"""
+from typing import Dict, List, Optional, Tuple
+import re
+
+import numpy as np
+
+
+_TOKEN_PATTERN = re.compile(r"[가-힣]+|[A-Za-z0-9]+")
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?。])\s+|\n+")
+
+
+def tokenize(text: str) -> List[str]:
+    """검색어 추출 (한글: 음절 bigram, 영문/숫자: 소문자 단어)"""
+    terms: List[str] = []
+    for word in _TOKEN_PATTERN.findall(text):
+        if word[0] >= "가":
+            if len(word) == 1:
+                terms.append(word)
+            else:
+                terms.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            terms.append(word.lower())
+    return terms
+
+
+def split_chunks(text: str, chunk_chars: int) -> List[str]:
+    """문장 경계를 기준으로 chunk_chars 이하의 청크로 분할"""
+    chunks: List[str] = []
+    current = ""
+    for sentence in _SENTENCE_SPLIT.split(text):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        # 한 문장이 너무 길면 강제로 자름
+        while len(sentence) > chunk_chars:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(sentence[:chunk_chars])
+            sentence = sentence[chunk_chars:]
+        if current and len(current) + 1 + len(sentence) > chunk_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class LectureIndex:
+    """
+    세션별 강의 컨텍스트 BM25 인덱스
+
+    검색어별 (청크 번호, BM25 가중치) 목록을 CSC 형태의 NumPy 배열로 저장하고,
+    질의 시 해당 검색어 구간만 모아 np.bincount로 청크 점수를 합산합니다.
+    """
+
+    K1 = 1.5
+    B = 0.75
+
+    def __init__(self, text: str, chunk_chars: int = 500):
+        self.source = text
+        self.chunks = split_chunks(text, chunk_chars)
+        # 마지막 질의 결과 (같은 턴에서 James/Linda가 함께 사용)
+        self._last_query: Optional[Tuple[str, int]] = None
+        self._last_result = ""
+
+        vocabulary: Dict[str, int] = {}
+        term_ids: List[int] = []
+        doc_ids: List[int] = []
+        doc_lengths = np.zeros(len(self.chunks), dtype=np.float32)
+        for doc_id, chunk in enumerate(self.chunks):
+            terms = tokenize(chunk)
+            doc_lengths[doc_id] = len(terms)
+            for term in terms:
+                term_ids.append(vocabulary.setdefault(term, len(vocabulary)))
+                doc_ids.append(doc_id)
+        self.vocabulary = vocabulary
+
+        if not term_ids:
+            self.indptr = np.zeros(1, dtype=np.int64)
+            self.postings = np.zeros(0, dtype=np.int32)
+            self.weights = np.zeros(0, dtype=np.float32)
+            return
+
+        # (검색어, 청크) 쌍별 등장 횟수
+        pairs = np.unique(
+            np.asarray(term_ids, dtype=np.int64) * len(self.chunks) + np.asarray(doc_ids, dtype=np.int64),
+            return_counts=True,
+        )
+        keys, tf = pairs
+        terms = keys // len(self.chunks)
+        docs = (keys % len(self.chunks)).astype(np.int32)
+
+        # 문서 빈도 → IDF
+        df = np.bincount(terms, minlength=len(vocabulary))
+        n_docs = len(self.chunks)
+        idf = np.log1p((n_docs - df + 0.5) / (df + 0.5))
+
+        avg_length = max(float(doc_lengths.mean()), 1.0)
+        norm = self.K1 * (1 - self.B + self.B * doc_lengths[docs] / avg_length)
+
+        # np.unique 결과는 검색어 순으로 정렬되어 있으므로 그대로 CSC 구성
+        self.indptr = np.concatenate(([0], np.cumsum(df))).astype(np.int64)
+        self.postings = docs
+        self.weights = (idf[terms] * tf * (self.K1 + 1) / (tf + norm)).astype(np.float32)
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    def scores(self, query: str) -> np.ndarray:
+        """질의에 대한 청크별 BM25 점수"""
+        ids = {self.vocabulary[term] for term in tokenize(query) if term in self.vocabulary}
+        if not ids:
+            return np.zeros(len(self.chunks), dtype=np.float32)
+        positions = np.concatenate([
+            np.arange(self.indptr[term_id], self.indptr[term_id + 1]) for term_id in ids
+        ])
+        return np.bincount(
+            self.postings[positions],
+            weights=self.weights[positions],
+            minlength=len(self.chunks),
+        )
+
+    def search(self, query: str, top_k: int) -> str:
+        """
+        질의와 관련된 상위 top_k 청크를 원문 순서대로 이어 붙여 반환
+
+        일치하는 검색어가 없으면 앞부분 청크를 사용합니다.
+        """
+        if self._last_query == (query, top_k):
+            return self._last_result
+
+        if len(self.chunks) <= top_k:
+            selected = list(range(len(self.chunks)))
+        else:
+            scores = self.scores(query)
+            if not scores.any():
+                selected = list(range(top_k))
+            else:
+                selected = sorted(np.argpartition(-scores, top_k)[:top_k].tolist())
+
+        self._last_query = (query, top_k)
+        self._last_result = "\n...\n".join(self.chunks[index] for index in selected)
+        return self._last_result
@@ -0,0 +1,379 @@
+"""
+LLM 게이트웨이
+DebateEngine, SuggestionService 등 모든 NVIDIA NIM 호출이 거쳐가는 공용 진입점
+
+- API 키별 토큰 버킷 (초당 요청 수 제한, LLM_RATE_LIMIT_PER_SECOND > 0일 때만)
+- 모델별 동시 요청 수 제한 (LLM_MAX_IN_FLIGHT_PER_MODEL > 0일 때만)
+- 우선순위: 토론 턴(DEBATE) > 추천(SUGGESTION) > 리포트/요약(REPORT)
+- 우선순위별 대기 시간 통계
+- 호출별 마감 시간 + 헤지 요청 (지연 시 두 번째 요청을 보내 먼저 끝난 응답 사용)
+"""
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+import asyncio
+import hashlib
+import heapq
+import itertools
+import logging
+import time
+
+from langchain_nvidia_ai_endpoints import ChatNVIDIA
+
+from app.core.config import settings
+from app.services.circuit_breaker import CircuitBreaker, get_circuit_breaker
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """요청 우선순위 (값이 작을수록 먼저 처리)"""
+    DEBATE = 0
+    SUGGESTION = 1
+    REPORT = 2
+
+
+class PrioritySemaphore:
+    """대기 중인 요청을 우선순위(같으면 도착 순)대로 깨우는 세마포어"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_use = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    async def acquire(self, priority: Priority):
+        if self.in_use < self.limit and not self.waiting:
+            self.in_use += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._counter), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # 슬롯을 넘겨받은 직후 취소된 경우 다음 대기자에게 양보
+            if future.done() and not future.cancelled():
+                self.release()
+            else:
+                future.cancel()
+            raise
+
+    def release(self):
+        self.in_use -= 1
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                self.in_use += 1
+                future.set_result(None)
+                break
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지는 토큰 버킷 (대기자는 우선순위 순으로 토큰 획득)"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self.throttled = 0
+        self._turn = PrioritySemaphore(1)
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self, priority: Priority):
+        if self.rate <= 0:
+            return
+        await self._turn.acquire(priority)
+        try:
+            self._refill()
+            if self.tokens < 1:
+                self.throttled += 1
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+        finally:
+            self._turn.release()
+
+
+class GatewayLLM:
+    """
+    게이트웨이에 묶인 모델 핸들
+
+    ChatNVIDIA와 같은 ainvoke/astream 인터페이스를 제공하며,
+    모든 호출은 게이트웨이의 속도 제한/동시성 제한/우선순위를 거칩니다.
+    """
+
+    def __init__(self, gateway: "LLMGateway", client: ChatNVIDIA, model: str, api_key: str, priority: Priority):
+        self.gateway = gateway
+        self.client = client
+        self.model = model
+        self.api_key = api_key
+        self.priority = priority
+
+    def _priority(self, priority: Optional[Priority]) -> Priority:
+        return self.priority if priority is None else priority
+
+    async def ainvoke(self, messages: list, priority: Optional[Priority] = None, **kwargs: Any) -> Any:
+        """LLM 호출 (kwargs는 stop 등 호출 옵션으로 전달, NIM 회로 차단 중이면 즉시 실패)"""
+        async with self.gateway.breaker.guard():
+            async with self.gateway.slot(self.model, self.api_key, self._priority(priority)):
+                started = time.perf_counter()
+                response = await self.client.ainvoke(messages, **kwargs)
+                self.gateway.record_latency(self.model, time.perf_counter() - started)
+                return response
+
+    async def astream(self, messages: list, priority: Optional[Priority] = None, **kwargs: Any) -> AsyncIterator[Any]:
+        """LLM 스트리밍 호출 (스트림이 끝날 때까지 슬롯 유지, NIM 회로 차단 중이면 즉시 실패)"""
+        async with self.gateway.breaker.guard():
+            async with self.gateway.slot(self.model, self.api_key, self._priority(priority)):
+                async for chunk in self.client.astream(messages, **kwargs):
+                    yield chunk
+
+
+class LLMGateway:
+    """NVIDIA NIM 호출 게이트웨이"""
+
+    def __init__(
+        self,
+        rate_per_second: float = 0,
+        burst: int = 1,
+        max_in_flight_per_model: int = 0,
+    ):
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.max_in_flight_per_model = max_in_flight_per_model
+
+        self.breaker: CircuitBreaker = get_circuit_breaker("nim")
+        self._clients: Dict[Tuple[str, float, int, str], ChatNVIDIA] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._limiters: Dict[str, PrioritySemaphore] = {}
+        self._in_flight: Dict[str, int] = {}
+        # 모델별 최근 응답 시간 (헤지 지연 시간 백분위 계산용)
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._hedge_stats: Dict[str, Dict[str, int]] = {}
+        self._wait_stats: Dict[Priority, Dict[str, float]] = {
+            priority: {"requests": 0, "total_wait_ms": 0.0, "max_wait_ms": 0.0}
+            for priority in Priority
+        }
+
+    def bind(
+        self,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        priority: Priority,
+        api_key: Optional[str] = None,
+    ) -> Optional[GatewayLLM]:
+        """
+        모델 핸들 생성
+
+        같은 설정의 ChatNVIDIA 클라이언트는 재사용합니다.
+        API 키가 없거나 클라이언트 초기화에 실패하면 None을 반환합니다.
+        """
+        api_key = api_key or settings.NVIDIA_API_KEY
+        if not api_key:
+            logger.warning("NVIDIA_API_KEY가 설정되지 않았습니다.")
+            return None
+        client_key = (model, temperature, max_tokens, api_key)
+        client = self._clients.get(client_key)
+        if client is None:
+            try:
+                client = ChatNVIDIA(
+                    model=model,
+                    nvidia_api_key=api_key,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
+            except Exception as e:
+                logger.warning(f"LLM 초기화 실패 ({model}): {e}")
+                return None
+            self._clients[client_key] = client
+        return GatewayLLM(self, client, model, api_key, priority)
+
+    def _bucket(self, api_key: str) -> TokenBucket:
+        # 통계/로그에 키가 노출되지 않도록 해시로 구분
+        bucket_key = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+        bucket = self._buckets.get(bucket_key)
+        if bucket is None:
+            bucket = TokenBucket(self.rate_per_second, self.burst)
+            self._buckets[bucket_key] = bucket
+        return bucket
+
+    def _limiter(self, model: str) -> Optional[PrioritySemaphore]:
+        if self.max_in_flight_per_model <= 0:
+            return None
+        limiter = self._limiters.get(model)
+        if limiter is None:
+            limiter = PrioritySemaphore(self.max_in_flight_per_model)
+            self._limiters[model] = limiter
+        return limiter
+
+    @asynccontextmanager
+    async def slot(self, model: str, api_key: str, priority: Priority) -> AsyncIterator[None]:
+        """모델 동시성 슬롯 + 속도 제한 토큰을 우선순위 순으로 획득"""
+        started = time.perf_counter()
+        limiter = self._limiter(model)
+        if limiter is not None:
+            await limiter.acquire(priority)
+        try:
+            await self._bucket(api_key).acquire(priority)
+            self._record_wait(priority, (time.perf_counter() - started) * 1000)
+
+            self._in_flight[model] = self._in_flight.get(model, 0) + 1
+            try:
+                yield
+            finally:
+                self._in_flight[model] -= 1
+        finally:
+            if limiter is not None:
+                limiter.release()
+
+    def record_latency(self, model: str, seconds: float):
+        """성공한 호출의 응답 시간 기록"""
+        samples = self._latencies.get(model)
+        if samples is None:
+            samples = deque(maxlen=settings.LLM_LATENCY_SAMPLE_SIZE)
+            self._latencies[model] = samples
+        samples.append(seconds)
+
+    def hedge_delay(self, model: str) -> float:
+        """
+        헤지 요청을 보내기까지 기다릴 시간 (초)
+
+        최근 응답 시간의 LLM_HEDGE_PERCENTILE 백분위를 사용하며,
+        표본이 부족하면 LLM_HEDGE_DELAY_SECONDS를 사용합니다.
+        """
+        samples = self._latencies.get(model)
+        if not samples or len(samples) < settings.LLM_HEDGE_MIN_SAMPLES:
+            return settings.LLM_HEDGE_DELAY_SECONDS
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(len(ordered) * settings.LLM_HEDGE_PERCENTILE / 100))
+        return ordered[index]
+
+    async def invoke_with_deadline(
+        self,
+        primary: GatewayLLM,
+        messages: list,
+        timeout: float = 0,
+        hedge: Optional[GatewayLLM] = None,
+        priority: Optional[Priority] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        마감 시간 + 헤지 요청을 적용한 LLM 호출
+
+        hedge가 있으면 primary가 hedge_delay 안에 끝나지 않거나 먼저 실패할 때
+        hedge 모델로 같은 요청을 한 번 더 보내고, 먼저 성공한 응답을 반환합니다.
+        남은 요청은 취소됩니다. timeout(초, 0이면 무제한) 안에 성공한 응답이 없으면
+        asyncio.TimeoutError를, 모든 요청이 실패하면 마지막 오류를 발생시킵니다.
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + timeout if timeout > 0 else None
+        hedge_at = started + self.hedge_delay(primary.model) if hedge is not None else None
+        stats = self._hedge_stats.setdefault(
+            primary.model,
+            {"calls": 0, "hedged": 0, "primary_wins": 0, "hedge_wins": 0, "timeouts": 0, "errors": 0},
+        )
+        stats["calls"] += 1
+
+        pending: Dict[asyncio.Task, str] = {
+            asyncio.create_task(primary.ainvoke(messages, priority, **kwargs)): "primary",
+        }
+        last_error: Optional[BaseException] = None
+        try:
+            while pending:
+                now = loop.time()
+                waits = [moment - now for moment in (deadline, hedge_at) if moment is not None]
+                wait_for = max(0.0, min(waits)) if waits else None
+                if deadline is not None and now >= deadline:
+                    break
+
+                done, _ = await asyncio.wait(pending, timeout=wait_for, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    label = pending.pop(task)
+                    if task.exception() is None:
+                        stats[f"{label}_wins"] += 1
+                        return task.result()
+                    last_error = task.exception()
+
+                # 지연되거나 먼저 실패하면 헤지 요청 발송 (한 번만)
+                if hedge_at is not None and (loop.time() >= hedge_at or not pending):
+                    hedge_at = None
+                    stats["hedged"] += 1
+                    pending[asyncio.create_task(hedge.ainvoke(messages, priority, **kwargs))] = "hedge"
+
+            if pending or last_error is None:
+                stats["timeouts"] += 1
+                error = asyncio.TimeoutError(f"LLM 응답 시간 초과 ({timeout}s)")
+                # 마감 시간 초과로 취소된 요청은 guard에서 실패로 기록되지 않으므로 여기서 기록
+                self.breaker.record_failure(error)
+                raise error
+            stats["errors"] += 1
+            raise last_error
+        finally:
+            # 진 요청 취소 (게이트웨이 슬롯 반환)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def _record_wait(self, priority: Priority, wait_ms: float):
+        stats = self._wait_stats[priority]
+        stats["requests"] += 1
+        stats["total_wait_ms"] += wait_ms
+        stats["max_wait_ms"] = max(stats["max_wait_ms"], wait_ms)
+
+    def stats(self) -> Dict[str, Any]:
+        """게이트웨이 지표 (우선순위별 대기 시간, 모델별 동시 요청 수)"""
+        return {
+            "rate_per_second": self.rate_per_second,
+            "max_in_flight_per_model": self.max_in_flight_per_model,
+            "throttled": sum(bucket.throttled for bucket in self._buckets.values()),
+            "models": {
+                model: {
+                    "in_flight": in_flight,
+                    "waiting": self._limiters[model].waiting if model in self._limiters else 0,
+                }
+                for model, in_flight in self._in_flight.items()
+            },
+            "queue_wait": {
+                priority.name.lower(): {
+                    "requests": int(stats["requests"]),
+                    "avg_wait_ms": round(stats["total_wait_ms"] / stats["requests"], 2) if stats["requests"] else 0.0,
+                    "max_wait_ms": round(stats["max_wait_ms"], 2),
+                }
+                for priority, stats in self._wait_stats.items()
+            },
+            "hedging": {
+                model: {**stats, "hedge_delay_ms": round(self.hedge_delay(model) * 1000, 1)}
+                for model, stats in self._hedge_stats.items()
+            },
+        }
+
+
+# 싱글톤 인스턴스
+_llm_gateway: Optional[LLMGateway] = None
+
+
+def get_llm_gateway() -> LLMGateway:
+    """LLMGateway 싱글톤 반환"""
+    global _llm_gateway
+    if _llm_gateway is None:
+        _llm_gateway = LLMGateway(
+            rate_per_second=settings.LLM_RATE_LIMIT_PER_SECOND,
+            burst=settings.LLM_RATE_LIMIT_BURST,
+            max_in_flight_per_model=settings.LLM_MAX_IN_FLIGHT_PER_MODEL,
+        )
+    return _llm_gateway
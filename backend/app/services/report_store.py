@@ -7,6 +7,8 @@ from typing import Optional, List
 import httpx
 
 from app.core.config import settings
+from app.core.http_client import get_http_client
+from app.services.circuit_breaker import CircuitOpenError, get_circuit_breaker
 
 logger = logging.getLogger(__name__)
 
@@ -21,8 +23,9 @@ async def save_debate_report(
     improvement_tips: List[str],
     ocr_alignment_score: Optional[int],
     ocr_feedback: Optional[str],
+    client: Optional[httpx.AsyncClient] = None,
 ) -> None:
-    """Supabase REST API로 리포트 저장"""
+    """Supabase REST API로 리포트 저장 (client 미지정 시 앱 공유 연결 풀 사용)"""
     if not settings.SUPABASE_URL or not settings.SUPABASE_SERVICE_ROLE_KEY:
         logger.warning("SUPABASE_URL 또는 SERVICE_ROLE_KEY가 없어 리포트를 저장하지 않습니다.")
         return
@@ -47,9 +50,17 @@ async def save_debate_report(
         "ocr_feedback": ocr_feedback,
     }
 
+    breaker = get_circuit_breaker("supabase")
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            response = await client.post(url, headers=headers, json=payload)
-            response.raise_for_status()
+        # 취소(연결 끊김, 마감 시간 초과)된 반열림 시험 요청은 guard가 반환
+        async with breaker.guard():
+            client = client or get_http_client("supabase")
+            response = await client.post(url, headers=headers, json=payload, timeout=10)
+            if response.is_server_error:
+                response.raise_for_status()
+        # 4xx는 요청 문제이므로 회로 실패로 세지 않음
+        response.raise_for_status()
+    except CircuitOpenError:
+        logger.warning("Supabase 회로 차단 중이라 리포트를 저장하지 않습니다.")
     except Exception as error:
         logger.error(f"리포트 저장 실패: {error}")
@@ -0,0 +1,816 @@
+"""
+토론 세션 저장소
+세션 정보와 대화 기록(턴 로그)을 하나의 Session 객체로 묶어
+유휴 TTL 만료 및 최대 세션 수(LRU) 기준으로 함께 제거합니다.
+
+두 토론자(James/Linda)의 대화 메모리는 별도 사본 없이
+세션 턴 로그 위의 뷰(DebaterMemory)로 제공됩니다.
+
+실제 저장은 SessionBackend가 담당합니다.
+- InMemorySessionBackend: 프로세스 내부 dict (기본값, 단일 워커용)
+- SQLiteSessionBackend: SQLite(WAL) 파일 (여러 uvicorn 워커가 세션 공유)
+"""
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Optional, Dict, Iterator, List, Tuple, AsyncIterator, Any
+import asyncio
+import json
+import logging
+import sqlite3
+import sys
+import threading
+import time
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+
+from app.core.config import settings
+from app.core.tokens import estimate_tokens, truncate_to_tokens
+from app.models.schemas import DebaterRole
+
+
+logger = logging.getLogger(__name__)
+
+# 토론자 메모리 윈도우 (최근 대화 교환 수)
+MEMORY_WINDOW_K = 10
+
+# 턴 역할 코드 (턴마다 문자열 대신 1바이트 코드 저장)
+ROLE_USER = 0
+ROLE_JAMES = 1
+ROLE_LINDA = 2
+ROLE_NAMES = ("user", "james", "linda")
+ROLE_CODES = {name: code for code, name in enumerate(ROLE_NAMES)}
+# 스텁(대체) 응답 표시 비트 - 히스토리에는 남기되 토론자 메모리에서는 제외
+FALLBACK_FLAG = 0x80
+
+
+def role_code_for(debater: DebaterRole) -> int:
+    """토론자 역할 코드 반환"""
+    return ROLE_JAMES if debater == DebaterRole.JAMES else ROLE_LINDA
+
+
+class TurnLog:
+    """
+    추가 전용(append-only) 턴 로그
+    역할 코드는 bytearray, 메시지는 list에 나란히 저장합니다.
+    """
+
+    __slots__ = ("roles", "messages")
+
+    def __init__(self, roles: Optional[bytearray] = None, messages: Optional[List[str]] = None):
+        self.roles = roles if roles is not None else bytearray()
+        self.messages = messages if messages is not None else []
+
+    def __len__(self) -> int:
+        return len(self.messages)
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        """(role, message) 순회"""
+        return self.iter_range(0)
+
+    def iter_range(self, start: int, end: Optional[int] = None) -> Iterator[Tuple[str, str]]:
+        """start ~ end 구간의 (role, message) 순회"""
+        end = len(self.messages) if end is None else min(end, len(self.messages))
+        for index in range(max(start, 0), end):
+            yield ROLE_NAMES[self.roles[index] & ~FALLBACK_FLAG], self.messages[index]
+
+    def append(self, role: str, message: str, in_memory: bool = True) -> None:
+        """턴 추가 (in_memory=False면 토론자 메모리 뷰에서 제외)"""
+        code = ROLE_CODES[role]
+        if not in_memory:
+            code |= FALLBACK_FLAG
+        self.roles.append(code)
+        self.messages.append(message)
+
+    def exchanges(self, role_code: int, k: int) -> List[Tuple[str, str]]:
+        """해당 토론자의 최근 k개 (사용자 발언, 토론자 응답) 쌍 (오래된 순)"""
+        pairs: List[Tuple[str, str]] = []
+        reply: Optional[str] = None
+        for index in range(len(self.messages) - 1, -1, -1):
+            code = self.roles[index]
+            if code == role_code:
+                reply = self.messages[index]
+            elif code == ROLE_USER and reply is not None:
+                pairs.append((self.messages[index], reply))
+                reply = None
+                if len(pairs) >= k:
+                    break
+        pairs.reverse()
+        return pairs
+
+    def to_list(self) -> List[list]:
+        return [[code, message] for code, message in zip(self.roles, self.messages)]
+
+    @classmethod
+    def from_list(cls, data: List[list]) -> "TurnLog":
+        return cls(bytearray(code for code, _ in data), [message for _, message in data])
+
+
+class DebaterMemory:
+    """
+    턴 로그 위의 토론자별 대화 메모리 뷰
+
+    token_budget이 없으면 최근 k개 교환을 그대로 사용합니다.
+    token_budget이 있으면 긴 메시지를 max_message_tokens로 자른 뒤
+    최근 교환부터 예산 안에서 채웁니다 (최대 k개).
+    """
+
+    __slots__ = ("turns", "role_code", "k", "token_budget", "max_message_tokens")
+
+    def __init__(
+        self,
+        turns: TurnLog,
+        role_code: int,
+        k: int = MEMORY_WINDOW_K,
+        token_budget: Optional[int] = None,
+        max_message_tokens: int = 0,
+    ):
+        self.turns = turns
+        self.role_code = role_code
+        self.k = k
+        self.token_budget = token_budget
+        self.max_message_tokens = max_message_tokens
+
+    def _budgeted_exchanges(self) -> List[Tuple[str, str]]:
+        """예산 안에 들어가는 최근 교환 (오래된 순)"""
+        selected: List[Tuple[str, str]] = []
+        remaining = self.token_budget
+        for user_message, reply in reversed(self.turns.exchanges(self.role_code, self.k)):
+            user_message = truncate_to_tokens(user_message, self.max_message_tokens)
+            reply = truncate_to_tokens(reply, self.max_message_tokens)
+            cost = estimate_tokens(user_message) + estimate_tokens(reply)
+            if cost > remaining:
+                break
+            selected.append((user_message, reply))
+            remaining -= cost
+        selected.reverse()
+        return selected
+
+    @property
+    def messages(self) -> List[BaseMessage]:
+        """LangChain 메시지 목록 (Human/AI 교대)"""
+        if self.token_budget is None:
+            exchanges = self.turns.exchanges(self.role_code, self.k)
+        else:
+            exchanges = self._budgeted_exchanges()
+
+        messages: List[BaseMessage] = []
+        for user_message, reply in exchanges:
+            messages.append(HumanMessage(content=user_message))
+            messages.append(AIMessage(content=reply))
+        return messages
+
+
+class Session:
+    """토론 세션 (메타데이터 + 턴 로그)"""
+
+    __slots__ = (
+        "topic",
+        "user_position",
+        "user_position_label",
+        "james_position",
+        "linda_position",
+        "lecture_context",
+        "total_tokens_earned",
+        "summary",
+        "summarized_turns",
+        "user_turn_count",
+        "user_char_count",
+        "question_count",
+        "turns",
+        "last_access",
+        "prompts",
+        "last_prompt_tokens",
+        "lecture_index",
+    )
+
+    # 백엔드에 저장하는 메타데이터 필드
+    METADATA_FIELDS = (
+        "topic",
+        "user_position",
+        "user_position_label",
+        "james_position",
+        "linda_position",
+        "lecture_context",
+        "total_tokens_earned",
+        "summary",
+        "summarized_turns",
+        "user_turn_count",
+        "user_char_count",
+        "question_count",
+    )
+
+    def __init__(
+        self,
+        topic: str = "자유 토론",
+        user_position: str = "",
+        user_position_label: str = "미정",
+        james_position: str = "비판적 관점",
+        linda_position: str = "지지적 관점",
+        lecture_context: str = "",
+        total_tokens_earned: int = 0,
+        summary: str = "",
+        summarized_turns: int = 0,
+        user_turn_count: int = 0,
+        user_char_count: int = 0,
+        question_count: int = 0,
+        turns: Optional[TurnLog] = None,
+        last_access: Optional[float] = None,
+    ):
+        self.topic = topic
+        self.user_position = user_position
+        self.user_position_label = user_position_label
+        self.james_position = james_position
+        self.linda_position = linda_position
+        self.lecture_context = lecture_context
+        self.total_tokens_earned = total_tokens_earned
+        # 롤링 요약: turns[:summarized_turns] 구간을 요약한 텍스트
+        self.summary = summary
+        self.summarized_turns = summarized_turns
+        # 사용자 발언 누적 통계 (턴 추가 시 갱신)
+        self.user_turn_count = user_turn_count
+        self.user_char_count = user_char_count
+        self.question_count = question_count
+        self.turns = turns if turns is not None else TurnLog()
+        # 워커 간 공유를 위해 wall-clock 시간 사용
+        self.last_access = last_access if last_access is not None else time.time()
+        # 렌더링된 프롬프트 캐시 (백엔드에 저장하지 않음)
+        self.prompts = None
+        # 마지막 LLM 호출의 토론자별 추정 프롬프트 토큰 수 (백엔드에 저장하지 않음)
+        self.last_prompt_tokens: Dict[str, int] = {}
+        # 강의 컨텍스트 검색 인덱스 (필요 시 생성, 백엔드에 저장하지 않음)
+        self.lecture_index = None
+
+    def memory_for(self, debater: DebaterRole, k: int = MEMORY_WINDOW_K) -> DebaterMemory:
+        """토론자에 해당하는 최근 k개 교환 메모리 뷰 반환 (DEBATE_MEMORY_MODE 설정 적용)"""
+        if settings.DEBATE_MEMORY_MODE == "token_budget":
+            return DebaterMemory(
+                self.turns,
+                role_code_for(debater),
+                k,
+                token_budget=settings.DEBATE_MEMORY_TOKEN_BUDGET,
+                max_message_tokens=settings.DEBATE_MEMORY_MAX_MESSAGE_TOKENS,
+            )
+        return DebaterMemory(self.turns, role_code_for(debater), k)
+
+    @property
+    def history(self) -> List[Dict[str, str]]:
+        """대화 히스토리 ({"role", "message"} 목록)"""
+        return [{"role": role, "message": message} for role, message in self.turns]
+
+    def metadata(self) -> Dict[str, Any]:
+        return {field: getattr(self, field) for field in self.METADATA_FIELDS}
+
+    def approx_size_bytes(self) -> int:
+        """세션이 차지하는 대략적인 메모리 크기 (바이트, 프롬프트 캐시 제외)"""
+        size = sys.getsizeof(self) + sys.getsizeof(self.turns)
+        size += sys.getsizeof(self.turns.roles) + sys.getsizeof(self.turns.messages)
+        size += sum(sys.getsizeof(message) for message in self.turns.messages)
+        size += sum(sys.getsizeof(getattr(self, field)) for field in self.METADATA_FIELDS)
+        return size
+
+
+class SessionBackend(ABC):
+    """세션 저장 백엔드 인터페이스"""
+
+    # 이벤트 루프와 다른 스레드에서 동시에 호출해도 안전한지 (True면 sweep을 스레드에서 실행)
+    thread_safe = False
+
+    @abstractmethod
+    def load(self, session_id: str) -> Optional[Session]:
+        """세션 조회 (없으면 None)"""
+
+    @abstractmethod
+    def save(self, session_id: str, session: Session) -> bool:
+        """세션 저장 (새로 생성된 경우 True)"""
+
+    @abstractmethod
+    def touch(self, session_id: str, session: Session) -> None:
+        """마지막 접근 시각(session.last_access) 반영"""
+
+    @abstractmethod
+    def delete(self, session_id: str) -> bool:
+        """세션 삭제 (삭제된 경우 True)"""
+
+    @abstractmethod
+    def delete_expired(self, cutoff: float) -> int:
+        """last_access가 cutoff 이전인 세션 삭제, 삭제 수 반환"""
+
+    @abstractmethod
+    def evict_over_capacity(self, max_sessions: int) -> int:
+        """세션 수가 max_sessions 이하가 되도록 오래된 세션부터 삭제"""
+
+    @abstractmethod
+    def count(self) -> int:
+        """저장된 세션 수"""
+
+    @abstractmethod
+    def session_ids(self) -> List[str]:
+        """저장된 세션 ID 목록"""
+
+    def close(self) -> None:
+        """백엔드 리소스 정리"""
+
+
+class InMemorySessionBackend(SessionBackend):
+    """프로세스 내부 dict 백엔드 (최근 사용 순서 유지)"""
+
+    def __init__(self):
+        self._sessions: "OrderedDict[str, Session]" = OrderedDict()
+
+    def load(self, session_id: str) -> Optional[Session]:
+        return self._sessions.get(session_id)
+
+    def save(self, session_id: str, session: Session) -> bool:
+        created = session_id not in self._sessions
+        self._sessions[session_id] = session
+        self._sessions.move_to_end(session_id)
+        return created
+
+    def touch(self, session_id: str, session: Session) -> None:
+        if session_id in self._sessions:
+            self._sessions.move_to_end(session_id)
+
+    def delete(self, session_id: str) -> bool:
+        return self._sessions.pop(session_id, None) is not None
+
+    def delete_expired(self, cutoff: float) -> int:
+        expired = []
+        # 최근 사용 순으로 정렬되어 있으므로 만료되지 않은 세션을 만나면 중단
+        for session_id, session in self._sessions.items():
+            if session.last_access >= cutoff:
+                break
+            expired.append(session_id)
+
+        for session_id in expired:
+            del self._sessions[session_id]
+        return len(expired)
+
+    def evict_over_capacity(self, max_sessions: int) -> int:
+        evicted = 0
+        while len(self._sessions) > max_sessions:
+            self._sessions.popitem(last=False)
+            evicted += 1
+        return evicted
+
+    def count(self) -> int:
+        return len(self._sessions)
+
+    def session_ids(self) -> List[str]:
+        return list(self._sessions)
+
+
+class SQLiteSessionBackend(SessionBackend):
+    """
+    SQLite(WAL) 백엔드
+    여러 워커 프로세스가 같은 DB 파일을 공유하여 세션을 이어갑니다.
+
+    - 세션 메타데이터와 턴 로그(히스토리, 토론자 메모리의 원본)를 JSON으로 저장
+    - 저장할 때마다 version을 올리고, 조회 시 version이 같으면 로컬 캐시 객체를 재사용
+      (한 턴 동안 같은 세션 객체를 수정하도록 보장)
+    - 동시 저장은 last-writer-wins
+    - 호출은 이벤트 루프에서 동기로 실행되므로 busy_timeout을 짧게 두고,
+      대량 삭제(sweep)는 별도 연결로 스레드에서 실행 (루프 쪽 호출과 락을 공유하지 않음)
+    """
+
+    thread_safe = True
+
+    # last_access 갱신 최소 간격 (초) - 조회마다 쓰기가 발생하지 않도록 제한
+    TOUCH_RESOLUTION_SECONDS = 1.0
+
+    def __init__(self, path: str, cache_size: int = 1024, busy_timeout_ms: int = 100):
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.cache_size = cache_size
+        self.busy_timeout_ms = max(0, int(busy_timeout_ms))
+        self._lock = threading.Lock()
+        # session_id → (version, session, DB에 반영된 last_access)
+        self._cache: "OrderedDict[str, Tuple[int, Session, float]]" = OrderedDict()
+        self._conn = self._connect(self.busy_timeout_ms)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS debate_sessions (
+                session_id TEXT PRIMARY KEY,
+                metadata_json TEXT NOT NULL,
+                turns_json TEXT NOT NULL,
+                version INTEGER NOT NULL DEFAULT 0,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_debate_sessions_last_access "
+            "ON debate_sessions (last_access)"
+        )
+        # sweep 전용 연결 (스레드에서 실행되므로 루프 쪽 호출보다 오래 기다려도 됨)
+        self._sweep_conn = self._connect(5000) if path != ":memory:" else None
+
+    def _connect(self, busy_timeout_ms: int) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={busy_timeout_ms}")
+        return conn
+
+    def _cache_put(self, session_id: str, version: int, session: Session, persisted_access: float) -> None:
+        self._cache[session_id] = (version, session, persisted_access)
+        self._cache.move_to_end(session_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    @staticmethod
+    def _serialize(session: Session) -> Tuple[str, str]:
+        return (
+            json.dumps(session.metadata(), ensure_ascii=False),
+            json.dumps(session.turns.to_list(), ensure_ascii=False),
+        )
+
+    @staticmethod
+    def _deserialize(row: tuple) -> Session:
+        metadata_json, turns_json, last_access = row
+        return Session(
+            **json.loads(metadata_json),
+            turns=TurnLog.from_list(json.loads(turns_json)),
+            last_access=last_access,
+        )
+
+    def load(self, session_id: str) -> Optional[Session]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version, last_access FROM debate_sessions WHERE session_id = ?",
+                (session_id,),
+            ).fetchone()
+            if row is None:
+                self._cache.pop(session_id, None)
+                return None
+
+            version, last_access = row
+            cached = self._cache.get(session_id)
+            if cached and cached[0] == version:
+                session = cached[1]
+                session.last_access = max(session.last_access, last_access)
+                self._cache.move_to_end(session_id)
+                return session
+
+            data = self._conn.execute(
+                "SELECT metadata_json, turns_json, last_access "
+                "FROM debate_sessions WHERE session_id = ?",
+                (session_id,),
+            ).fetchone()
+            if data is None:
+                self._cache.pop(session_id, None)
+                return None
+
+            session = self._deserialize(data)
+            self._cache_put(session_id, version, session, session.last_access)
+            return session
+
+    def save(self, session_id: str, session: Session) -> bool:
+        metadata_json, turns_json = self._serialize(session)
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO debate_sessions "
+                "(session_id, metadata_json, turns_json, version, last_access) "
+                "VALUES (?, ?, ?, 0, ?)",
+                (session_id, metadata_json, turns_json, session.last_access),
+            )
+            created = cursor.rowcount == 1
+            if not created:
+                self._conn.execute(
+                    "UPDATE debate_sessions SET metadata_json = ?, turns_json = ?, "
+                    "version = version + 1, last_access = ? "
+                    "WHERE session_id = ?",
+                    (metadata_json, turns_json, session.last_access, session_id),
+                )
+            version = self._conn.execute(
+                "SELECT version FROM debate_sessions WHERE session_id = ?",
+                (session_id,),
+            ).fetchone()[0]
+            self._cache_put(session_id, version, session, session.last_access)
+            return created
+
+    def touch(self, session_id: str, session: Session) -> None:
+        with self._lock:
+            cached = self._cache.get(session_id)
+            if cached and session.last_access - cached[2] < self.TOUCH_RESOLUTION_SECONDS:
+                return
+            try:
+                self._conn.execute(
+                    "UPDATE debate_sessions SET last_access = MAX(last_access, ?) WHERE session_id = ?",
+                    (session.last_access, session_id),
+                )
+            except sqlite3.OperationalError as e:
+                # 다른 워커가 쓰는 중 - 접근 시각 갱신은 다음 조회로 미룸 (요청은 막지 않음)
+                logger.debug(f"세션 접근 시각 갱신 건너뜀: {session_id} ({e})")
+                return
+            if cached:
+                self._cache[session_id] = (cached[0], cached[1], session.last_access)
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            self._cache.pop(session_id, None)
+            cursor = self._conn.execute(
+                "DELETE FROM debate_sessions WHERE session_id = ?",
+                (session_id,),
+            )
+            return cursor.rowcount > 0
+
+    def delete_expired(self, cutoff: float) -> int:
+        if self._sweep_conn is None:
+            # :memory: DB는 연결마다 별도 DB이므로 공유 연결 사용
+            with self._lock:
+                expired = self._delete_expired(self._conn, cutoff)
+        else:
+            # 삭제하는 동안 self._lock을 잡지 않음 (루프 쪽 load/save가 기다리지 않도록)
+            expired = self._delete_expired(self._sweep_conn, cutoff)
+        if expired:
+            # 삭제된 행의 캐시는 다음 load에서도 버려지지만 메모리를 바로 반환
+            with self._lock:
+                for session_id in expired:
+                    self._cache.pop(session_id, None)
+        return len(expired)
+
+    @staticmethod
+    def _delete_expired(conn: sqlite3.Connection, cutoff: float) -> List[str]:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            expired = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT session_id FROM debate_sessions WHERE last_access < ?",
+                    (cutoff,),
+                )
+            ]
+            if expired:
+                conn.execute(
+                    "DELETE FROM debate_sessions WHERE last_access < ?",
+                    (cutoff,),
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return expired
+
+    def evict_over_capacity(self, max_sessions: int) -> int:
+        with self._lock:
+            total = self._conn.execute("SELECT COUNT(*) FROM debate_sessions").fetchone()[0]
+            overflow = total - max_sessions
+            if overflow <= 0:
+                return 0
+            oldest = [
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT session_id FROM debate_sessions ORDER BY last_access ASC LIMIT ?",
+                    (overflow,),
+                )
+            ]
+            self._conn.executemany(
+                "DELETE FROM debate_sessions WHERE session_id = ?",
+                [(session_id,) for session_id in oldest],
+            )
+            for session_id in oldest:
+                self._cache.pop(session_id, None)
+            return len(oldest)
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM debate_sessions").fetchone()[0]
+
+    def session_ids(self) -> List[str]:
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT session_id FROM debate_sessions")]
+
+    def close(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._conn.close()
+            if self._sweep_conn is not None:
+                self._sweep_conn.close()
+
+
+class _LockEntry:
+    __slots__ = ("lock", "users")
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.users = 0
+
+
+class SessionLockTable:
+    """
+    세션별 asyncio 락 테이블
+
+    같은 세션의 작업은 순서대로 실행하고, 다른 세션은 서로 막지 않습니다.
+    락은 사용 중(보유 또는 대기)인 동안에만 테이블에 남으므로
+    테이블 크기는 진행 중인 세션 작업 수를 넘지 않습니다.
+    워커(프로세스) 단위 락이므로 워커 간 직렬화는 보장하지 않습니다.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, _LockEntry] = {}
+        self.contended = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @asynccontextmanager
+    async def hold(self, session_id: str) -> AsyncIterator[None]:
+        """세션 락 획득 (async with)"""
+        entry = self._entries.get(session_id)
+        if entry is None:
+            entry = self._entries[session_id] = _LockEntry()
+        if entry.lock.locked():
+            self.contended += 1
+
+        entry.users += 1
+        try:
+            async with entry.lock:
+                yield
+        finally:
+            entry.users -= 1
+            if entry.users == 0 and self._entries.get(session_id) is entry:
+                del self._entries[session_id]
+
+
+def create_session_backend() -> SessionBackend:
+    """설정(SESSION_BACKEND)에 따른 세션 백엔드 생성"""
+    backend = (settings.SESSION_BACKEND or "memory").lower()
+    if backend == "sqlite":
+        logger.info(f"SQLite 세션 백엔드 사용: {settings.SESSION_SQLITE_PATH}")
+        return SQLiteSessionBackend(
+            settings.SESSION_SQLITE_PATH,
+            busy_timeout_ms=settings.SESSION_SQLITE_BUSY_TIMEOUT_MS,
+        )
+    if backend != "memory":
+        logger.warning(f"알 수 없는 SESSION_BACKEND '{backend}', 메모리 백엔드 사용")
+    return InMemorySessionBackend()
+
+
+class SessionStore:
+    """
+    TTL + LRU 기반 세션 저장소
+
+    - 유휴 시간이 ttl_seconds를 넘은 세션은 조회 시점 또는 주기적 sweep에서 제거
+    - 세션 수가 max_sessions를 넘으면 가장 오래 사용되지 않은 세션부터 제거
+    - 토론자 메모리는 세션 턴 로그의 뷰이므로 항상 세션과 함께 제거됨
+    - 세션을 수정한 뒤에는 save()로 백엔드에 반영
+    - 카운터는 워커(프로세스) 단위로 집계
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 3600,
+        max_sessions: int = 10000,
+        sweep_interval_seconds: float = 60,
+        backend: Optional[SessionBackend] = None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self.backend = backend or InMemorySessionBackend()
+
+        self.locks = SessionLockTable()
+        self._sweeper_task: Optional[asyncio.Task] = None
+        self._counters: Dict[str, int] = {
+            "created": 0,
+            "hits": 0,
+            "misses": 0,
+            "deleted": 0,
+            "evicted_ttl": 0,
+            "evicted_lru": 0,
+        }
+
+    def __contains__(self, session_id: str) -> bool:
+        return self.get(session_id, touch=False) is not None
+
+    def __len__(self) -> int:
+        return self.backend.count()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.backend.session_ids())
+
+    def _is_expired(self, session: Session, now: float) -> bool:
+        return self.ttl_seconds > 0 and now - session.last_access > self.ttl_seconds
+
+    def get(self, session_id: str, touch: bool = True) -> Optional[Session]:
+        """세션 조회 (만료된 세션은 제거 후 None 반환)"""
+        session = self.backend.load(session_id)
+        if session is None:
+            if touch:
+                self._counters["misses"] += 1
+            return None
+
+        now = time.time()
+        if self._is_expired(session, now):
+            self._evict(session_id, "evicted_ttl")
+            if touch:
+                self._counters["misses"] += 1
+            return None
+
+        if touch:
+            session.last_access = now
+            self.backend.touch(session_id, session)
+            self._counters["hits"] += 1
+        return session
+
+    def lock(self, session_id: str):
+        """세션 단위 직렬화 락 (async with store.lock(session_id): ...)"""
+        return self.locks.hold(session_id)
+
+    def put(self, session_id: str, session: Session) -> Session:
+        """세션 저장 (최대 세션 수 초과 시 LRU 제거)"""
+        session.last_access = time.time()
+        if self.backend.save(session_id, session):
+            self._counters["created"] += 1
+
+        if self.max_sessions > 0:
+            evicted = self.backend.evict_over_capacity(self.max_sessions)
+            if evicted:
+                self._counters["evicted_lru"] += evicted
+                logger.debug(f"LRU 세션 {evicted}개 제거")
+
+        return session
+
+    def save(self, session_id: str, session: Session) -> None:
+        """수정된 세션을 백엔드에 반영"""
+        self.put(session_id, session)
+
+    def delete(self, session_id: str) -> bool:
+        """세션 삭제"""
+        if not self.backend.delete(session_id):
+            return False
+        self._counters["deleted"] += 1
+        return True
+
+    def _evict(self, session_id: str, reason: str) -> None:
+        try:
+            deleted = self.backend.delete(session_id)
+        except Exception as e:
+            # 다른 워커가 쓰는 중 등 - 만료 세션은 다음 sweep에서 제거
+            logger.debug(f"세션 제거 보류: {session_id} ({e})")
+            return
+        if deleted:
+            self._counters[reason] += 1
+            logger.debug(f"세션 제거: {session_id} ({reason})")
+
+    def sweep(self) -> int:
+        """만료된 세션 일괄 제거"""
+        if self.ttl_seconds <= 0:
+            return 0
+
+        removed = self.backend.delete_expired(time.time() - self.ttl_seconds)
+        if removed:
+            self._counters["evicted_ttl"] += removed
+            logger.info(f"만료 세션 {removed}개 제거 (남은 세션: {self.backend.count()})")
+        return removed
+
+    async def _sweep_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval_seconds)
+            try:
+                if self.backend.thread_safe:
+                    # 대량 삭제가 이벤트 루프를 막지 않도록 스레드에서 실행
+                    await asyncio.to_thread(self.sweep)
+                else:
+                    # 락이 없는 백엔드는 루프에서 실행 (만료된 세션 수에 비례하는 작업)
+                    self.sweep()
+            except Exception as e:
+                logger.error(f"세션 sweep 실패: {e}")
+
+    def start_sweeper(self) -> None:
+        """백그라운드 만료 세션 정리 태스크 시작"""
+        if self._sweeper_task and not self._sweeper_task.done():
+            return
+        if self.ttl_seconds <= 0 or self.sweep_interval_seconds <= 0:
+            return
+        self._sweeper_task = asyncio.create_task(self._sweep_loop())
+
+    async def stop_sweeper(self) -> None:
+        """백그라운드 정리 태스크 종료"""
+        task, self._sweeper_task = self._sweeper_task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def close(self) -> None:
+        """백엔드 연결 종료"""
+        self.backend.close()
+
+    def stats(self) -> dict:
+        """세션 저장소 통계"""
+        return {
+            "backend": type(self.backend).__name__,
+            "active_sessions": self.backend.count(),
+            "max_sessions": self.max_sessions,
+            "ttl_seconds": self.ttl_seconds,
+            "active_locks": len(self.locks),
+            "lock_contended": self.locks.contended,
+            **self._counters,
+        }
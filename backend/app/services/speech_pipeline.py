@@ -0,0 +1,120 @@
+"""
+토론 음성 파이프라인
+토론 엔진의 토큰 스트림에서 문장이 완성될 때마다 바로 TTS를 요청해
+James/Linda가 응답을 생성하는 도중에도 앞 문장의 음성을 클라이언트에 보냅니다.
+
+텍스트 이벤트는 엔진에서 받는 즉시, 오디오 이벤트는 토론자별 문장 순서대로
+합성이 끝나는 대로 하나의 (event, data) 스트림으로 섞어 내보냅니다.
+"""
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Tuple
+import asyncio
+import base64
+import logging
+
+from app.core.config import settings
+from app.models.schemas import DebaterRole
+from app.services.voice_service import SentenceBuffer, VoiceService
+
+logger = logging.getLogger(__name__)
+
+_DEBATERS = {"james": DebaterRole.JAMES, "linda": DebaterRole.LINDA}
+
+
+async def stream_debate_speech(
+    events: AsyncIterator[Tuple[str, Dict[str, Any]]],
+    voice_service: VoiceService,
+    window: Optional[int] = None,
+) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """
+    토론 이벤트 스트림에 문장 단위 오디오 이벤트를 더해 내보냄
+
+    추가 이벤트:
+        {debater}_audio: {"seq", "text", "audio"} 문장 하나의 MP3 (base64)
+        {debater}_audio_error: {"seq", "text", "detail"} 합성 실패 (텍스트 스트림은 계속)
+
+    tokens_earned는 모든 오디오를 보낸 뒤 마지막 이벤트로 내보냅니다.
+
+    Args:
+        events: DebateEngine.stream_message 이벤트 스트림
+        voice_service: TTS 서비스
+        window: 동시에 합성할 최대 문장 수 (None이면 TTS_PIPELINE_WINDOW)
+    """
+    semaphore = asyncio.Semaphore(max(1, window or settings.TTS_PIPELINE_WINDOW))
+    buffers = {
+        name: SentenceBuffer(settings.TTS_SPEECH_MIN_CHARS, settings.TTS_PIPELINE_CHUNK_CHARS)
+        for name in _DEBATERS
+    }
+    sequences = {name: 0 for name in _DEBATERS}
+    # 요청 순서대로 대기 중인 합성 (debater, seq, text, task)
+    pending: Deque[Tuple[str, int, str, asyncio.Task]] = deque()
+    final: Optional[Dict[str, Any]] = None
+
+    async def synthesize(text: str, voice: DebaterRole) -> bytes:
+        async with semaphore:
+            return await voice_service.synthesize(text, voice)
+
+    def schedule(debater: str, text: Optional[str]):
+        if not text:
+            return
+        task = asyncio.create_task(synthesize(text, _DEBATERS[debater]))
+        pending.append((debater, sequences[debater], text, task))
+        sequences[debater] += 1
+
+    next_event: Optional[asyncio.Future] = asyncio.ensure_future(events.__anext__())
+    try:
+        while next_event is not None or pending:
+            waiting = {next_event} if next_event is not None else set()
+            if pending:
+                waiting.add(pending[0][3])
+            await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+
+            # 앞 문장부터 순서대로 완료된 오디오 전달
+            while pending and pending[0][3].done():
+                debater, seq, text, task = pending.popleft()
+                try:
+                    audio = task.result()
+                except Exception as e:
+                    logger.error(f"{debater} 문장 음성 합성 실패: {e}")
+                    yield f"{debater}_audio_error", {"seq": seq, "text": text, "detail": str(e)}
+                    continue
+                yield f"{debater}_audio", {
+                    "seq": seq,
+                    "text": text,
+                    "audio": base64.b64encode(audio).decode("ascii"),
+                }
+
+            if next_event is None or not next_event.done():
+                continue
+            try:
+                event, data = next_event.result()
+            except StopAsyncIteration:
+                next_event = None
+                continue
+            # 클라이언트로 보내는 동안 다음 토큰 생성을 계속 진행
+            next_event = asyncio.ensure_future(events.__anext__())
+
+            debater, _, kind = event.partition("_")
+            if event == "tokens_earned":
+                final = data
+                continue
+            yield event, data
+            if debater in buffers:
+                if kind == "delta":
+                    for sentence in buffers[debater].feed(data["delta"]):
+                        schedule(debater, sentence)
+                elif kind == "done":
+                    schedule(debater, buffers[debater].flush())
+
+        if final is not None:
+            yield "tokens_earned", final
+    finally:
+        # 중간에 실패하거나 클라이언트가 떠나면 남은 생성/합성 취소
+        tasks = [task for _, _, _, task in pending]
+        if next_event is not None:
+            tasks.append(next_event)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        await events.aclose()
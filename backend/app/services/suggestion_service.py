@@ -3,51 +3,106 @@
 토론 중 사용자에게 추천 버튼을 제공하는 서비스
 """
 from pathlib import Path
-from typing import List, Literal, Optional
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Sequence, Tuple
+import asyncio
+import hashlib
 import json
 import re
 import logging
+import time
 
-from langchain_nvidia_ai_endpoints import ChatNVIDIA
 from langchain_core.messages import HumanMessage
 
 from app.core.config import settings
+from app.core.json_stream import JSONArrayItemParser
+from app.core.single_flight import SingleFlight
+from app.core.ttl_cache import TTLCache
 from app.models.schemas import Suggestion, SuggestionType, SuggestionTarget
+from app.services.llm_gateway import GatewayLLM, Priority, get_llm_gateway
 
 logger = logging.getLogger(__name__)
 
+SUGGESTION_TYPES = ("topic", "question", "argument")
+
+# 배치 프롬프트의 유형별 요구사항 및 출력 예시
+BATCH_SECTIONS = {
+    "topic": (
+        "### topic: 토론 주제 5개\n"
+        "- 강의 내용과 직접 연관되고 찬반 양론이 명확한 주제\n"
+        "- 15-30자 내외의 질문 형태",
+        '{{ "id": "1", "text": "[강의 관련 토론 주제]", "type": "topic" }}',
+    ),
+    "question": (
+        "### question: 토론 상대에게 던질 질문 5개\n"
+        "- 근거 요청/반례 제시/구체화/확장/비교를 골고루 포함\n"
+        "- 15-35자 내외, 공격적이지 않은 호기심 어린 질문\n"
+        "- 제임스에게 2-3개, 린다에게 2-3개 분배 (target: james/linda/general)",
+        '{{ "id": "1", "text": "제임스, 그런 사례가 실제로 있어요?", "type": "question", "target": "james" }}',
+    ),
+    "argument": (
+        "### argument: 내가 발언할 논점 5개\n"
+        "- 주장 강화/반박/예시/인정+반론/정리를 골고루 포함\n"
+        "- 20-40자 내외, 바로 전송 가능한 완전한 문장 (target: james/linda/general)",
+        '{{ "id": "1", "text": "그 점은 맞지만, 현실적인 문제가 있어요", "type": "argument", "target": "general" }}',
+    ),
+}
+
+
+class PrefetchEntry:
+    """토론 턴 직후 미리 시작한 추천 생성 작업"""
+    
+    __slots__ = ("task", "request_key", "created_at")
+    
+    def __init__(self, task: asyncio.Task, request_key: Tuple[str, ...]):
+        self.task = task
+        # 생성에 사용한 입력 (SuggestionService._request_key) - 같은 입력의 요청에만 사용
+        self.request_key = request_key
+        self.created_at = time.monotonic()
+
 
 class SuggestionService:
     """추천 생성 서비스"""
     
+    # 추천 최대 개수
+    MAX_SUGGESTIONS = 6
+    
     def __init__(self):
-        self.llm: Optional[ChatNVIDIA] = None
+        self.llm: Optional[GatewayLLM] = None
+        # 배치 생성용 (여러 유형을 한 번에 생성하므로 출력 토큰 한도를 늘림)
+        self.batch_llm: Optional[GatewayLLM] = None
         self.prompts: dict = {}
+        # 동일 입력의 동시 요청은 하나의 LLM 호출을 공유
+        self._single_flight = SingleFlight()
+        # 포맷된 프롬프트 해시 → 파싱 성공한 추천 목록
+        self._cache = TTLCache(settings.SUGGESTION_CACHE_MAX_ENTRIES)
+        # (session_id, 추천 유형) → 미리 시작한 추천 생성 작업
+        self._prefetched: Dict[Tuple[str, str], PrefetchEntry] = {}
+        self._prefetch_stats = {"started": 0, "served": 0, "stale": 0, "expired": 0}
         self._init_llm()
         self._load_prompts()
     
     def _init_llm(self):
-        """NVIDIA LLM 초기화"""
-        if settings.NVIDIA_API_KEY:
-            try:
-                self.llm = ChatNVIDIA(
-                    model="meta/llama-3.1-8b-instruct",
-                    nvidia_api_key=settings.NVIDIA_API_KEY,
-                    temperature=0.8,
-                    max_tokens=512,
-                )
-                logger.info("Suggestion LLM 초기화 완료")
-            except Exception as e:
-                logger.warning(f"Suggestion LLM 초기화 실패: {e}")
-                self.llm = None
-        else:
-            logger.warning("NVIDIA_API_KEY가 설정되지 않았습니다.")
+        """NVIDIA LLM 초기화 (추천 우선순위로 게이트웨이에 연결)"""
+        self.llm = get_llm_gateway().bind(
+            model="meta/llama-3.1-8b-instruct",
+            temperature=0.8,
+            max_tokens=512,
+            priority=Priority.SUGGESTION,
+        )
+        if self.llm:
+            self.batch_llm = get_llm_gateway().bind(
+                model="meta/llama-3.1-8b-instruct",
+                temperature=0.8,
+                max_tokens=1024,
+                priority=Priority.SUGGESTION,
+            )
+            logger.info("Suggestion LLM 초기화 완료")
     
     def _load_prompts(self):
         """프롬프트 파일 로드"""
         prompts_dir = Path(__file__).parent.parent / "prompts" / "suggestion_prompts"
         
-        for prompt_type in ["topic", "question", "argument"]:
+        for prompt_type in [*SUGGESTION_TYPES, "batch"]:
             prompt_path = prompts_dir / f"{prompt_type}.txt"
             if prompt_path.exists():
                 self.prompts[prompt_type] = prompt_path.read_text(encoding="utf-8")
@@ -57,6 +112,11 @@ class SuggestionService:
     
     def _get_default_prompt(self, prompt_type: str) -> str:
         """기본 프롬프트 반환"""
+        if prompt_type == "batch":
+            return """요청된 추천 목록을 생성해주세요. 강의: {lecture_context}, 주제: {topic}
+{sections}
+JSON 객체로만 응답하세요.
+{schema}"""
         if prompt_type == "topic":
             return """토론 주제 5개를 추천해주세요. JSON 배열로만 응답하세요.
 [{"id": "1", "text": "주제", "type": "topic"}]"""
@@ -68,35 +128,77 @@ class SuggestionService:
 [{"id": "1", "text": "발언", "type": "argument", "target": "general"}]"""
     
     def _parse_suggestions(self, content: str, suggestion_type: str, topic: str = "") -> List[Suggestion]:
-        """LLM 응답에서 추천 목록 파싱"""
+        """LLM 응답에서 추천 목록 파싱 (실패 시 기본 추천)"""
+        suggestions = self._try_parse_suggestions(content, suggestion_type)
+        if suggestions is None:
+            return self._get_fallback_suggestions(suggestion_type, topic)
+        return suggestions
+    
+    def _try_parse_suggestions(self, content: str, suggestion_type: str) -> Optional[List[Suggestion]]:
+        """LLM 응답에서 추천 목록 파싱 (실패 시 None)"""
         try:
             # JSON 배열 추출 (```json ... ``` 형식 처리)
             json_match = re.search(r'\[[\s\S]*\]', content)
             if not json_match:
                 logger.error(f"JSON 배열을 찾을 수 없음: {content[:200]}")
-                return self._get_fallback_suggestions(suggestion_type, topic)
+                return None
             
             json_str = json_match.group()
             data = json.loads(json_str)
+            return self._suggestions_from_items(data, suggestion_type)
             
-            suggestions = []
-            for item in data:
-                target = item.get("target")
-                if target:
-                    target = SuggestionTarget(target) if target in ["james", "linda", "general"] else None
-                
-                suggestions.append(Suggestion(
-                    id=str(item.get("id", len(suggestions) + 1)),
-                    text=item.get("text", ""),
-                    type=SuggestionType(suggestion_type),
-                    target=target
-                ))
-            
-            return suggestions[:6]  # 최대 6개
-            
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
+        except (json.JSONDecodeError, KeyError, ValueError, AttributeError, TypeError) as e:
             logger.error(f"추천 파싱 실패: {e}, content: {content[:200]}")
-            return self._get_fallback_suggestions(suggestion_type, topic)
+            return None
+    
+    def _suggestions_from_items(self, data: list, suggestion_type: str) -> List[Suggestion]:
+        """JSON 항목 목록을 추천 목록으로 변환"""
+        suggestions = []
+        for item in data:
+            suggestions.append(self._suggestion_from_item(item, suggestion_type, len(suggestions) + 1))
+        
+        return suggestions[:self.MAX_SUGGESTIONS]
+    
+    def _suggestion_from_item(self, item: dict, suggestion_type: str, default_id: int) -> Suggestion:
+        """JSON 항목 하나를 추천으로 변환"""
+        target = item.get("target")
+        if target:
+            target = SuggestionTarget(target) if target in ["james", "linda", "general"] else None
+        
+        return Suggestion(
+            id=str(item.get("id", default_id)),
+            text=item.get("text", ""),
+            type=SuggestionType(suggestion_type),
+            target=target
+        )
+    
+    def _try_parse_batch(self, content: str, suggestion_types: Sequence[str]) -> Dict[str, List[Suggestion]]:
+        """배치 LLM 응답({유형: [...]})을 유형별 추천 목록으로 분리 (파싱된 유형만 포함)"""
+        try:
+            json_match = re.search(r'\{[\s\S]*\}', content)
+            if not json_match:
+                logger.error(f"JSON 객체를 찾을 수 없음: {content[:200]}")
+                return {}
+            data = json.loads(json_match.group())
+        except json.JSONDecodeError as e:
+            logger.error(f"배치 추천 파싱 실패: {e}, content: {content[:200]}")
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        
+        results: Dict[str, List[Suggestion]] = {}
+        for suggestion_type in suggestion_types:
+            items = data.get(suggestion_type)
+            if not isinstance(items, list):
+                continue
+            try:
+                suggestions = self._suggestions_from_items(items, suggestion_type)
+            except (KeyError, ValueError, AttributeError, TypeError) as e:
+                logger.error(f"배치 추천 파싱 실패 ({suggestion_type}): {e}")
+                continue
+            if suggestions:
+                results[suggestion_type] = suggestions
+        return results
     
     def _get_fallback_suggestions(self, suggestion_type: str, topic: str = "") -> List[Suggestion]:
         """파싱 실패 시 기본 추천 반환 (강의/주제 관련)"""
@@ -128,7 +230,9 @@ class SuggestionService:
         user_position: str = "",
         james_last: str = "",
         linda_last: str = "",
-        lecture_context: str = ""
+        lecture_context: str = "",
+        bypass_cache: bool = False,
+        session_id: str = "",
     ) -> List[Suggestion]:
         """
         추천 생성
@@ -140,6 +244,8 @@ class SuggestionService:
             james_last: 제임스 마지막 발언
             linda_last: 린다 마지막 발언
             lecture_context: 강의 컨텍스트
+            bypass_cache: True면 캐시를 건너뛰고 새로 생성 (결과는 캐시에 갱신)
+            session_id: 세션 ID (미리 생성된 추천이 있으면 사용)
         
         Returns:
             추천 목록
@@ -148,30 +254,396 @@ class SuggestionService:
             logger.warning("LLM이 없어 기본 추천 반환")
             return self._get_fallback_suggestions(suggestion_type, topic)
         
+        # 토론 턴 직후 미리 시작한 작업이 있으면 결과를 받거나 진행 중인 작업에 합류
+        if session_id and not bypass_cache:
+            entry = self._take_prefetched(
+                session_id,
+                self._request_key(suggestion_type, topic, user_position, james_last, linda_last, lecture_context),
+            )
+            if entry is not None:
+                return list(await asyncio.shield(entry.task))
+        
         try:
-            # 프롬프트 준비
-            prompt_template = self.prompts.get(suggestion_type, "")
-            position_label = "찬성" if user_position == "pro" else "반대" if user_position == "con" else "미정"
-            
-            # 강의 컨텍스트가 없으면 topic을 사용
-            effective_lecture_context = lecture_context or topic or "(강의 정보 없음)"
-            
-            prompt = prompt_template.format(
-                topic=topic or "자유 토론",
-                user_position=user_position or "미정",
-                position_label=position_label,
-                james_last=james_last or "(아직 발언 없음)",
-                linda_last=linda_last or "(아직 발언 없음)",
-                lecture_context=effective_lecture_context
+            prompt = self._format_prompt(
+                suggestion_type, topic, user_position, james_last, linda_last, lecture_context
             )
-            
-            logger.info(f"추천 생성 요청 - type: {suggestion_type}, lecture_context: {effective_lecture_context[:100]}...")
+        except (KeyError, IndexError, ValueError) as e:
+            logger.error(f"추천 프롬프트 구성 실패: {e}")
+            return self._get_fallback_suggestions(suggestion_type, topic)
+        
+        # 같은 프롬프트의 이전 결과 재사용
+        cache_key = self._cache_key(suggestion_type, prompt)
+        if not bypass_cache:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return list(cached)
+        
+        key = self._request_key(suggestion_type, topic, user_position, james_last, linda_last, lecture_context)
+        suggestions = await self._single_flight.do(
+            key,
+            lambda: self._generate(suggestion_type, topic, prompt, cache_key),
+        )
+        return list(suggestions)
+    
+    async def generate_batch(
+        self,
+        suggestion_types: Sequence[str],
+        topic: str = "",
+        user_position: str = "",
+        james_last: str = "",
+        linda_last: str = "",
+        lecture_context: str = "",
+        bypass_cache: bool = False,
+    ) -> Dict[str, List[Suggestion]]:
+        """
+        여러 유형의 추천을 한 번의 LLM 호출로 생성
+        
+        유형별 캐시에 있는 결과는 그대로 사용하고, 나머지 유형만 결합 JSON 스키마로
+        한 번에 요청합니다. 파싱에 실패한 유형은 유형별 기본 추천을 반환합니다.
+        
+        Args:
+            suggestion_types: 추천 유형 목록 (topic/question/argument)
+            bypass_cache: True면 캐시를 건너뛰고 새로 생성 (결과는 캐시에 갱신)
+        
+        Returns:
+            {추천 유형: 추천 목록}
+        """
+        suggestion_types = list(dict.fromkeys(suggestion_types))
+        if not (self.llm and self.batch_llm):
+            logger.warning("LLM이 없어 기본 추천 반환")
+            return {
+                suggestion_type: self._get_fallback_suggestions(suggestion_type, topic)
+                for suggestion_type in suggestion_types
+            }
+        
+        inputs = (topic, user_position, james_last, linda_last, lecture_context)
+        results: Dict[str, List[Suggestion]] = {}
+        cache_keys: Dict[str, str] = {}
+        for suggestion_type in suggestion_types:
+            try:
+                prompt = self._format_prompt(suggestion_type, *inputs)
+            except (KeyError, IndexError, ValueError) as e:
+                logger.error(f"추천 프롬프트 구성 실패: {e}")
+                results[suggestion_type] = self._get_fallback_suggestions(suggestion_type, topic)
+                continue
+            cache_keys[suggestion_type] = self._cache_key(suggestion_type, prompt)
+            cached = None if bypass_cache else self._cache.get(cache_keys[suggestion_type])
+            if cached is not None:
+                results[suggestion_type] = list(cached)
+        
+        missing = [suggestion_type for suggestion_type in suggestion_types if suggestion_type not in results]
+        if len(missing) == 1:
+            results[missing[0]] = await self.generate_suggestions(
+                missing[0], *inputs, bypass_cache=bypass_cache
+            )
+        elif missing:
+            key = self._request_key(f"batch:{','.join(missing)}", *inputs)
+            generated = await self._single_flight.do(
+                key,
+                lambda: self._generate_batch(missing, inputs, cache_keys),
+            )
+            for suggestion_type in missing:
+                results[suggestion_type] = list(generated[suggestion_type])
+        
+        return {suggestion_type: results[suggestion_type] for suggestion_type in suggestion_types}
+    
+    async def _generate_batch(
+        self,
+        suggestion_types: List[str],
+        inputs: Tuple[str, str, str, str, str],
+        cache_keys: Dict[str, str],
+    ) -> Dict[str, List[Suggestion]]:
+        """결합 프롬프트 한 번으로 여러 유형 생성 (유형별 파싱 성공 시 캐시, 실패 시 기본 추천)"""
+        topic = inputs[0]
+        parsed: Dict[str, List[Suggestion]] = {}
+        try:
+            prompt = self._format_batch_prompt(suggestion_types, *inputs)
+            logger.info(f"배치 추천 생성 요청 - types: {suggestion_types}, prompt: {len(prompt)}자")
+            response = await self.batch_llm.ainvoke([HumanMessage(content=prompt)])
+            parsed = self._try_parse_batch(response.content, suggestion_types)
+        except Exception as e:
+            logger.error(f"배치 추천 생성 실패: {e}")
+        
+        results: Dict[str, List[Suggestion]] = {}
+        for suggestion_type in suggestion_types:
+            suggestions = parsed.get(suggestion_type)
+            if suggestions:
+                if suggestion_type in cache_keys:
+                    self._cache.set(cache_keys[suggestion_type], suggestions, self._cache_ttl(suggestion_type))
+                results[suggestion_type] = suggestions
+            else:
+                results[suggestion_type] = self._get_fallback_suggestions(suggestion_type, topic)
+        
+        logger.info(f"배치 추천 생성 완료: {', '.join(f'{t} {len(s)}개' for t, s in results.items())}")
+        return results
+    
+    def _format_batch_prompt(
+        self,
+        suggestion_types: Sequence[str],
+        topic: str,
+        user_position: str,
+        james_last: str,
+        linda_last: str,
+        lecture_context: str,
+    ) -> str:
+        """배치 프롬프트 구성 (요청 유형별 요구사항 + 결합 JSON 스키마)"""
+        sections = "\n\n".join(BATCH_SECTIONS[suggestion_type][0] for suggestion_type in suggestion_types)
+        schema = "{{\n" + ",\n".join(
+            f'  "{suggestion_type}": [\n    {BATCH_SECTIONS[suggestion_type][1]}\n  ]'
+            for suggestion_type in suggestion_types
+        ) + "\n}}"
+        # 섹션/스키마를 먼저 넣고 나머지 치환은 유형별 프롬프트와 동일하게 처리
+        template = self.prompts.get("batch", "").replace("{sections}", sections).replace("{schema}", schema)
+        return self._format_template(template, topic, user_position, james_last, linda_last, lecture_context)
+    
+    def _format_prompt(
+        self,
+        suggestion_type: str,
+        topic: str,
+        user_position: str,
+        james_last: str,
+        linda_last: str,
+        lecture_context: str,
+    ) -> str:
+        """추천 유형별 프롬프트 구성"""
+        return self._format_template(
+            self.prompts.get(suggestion_type, ""),
+            topic, user_position, james_last, linda_last, lecture_context,
+        )
+    
+    def _format_template(
+        self,
+        prompt_template: str,
+        topic: str,
+        user_position: str,
+        james_last: str,
+        linda_last: str,
+        lecture_context: str,
+    ) -> str:
+        """프롬프트 템플릿에 토론 상황 치환"""
+        position_label = "찬성" if user_position == "pro" else "반대" if user_position == "con" else "미정"
+        
+        # 강의 컨텍스트가 없으면 topic을 사용
+        effective_lecture_context = lecture_context or topic or "(강의 정보 없음)"
+        
+        return prompt_template.format(
+            topic=topic or "자유 토론",
+            user_position=user_position or "미정",
+            position_label=position_label,
+            james_last=james_last or "(아직 발언 없음)",
+            linda_last=linda_last or "(아직 발언 없음)",
+            lecture_context=effective_lecture_context
+        )
+    
+    def prefetch(
+        self,
+        session_id: str,
+        suggestion_types: Sequence[str],
+        topic: str = "",
+        user_position: str = "",
+        james_last: str = "",
+        linda_last: str = "",
+        lecture_context: str = "",
+    ):
+        """
+        토론 턴 직후 추천 생성을 백그라운드로 시작
+        
+        결과는 (session_id, 추천 유형)별로 보관되며, 같은 입력(주제/입장/마지막 발언/강의 컨텍스트)으로
+        들어온 generate_suggestions 요청이 한 번 가져갑니다.
+        """
+        if not self.llm:
+            return
+        self._prune_prefetched()
+        
+        for suggestion_type in suggestion_types:
+            task = asyncio.create_task(self.generate_suggestions(
+                suggestion_type,
+                topic=topic,
+                user_position=user_position,
+                james_last=james_last,
+                linda_last=linda_last,
+                lecture_context=lecture_context,
+            ))
+            self._prefetched[(session_id, suggestion_type)] = PrefetchEntry(
+                task,
+                self._request_key(suggestion_type, topic, user_position, james_last, linda_last, lecture_context),
+            )
+            self._prefetch_stats["started"] += 1
+    
+    def _take_prefetched(self, session_id: str, request_key: Tuple[str, ...]) -> Optional[PrefetchEntry]:
+        """입력이 일치하는 미리 생성된 추천 작업 꺼내기 (일회성, request_key[0]은 추천 유형)"""
+        entry = self._prefetched.pop((session_id, request_key[0]), None)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.created_at > settings.SUGGESTION_PREFETCH_TTL_SECONDS:
+            self._prefetch_stats["expired"] += 1
+            return None
+        if entry.request_key != request_key:
+            self._prefetch_stats["stale"] += 1
+            return None
+        self._prefetch_stats["served"] += 1
+        return entry
+    
+    def _has_prefetched(self, session_id: str, request_key: Tuple[str, ...]) -> bool:
+        """입력이 일치하는 미리 생성된 추천 작업이 있는지 (꺼내지 않음)"""
+        entry = self._prefetched.get((session_id, request_key[0]))
+        return entry is not None and entry.request_key == request_key
+    
+    def _prune_prefetched(self):
+        """보관 기간이 지난 미리 생성된 추천 제거"""
+        cutoff = time.monotonic() - settings.SUGGESTION_PREFETCH_TTL_SECONDS
+        expired = [key for key, entry in self._prefetched.items() if entry.created_at < cutoff]
+        for key in expired:
+            del self._prefetched[key]
+        self._prefetch_stats["expired"] += len(expired)
+    
+    async def aclose(self):
+        """진행 중인 미리 생성 작업 취소 (앱 종료 시 호출)"""
+        tasks = [entry.task for entry in self._prefetched.values()]
+        self._prefetched.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def _cache_key(self, suggestion_type: str, prompt: str) -> str:
+        """결과 캐시 키 (추천 유형 + 포맷된 프롬프트 해시)"""
+        return hashlib.sha256(f"{suggestion_type}\n{prompt}".encode("utf-8")).hexdigest()
+    
+    def _cache_ttl(self, suggestion_type: str) -> float:
+        """추천 유형별 캐시 TTL (초)"""
+        if suggestion_type == "topic":
+            return settings.SUGGESTION_CACHE_TTL_TOPIC_SECONDS
+        if suggestion_type == "question":
+            return settings.SUGGESTION_CACHE_TTL_QUESTION_SECONDS
+        return settings.SUGGESTION_CACHE_TTL_ARGUMENT_SECONDS
+    
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """공백 정규화"""
+        return " ".join((text or "").split())
+    
+    async def stream_suggestions(
+        self,
+        suggestion_type: Literal["topic", "question", "argument"],
+        topic: str = "",
+        user_position: str = "",
+        james_last: str = "",
+        linda_last: str = "",
+        lecture_context: str = "",
+        bypass_cache: bool = False,
+        session_id: str = "",
+    ) -> AsyncIterator[Suggestion]:
+        """
+        추천 스트리밍 생성
+        
+        LLM 스트리밍 출력을 증분 JSON 배열 파서에 넣어 항목 객체가 닫히는 즉시
+        추천을 하나씩 내보냅니다 (최대 MAX_SUGGESTIONS개). 캐시/미리 생성된 결과가
+        있으면 그대로 내보내고, 하나도 만들지 못하면 기본 추천을 내보냅니다.
+        """
+        if not self.llm:
+            logger.warning("LLM이 없어 기본 추천 반환")
+            for suggestion in self._get_fallback_suggestions(suggestion_type, topic):
+                yield suggestion
+            return
+        
+        # 캐시된 결과는 그대로, 미리 생성된 작업이 있으면 일반 경로로 처리
+        try:
+            prompt = self._format_prompt(
+                suggestion_type, topic, user_position, james_last, linda_last, lecture_context
+            )
+        except (KeyError, IndexError, ValueError) as e:
+            logger.error(f"추천 프롬프트 구성 실패: {e}")
+            prompt = None
+        cache_key = self._cache_key(suggestion_type, prompt) if prompt is not None else None
+        cached = None if (prompt is None or bypass_cache) else self._cache.get(cache_key)
+        if cached is not None:
+            for suggestion in cached:
+                yield suggestion
+            return
+        if prompt is None or (session_id and not bypass_cache and self._has_prefetched(
+            session_id,
+            self._request_key(suggestion_type, topic, user_position, james_last, linda_last, lecture_context),
+        )):
+            for suggestion in await self.generate_suggestions(
+                suggestion_type, topic, user_position, james_last, linda_last, lecture_context,
+                bypass_cache=bypass_cache, session_id=session_id,
+            ):
+                yield suggestion
+            return
+        
+        suggestions: List[Suggestion] = []
+        parser = JSONArrayItemParser()
+        logger.info(f"추천 스트리밍 생성 요청 - type: {suggestion_type}, prompt: {len(prompt)}자")
+        stream = self.llm.astream([HumanMessage(content=prompt)])
+        try:
+            async for chunk in stream:
+                for item in parser.feed(chunk.content or ""):
+                    try:
+                        suggestion = self._suggestion_from_item(item, suggestion_type, len(suggestions) + 1)
+                    except (KeyError, ValueError, AttributeError, TypeError) as e:
+                        logger.error(f"추천 항목 파싱 실패: {e}, item: {item}")
+                        continue
+                    suggestions.append(suggestion)
+                    yield suggestion
+                    if len(suggestions) >= self.MAX_SUGGESTIONS:
+                        break
+                # 배열이 닫히거나 최대 개수에 도달하면 나머지 출력은 기다리지 않음
+                if parser.done or len(suggestions) >= self.MAX_SUGGESTIONS:
+                    break
+        except Exception as e:
+            logger.error(f"추천 스트리밍 생성 실패: {e}")
+        finally:
+            # 게이트웨이 슬롯 즉시 반환
+            await stream.aclose()
+        
+        if not suggestions:
+            for suggestion in self._get_fallback_suggestions(suggestion_type, topic):
+                yield suggestion
+            return
+        
+        self._cache.set(cache_key, suggestions, self._cache_ttl(suggestion_type))
+        logger.info(f"추천 스트리밍 생성 완료: {suggestion_type}, {len(suggestions)}개")
+    
+    def _request_key(
+        self,
+        suggestion_type: str,
+        topic: str,
+        user_position: str,
+        james_last: str,
+        linda_last: str,
+        lecture_context: str,
+    ) -> Tuple[str, ...]:
+        """요청 병합 키 (공백 정규화, 강의 컨텍스트는 해시)"""
+        normalize = self._normalize
+        lecture_hash = hashlib.sha256(normalize(lecture_context).encode("utf-8")).hexdigest()
+        return (
+            suggestion_type,
+            normalize(topic),
+            normalize(user_position),
+            normalize(james_last),
+            normalize(linda_last),
+            lecture_hash,
+        )
+    
+    async def _generate(
+        self,
+        suggestion_type: str,
+        topic: str,
+        prompt: str,
+        cache_key: str,
+    ) -> List[Suggestion]:
+        """LLM 호출로 추천 생성 (파싱 성공 시 캐시에 저장, 실패 시 기본 추천)"""
+        try:
+            logger.info(f"추천 생성 요청 - type: {suggestion_type}, prompt: {len(prompt)}자")
             
             # LLM 호출
             response = await self.llm.ainvoke([HumanMessage(content=prompt)])
             
             # 파싱
-            suggestions = self._parse_suggestions(response.content, suggestion_type, topic)
+            suggestions = self._try_parse_suggestions(response.content, suggestion_type)
+            if not suggestions:
+                return self._get_fallback_suggestions(suggestion_type, topic)
+            self._cache.set(cache_key, suggestions, self._cache_ttl(suggestion_type))
             
             logger.info(f"추천 생성 완료: {suggestion_type}, {len(suggestions)}개")
             return suggestions
@@ -179,6 +651,14 @@ class SuggestionService:
         except Exception as e:
             logger.error(f"추천 생성 실패: {e}")
             return self._get_fallback_suggestions(suggestion_type, topic)
+    
+    def stats(self) -> Dict[str, Any]:
+        """추천 서비스 지표 (결과 캐시, 요청 병합)"""
+        return {
+            "cache": self._cache.stats(),
+            "single_flight": self._single_flight.stats(),
+            "prefetch": {"pending": len(self._prefetched), **self._prefetch_stats},
+        }
 
 
 # 싱글톤 인스턴스
@@ -1,24 +1,131 @@
 """
 음성 서비스 (ElevenLabs TTS)
 """
-from typing import Optional, AsyncIterator
+from collections import deque
+from typing import Deque, List, Optional, AsyncIterator
+import asyncio
 import logging
+import re
 from app.core.config import settings
+from app.core.http_client import get_http_client
 from app.models.schemas import DebaterRole
+from app.services.audio_cache import AudioCache, audio_cache_key, get_audio_cache
+from app.services.circuit_breaker import get_circuit_breaker
 import json
 import httpx
 
 logger = logging.getLogger(__name__)
 
+# 문장 경계: 마침표/물음표/느낌표(한국어 종결 포함) 뒤 공백, 또는 줄바꿈
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?。…])\s+|\n+")
+
+
+def split_tts_chunks(text: str, max_chars: int) -> List[str]:
+    """
+    파이프라인 합성용 텍스트 분할
+
+    첫 청크는 첫 문장만 담아 첫 오디오가 빨리 나오게 하고,
+    이후 문장은 max_chars 이하로 묶습니다 (너무 짧은 청크는 억양이 부자연스러움).
+    max_chars보다 긴 문장은 공백 기준으로 자릅니다.
+    """
+    sentences: List[str] = []
+    for sentence in _SENTENCE_BOUNDARY.split(text):
+        sentence = sentence.strip()
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars)
+            if cut <= 0:
+                cut = max_chars
+            sentences.append(sentence[:cut].strip())
+            sentence = sentence[cut:].strip()
+        if sentence:
+            sentences.append(sentence)
+    
+    if not sentences:
+        return []
+    chunks = [sentences[0]]
+    current = ""
+    for sentence in sentences[1:]:
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class SentenceBuffer:
+    """
+    LLM 스트리밍 토큰을 모아 완성된 문장 단위로 내보내는 버퍼
+
+    문장 경계 뒤에 공백이 와야 완성된 것으로 보고 (예: "3.5"는 나누지 않음),
+    min_chars보다 짧은 문장은 다음 문장과 합칩니다. 경계 없이 max_chars를 넘으면
+    마지막 공백에서 자릅니다.
+    """
+
+    _COMPLETE = re.compile(r"[.!?。…]+\s+|\n+")
+
+    def __init__(self, min_chars: int, max_chars: int):
+        self.min_chars = min_chars
+        self.max_chars = max_chars
+        self._text = ""
+
+    def feed(self, delta: str) -> List[str]:
+        """토큰 추가 후 완성된 문장 목록 반환"""
+        self._text += delta
+        sentences: List[str] = []
+        start = 0
+        for match in self._COMPLETE.finditer(self._text):
+            if len(self._text[start:match.end()].strip()) >= self.min_chars:
+                sentences.append(self._text[start:match.end()].strip())
+                start = match.end()
+        self._text = self._text[start:]
+
+        while len(self._text) > self.max_chars:
+            cut = self._text.rfind(" ", 0, self.max_chars)
+            if cut <= 0:
+                cut = self.max_chars
+            sentences.append(self._text[:cut].strip())
+            self._text = self._text[cut:].lstrip()
+        return [sentence for sentence in sentences if sentence]
+
+    def flush(self) -> Optional[str]:
+        """남은 텍스트 반환 (응답 완료 시)"""
+        text, self._text = self._text.strip(), ""
+        return text or None
+
 
 class VoiceService:
     """ElevenLabs TTS 서비스"""
     
-    def __init__(self):
+    MODEL_ID = "eleven_multilingual_v2"
+    # 일반/스트리밍 합성 공통 음성 설정 (같은 문장은 같은 캐시 항목 사용)
+    VOICE_SETTINGS = {
+        "stability": 0.5,
+        "similarity_boost": 0.75,
+        "style": 0.0,
+        "use_speaker_boost": True,
+    }
+    # 캐시된 오디오를 스트리밍할 때의 청크 크기
+    CACHED_CHUNK_BYTES = 16 * 1024
+    
+    def __init__(self, client: Optional[httpx.AsyncClient] = None, cache: Optional[AudioCache] = None):
         self.api_key = settings.ELEVENLABS_API_KEY
         self.james_voice_id = settings.ELEVENLABS_JAMES_VOICE_ID
         self.linda_voice_id = settings.ELEVENLABS_LINDA_VOICE_ID
         self.base_url = "https://api.elevenlabs.io/v1"
+        # 연속 실패 시 ElevenLabs 호출을 잠시 차단 (CircuitOpenError는 RuntimeError)
+        self.breaker = get_circuit_breaker("elevenlabs")
+        # 주입된 클라이언트가 없으면 앱 공유 연결 풀 사용
+        self._client = client
+        # 합성 결과 디스크 캐시 (TTS_CACHE_MAX_BYTES=0이면 None)
+        self.cache = cache if cache is not None else get_audio_cache()
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """ElevenLabs 호출용 HTTP 클라이언트 (keep-alive 연결 재사용)"""
+        return self._client or get_http_client("elevenlabs")
     
     def _get_voice_id(self, debater: DebaterRole) -> Optional[str]:
         """토론자에 해당하는 Voice ID 반환"""
@@ -28,13 +135,32 @@ class VoiceService:
             return self.linda_voice_id
         return None
     
+    @property
+    def configured(self) -> bool:
+        """API 키와 두 토론자의 Voice ID가 모두 설정되었는지 여부"""
+        return bool(self.api_key and self.james_voice_id and self.linda_voice_id)
+    
+    def _cache_key(self, text: str, voice_id: str) -> str:
+        return audio_cache_key(voice_id, self.MODEL_ID, self.VOICE_SETTINGS, text)
+    
+    def is_cached(self, text: str, voice: DebaterRole, pipeline: bool = False) -> bool:
+        """같은 문장/음성의 합성 결과가 캐시에 있는지 여부 (pipeline이면 모든 청크)"""
+        voice_id = self._get_voice_id(voice)
+        if self.cache is None or not voice_id:
+            return False
+        texts = split_tts_chunks(text, settings.TTS_PIPELINE_CHUNK_CHARS) if pipeline else [text]
+        return all(self._cache_key(chunk, voice_id) in self.cache for chunk in texts)
+    
+    def cache_stats(self) -> dict:
+        return self.cache.stats() if self.cache is not None else {}
+    
     async def synthesize(
         self,
         text: str,
         voice: DebaterRole,
     ) -> bytes:
         """
-        텍스트를 음성으로 변환
+        텍스트를 음성으로 변환 (같은 문장/음성은 디스크 캐시에서 반환)
         
         Args:
             text: 변환할 텍스트
@@ -48,6 +174,12 @@ class VoiceService:
         if not voice_id or not self.api_key:
             raise ValueError("음성 서비스가 설정되지 않았습니다.")
         
+        cache_key = self._cache_key(text, voice_id)
+        if self.cache is not None:
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         url = f"{self.base_url}/text-to-speech/{voice_id}"
         
         headers = {
@@ -58,24 +190,22 @@ class VoiceService:
         
         data = {
             "text": text,
-            "model_id": "eleven_multilingual_v2",
-            "voice_settings": {
-                "stability": 0.5,
-                "similarity_boost": 0.75,
-                "style": 0.0,
-                "use_speaker_boost": True,
-            }
+            "model_id": self.MODEL_ID,
+            "voice_settings": self.VOICE_SETTINGS,
         }
         
-        async with httpx.AsyncClient() as client:
+        # 4xx(ValueError)는 요청 문제이므로 회로 실패로 세지 않음
+        async with self.breaker.guard(ignore=(ValueError,)):
             try:
-                response = await client.post(
+                response = await self.client.post(
                     url,
                     headers=headers,
                     json=data,
                     timeout=30.0,
                 )
                 response.raise_for_status()
+                if self.cache is not None:
+                    await self.cache.put(cache_key, response.content)
                 return response.content
             except httpx.HTTPStatusError as exc:
                 detail = _format_elevenlabs_error(exc.response)
@@ -99,6 +229,9 @@ class VoiceService:
         """
         텍스트를 음성으로 변환하여 스트리밍
         
+        캐시에 있으면 캐시된 오디오를 청크로 나눠 내보내고, 없으면 ElevenLabs 스트림을
+        그대로 전달하면서 끝까지 받은 오디오를 캐시에 저장합니다.
+        
         Args:
             text: 변환할 텍스트
             voice: 사용할 음성
@@ -111,6 +244,14 @@ class VoiceService:
         if not voice_id or not self.api_key:
             raise ValueError("음성 서비스가 설정되지 않았습니다.")
         
+        cache_key = self._cache_key(text, voice_id)
+        if self.cache is not None:
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                for start in range(0, len(cached), self.CACHED_CHUNK_BYTES):
+                    yield cached[start:start + self.CACHED_CHUNK_BYTES]
+                return
+        
         url = f"{self.base_url}/text-to-speech/{voice_id}/stream"
         
         headers = {
@@ -121,15 +262,14 @@ class VoiceService:
         
         data = {
             "text": text,
-            "model_id": "eleven_multilingual_v2",
-            "voice_settings": {
-                "stability": 0.5,
-                "similarity_boost": 0.75,
-            }
+            "model_id": self.MODEL_ID,
+            "voice_settings": self.VOICE_SETTINGS,
         }
         
-        async with httpx.AsyncClient() as client:
-            async with client.stream(
+        # 스트리밍하면서 받은 청크를 모아 끝까지 받으면 캐시에 저장 (중간에 끊기면 저장하지 않음)
+        received: List[bytes] = []
+        async with self.breaker.guard(ignore=(ValueError,)):
+            async with self.client.stream(
                 "POST",
                 url,
                 headers=headers,
@@ -150,7 +290,66 @@ class VoiceService:
                         raise ValueError(f"ElevenLabs 오류 ({status_code}): {detail}")
                     raise RuntimeError(f"ElevenLabs 서버 오류 ({status_code}): {detail}")
                 async for chunk in response.aiter_bytes():
+                    received.append(chunk)
                     yield chunk
+        
+        if self.cache is not None:
+            await self.cache.put(cache_key, b"".join(received))
+    
+    async def synthesize_pipeline(
+        self,
+        text: str,
+        voice: DebaterRole,
+        window: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        문장 단위로 나눠 동시에 합성하고 순서대로 스트리밍
+        
+        첫 청크는 ElevenLabs 스트림을 그대로 전달하고, 그동안 다음 청크들을
+        최대 window개까지 미리 합성합니다. 각 청크는 독립적으로 캐시되며
+        MP3 프레임을 이어 붙인 하나의 오디오 스트림으로 내보냅니다.
+        
+        Args:
+            text: 변환할 텍스트
+            voice: 사용할 음성
+            window: 동시에 합성할 최대 청크 수 (None이면 TTS_PIPELINE_WINDOW)
+            
+        Yields:
+            오디오 청크
+        """
+        chunks = split_tts_chunks(text, settings.TTS_PIPELINE_CHUNK_CHARS)
+        if len(chunks) <= 1:
+            async for audio in self.synthesize_stream(text, voice):
+                yield audio
+            return
+        
+        window = max(1, window or settings.TTS_PIPELINE_WINDOW)
+        remaining = iter(chunks[1:])
+        pending: Deque[asyncio.Task] = deque()
+        
+        def schedule(limit: int):
+            while len(pending) < limit:
+                chunk = next(remaining, None)
+                if chunk is None:
+                    return
+                pending.append(asyncio.create_task(self.synthesize(chunk, voice)))
+        
+        try:
+            # 첫 청크를 스트리밍하는 동안 다음 청크 window-1개를 미리 합성
+            schedule(window - 1)
+            async for audio in self.synthesize_stream(chunks[0], voice):
+                yield audio
+            schedule(window)
+            while pending:
+                audio = await pending.popleft()
+                schedule(window)
+                yield audio
+        finally:
+            # 중간에 실패하거나 클라이언트가 떠나면 남은 합성 취소
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
     
     async def get_available_voices(self) -> list:
         """사용 가능한 음성 목록 조회"""
@@ -160,11 +359,14 @@ class VoiceService:
         url = f"{self.base_url}/voices"
         headers = {"xi-api-key": self.api_key}
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-            return data.get("voices", [])
+        async with self.breaker.guard():
+            response = await self.client.get(url, headers=headers, timeout=10.0)
+            if response.is_server_error:
+                response.raise_for_status()
+        # 4xx(API 키 오류 등)는 요청/설정 문제이므로 회로 실패로 세지 않음
+        response.raise_for_status()
+        data = response.json()
+        return data.get("voices", [])
 
 
 def _format_elevenlabs_error(response: httpx.Response, content: Optional[bytes] = None) -> str:
@@ -116,9 +116,9 @@ export function MainChatUI({ lecture, tokens, onEarnTokens, onBack }: MainChatUI
     fetchSuggestions(type);
   }, [fetchSuggestions]);
 
-  // 추천 새로고침 핸들러
+  // 추천 새로고침 핸들러 (캐시 우회하여 새 추천 생성)
   const handleRefresh = useCallback(() => {
-    fetchSuggestions(currentType || 'question');
+    fetchSuggestions(currentType || 'question', true);
   }, [fetchSuggestions, currentType]);
 
   // 일반 메시지 전송 후 추천 갱신
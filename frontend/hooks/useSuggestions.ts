@@ -16,8 +16,8 @@ interface UseSuggestionsReturn {
   suggestions: Suggestion[]
   isLoading: boolean
   error: string | null
-  /** 추천 가져오기 */
-  fetchSuggestions: (type: 'topic' | 'question' | 'argument') => Promise<void>
+  /** 추천 가져오기 (bypassCache: 캐시된 추천 대신 새로 생성) */
+  fetchSuggestions: (type: 'topic' | 'question' | 'argument', bypassCache?: boolean) => Promise<void>
   /** 특정 추천 제거 (선택 후 페이드아웃용) */
   removeSuggestion: (id: string) => void
   /** 모든 추천 제거 */
@@ -69,7 +69,7 @@ export function useSuggestions({
   }, [])
 
   // 추천 가져오기
-  const fetchSuggestions = useCallback(async (type: 'topic' | 'question' | 'argument') => {
+  const fetchSuggestions = useCallback(async (type: 'topic' | 'question' | 'argument', bypassCache = false) => {
     if (!sessionId) return
 
     setIsLoading(true)
@@ -81,6 +81,7 @@ export function useSuggestions({
         session_id: sessionId,
         suggestion_type: type,
         context: contextRef.current,
+        bypass_cache: bypassCache,
       })
       
       setSuggestions(response.suggestions)
@@ -116,7 +117,8 @@ export function useSuggestions({
     // 새 타이머 설정
     autoRefreshTimerRef.current = setTimeout(() => {
       if (currentType) {
-        fetchSuggestions(currentType)
+        // 같은 추천이 다시 오지 않도록 캐시 우회
+        fetchSuggestions(currentType, true)
       }
     }, autoRefreshInterval)
 
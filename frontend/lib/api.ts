@@ -304,6 +304,8 @@ export interface SuggestionGenerateRequest {
   session_id: string
   suggestion_type: 'topic' | 'question' | 'argument'
   context: SuggestionContext
+  /** true면 서버 캐시를 건너뛰고 새 추천 생성 (새로고침/자동 갱신) */
+  bypass_cache?: boolean
 }
 
 export interface SuggestionGenerateResponse {